@@ -0,0 +1,191 @@
+"""
+Measures the hot paths of the engine on fixed-seed fixtures, for checking optimization work against a
+stored baseline: the Board queries called most often while a game is played, Game.collectResources,
+RandComp.getRoadValue and the throughput of full games. The other benchmarks in this package compare
+the approaches behind single optimizations; this suite is the one to run before and after a change.
+Each result is the best average time per call of several repeats, in microseconds, with the caches
+shared by every board cleared before each repeat. Every run is appended to a history file as one line
+of JSON, and the run fails (with exit status 1) if any result is slower than the baseline by more than
+the threshold, or if there is no baseline to compare against. Baselines depend on the machine, so save
+one on the machine the suite is run on before making a change.
+Save the results as the baseline with: python -m benchmarks.BenchmarkSuite --save-baseline
+Then compare against it with: python -m benchmarks.BenchmarkSuite
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+from catan import Game
+from catan import NullSink
+from catan.CandidateScorer import CandidateScorer
+from catan.LongestRoad import LongestRoad
+from argparse import ArgumentParser
+from datetime import datetime
+from time import perf_counter
+import json
+import os
+import platform
+import sys
+
+benchmarkDirectory = os.path.dirname(os.path.abspath(__file__))
+
+""" Return a game played with a fixed seed until the middle of the game, for the board and players of a fixture """
+def makeMidGame():
+    game = Game.Game(seed=0, maxTurns=15, eventSink=NullSink.NullSink())
+    game.play()
+    return game
+
+""" Return a function that calls a Board query with every intersection of a mid-game board """
+def makeIntersectionQuery(queryName, numRounds):
+    def makeCalls():
+        board = makeMidGame().board
+        query = getattr(board, queryName)
+        points = board.hexIntersections
+
+        def calls():
+            for _ in range(numRounds):
+                for point in points:
+                    query(point)
+        return calls, numRounds * len(points)
+    return makeCalls
+
+""" Return a function that calls a Board query with every player number of a mid-game board """
+def makePlayerQuery(queryName, numRounds):
+    def makeCalls():
+        game = makeMidGame()
+        query = getattr(game.board, queryName)
+        playerNums = range(1, game.numPlayers + 1)
+
+        def calls():
+            for _ in range(numRounds):
+                for playerNum in playerNums:
+                    query(playerNum)
+        return calls, numRounds * game.numPlayers
+    return makeCalls
+
+""" Return a function that rolls the dice and pays out resources (or moves the robber) on a mid-game board """
+def makeCollectResources(numCalls):
+    def makeCalls():
+        game = makeMidGame()
+
+        def calls():
+            for _ in range(numCalls):
+                game.collectResources()
+        return calls, numCalls
+    return makeCalls
+
+""" Return a function that finds the value of every possible road of the first player of a mid-game board """
+def makeRoadValue(numRounds):
+    def makeCalls():
+        player = makeMidGame().players[0]
+        possibleRoads = player.currentBoard.getPossibleRoadLocations(player.playerNum)
+
+        def calls():
+            for _ in range(numRounds):
+                for possibleRoad in possibleRoads:
+                    player.getRoadValue(possibleRoad)
+        return calls, numRounds * len(possibleRoads)
+    return makeCalls
+
+""" Return a function that plays whole games with consecutive seeds, to the end or to the turn limit """
+def makeFullGames(numGames):
+    def makeCalls():
+        def calls():
+            for seed in range(numGames):
+                Game.Game(seed=seed, maxTurns=1000, eventSink=NullSink.NullSink()).play()
+        return calls, numGames
+    return makeCalls
+
+""" The benchmarks of the suite, in the order they are run, and the function that sets up each one """
+benchmarks = {"Board.legalPlacement": makeIntersectionQuery("legalPlacement", 4000),
+              "Board.getAdjacentIntersections": makeIntersectionQuery("getAdjacentIntersections", 4000),
+              "Board.getAdjacentHexes": makeIntersectionQuery("getAdjacentHexes", 4000),
+              "Board.getPossibleSettlementLocations": makePlayerQuery("getPossibleSettlementLocations", 20000),
+              "Board.getPossibleRoadLocations": makePlayerQuery("getPossibleRoadLocations", 20000),
+              "Game.collectResources": makeCollectResources(5000),
+              "RandComp.getRoadValue": makeRoadValue(2000),
+              "Game.play": makeFullGames(40)}
+
+""" Clear the caches shared by every board, so that each repeat starts with the same cold caches """
+def clearSharedCaches():
+    LongestRoad.lengthCache.clear()
+    CandidateScorer.sharedScorer = None
+
+"""
+Run a benchmark numRepeats times, each time with cleared caches and a new fixture, and return the best
+average time per call, in microseconds
+"""
+def runBenchmark(makeCalls, numRepeats):
+    bestTime = -1
+    for _ in range(numRepeats):
+        clearSharedCaches()
+        calls, numCalls = makeCalls()
+        startTime = perf_counter()
+        calls()
+        callTime = (perf_counter() - startTime) / numCalls * 1000000
+        if bestTime == -1 or callTime < bestTime:
+            bestTime = callTime
+    return bestTime
+
+""" Return the results saved in a baseline file, or None if there is no baseline file """
+def loadBaseline(baselinePath):
+    if not os.path.exists(baselinePath):
+        return None
+    with open(baselinePath) as baselineFile:
+        return json.load(baselineFile)["results"]
+
+""" Return the name of each result slower than its baseline by more than threshold (a fraction of the baseline) """
+def findRegressions(results, baseline, threshold):
+    return [name for name in results if name in baseline and results[name] > baseline[name] * (1 + threshold)]
+
+def main():
+    parser = ArgumentParser(description="Measure the hot paths of the engine against a stored baseline")
+    parser.add_argument("--repeats", type=int, default=5, help="number of times to run each benchmark")
+    parser.add_argument("--only", help="comma-separated names of the benchmarks to run (all if not specified)")
+    parser.add_argument("--history", default=os.path.join(benchmarkDirectory, "history.jsonl"),
+                        help="file that the results of every run are appended to")
+    parser.add_argument("--baseline", default=os.path.join(benchmarkDirectory, "baseline.json"),
+                        help="file with the results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="fraction by which a result may be slower than the baseline before the run fails")
+    parser.add_argument("--save-baseline", action="store_true", help="save the results as the new baseline")
+    parser.add_argument("--label", default="", help="description of the run, saved in the history file")
+    args = parser.parse_args()
+
+    names = list(benchmarks) if args.only is None else args.only.split(",")
+    for name in names:
+        if name not in benchmarks:
+            parser.error("unknown benchmark " + name + " (choose from " + ", ".join(benchmarks) + ")")
+    baseline = loadBaseline(args.baseline)
+    results = {}
+    print("%-38s %14s %14s %9s" % ("Benchmark", "Microseconds", "Baseline", "Change"))
+    for name in names:
+        results[name] = runBenchmark(benchmarks[name], args.repeats)
+        if baseline is not None and name in baseline:
+            print("%-38s %14.3f %14.3f %+8.1f%%" % (name, results[name], baseline[name],
+                                                   (results[name] / baseline[name] - 1) * 100))
+        else:
+            print("%-38s %14.3f %14s %9s" % (name, results[name], "-", "-"))
+    if "Game.play" in results:
+        print("Full games per second: %.1f" % (1000000 / results["Game.play"]))
+
+    record = {"date": datetime.now().isoformat(timespec="seconds"), "label": args.label,
+              "python": platform.python_version(), "machine": platform.machine(), "repeats": args.repeats,
+              "results": results}
+    with open(args.history, "a") as historyFile:
+        historyFile.write(json.dumps(record) + "\n")
+    if args.save_baseline:
+        with open(args.baseline, "w") as baselineFile:
+            json.dump(record, baselineFile, indent=2)
+        print("Saved the results as the baseline in", args.baseline)
+    elif baseline is None:
+        print("No baseline to compare against in", args.baseline + ", save one with --save-baseline")
+        sys.exit(1)
+    else:
+        regressions = findRegressions(results, baseline, args.threshold)
+        if len(regressions) > 0:
+            print("Slower than the baseline by more than %.0f%%:" % (args.threshold * 100), ", ".join(regressions))
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
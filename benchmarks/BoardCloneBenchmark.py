@@ -0,0 +1,51 @@
+"""
+Measures the cost of copying the board for lookahead: taking and restoring a snapshot, cloning the
+board, and cloning the board and then placing a road (which copies the state the road changes),
+compared with copy.deepcopy and with placing and taking back a road in place with an undo token.
+The board is taken from the middle of a game, after 15 turns.
+Run from the root of the project with: python -m benchmarks.BoardCloneBenchmark
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+from catan import Game
+from catan import NullSink
+from random import Random
+from time import perf_counter
+import copy
+
+""" Return the average time taken by a function, in microseconds """
+def timeCall(function, numCalls):
+    startTime = perf_counter()
+    for _ in range(numCalls):
+        function()
+    return (perf_counter() - startTime) / numCalls * 1000000
+
+def main():
+    numCalls = 20000
+    game = Game.Game(seed=0, maxTurns=15, eventSink=NullSink.NullSink())
+    game.play()
+    board = game.board
+    snapshot = board.snapshot()
+    diceRandom = Random(0)
+
+    """ Clone the board and place a road for player 1 on the first edge it could build on """
+    roadLocation = board.getPossibleRoadLocations(1)[0]
+    def cloneAndBuild():
+        newBoard = board.clone(diceRandomGenerator=diceRandom)
+        newBoard.addRoad(roadLocation.p1, roadLocation.p2, "red", 1, True)
+
+    def applyAndUndo():
+        board.undo(board.applyRoad(roadLocation.p1, roadLocation.p2, "red", 1))
+
+    print("Average time per call, in microseconds")
+    print("snapshot():             %.2f" % timeCall(board.snapshot, numCalls))
+    print("restore(snapshot):      %.2f" % timeCall(lambda: board.restore(snapshot), numCalls))
+    print("clone():                %.2f" % timeCall(lambda: board.clone(diceRandomGenerator=diceRandom), numCalls))
+    print("clone() and addRoad():  %.2f" % timeCall(cloneAndBuild, numCalls))
+    print("copy.deepcopy():        %.2f" % timeCall(lambda: copy.deepcopy(board), numCalls // 100))
+    print("applyRoad() and undo(): %.2f" % timeCall(applyAndUndo, numCalls))
+
+if __name__ == "__main__":
+    main()
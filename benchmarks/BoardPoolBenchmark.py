@@ -0,0 +1,64 @@
+"""
+Measures the number of balanced boards the BoardGenerator makes per minute with its default constraints,
+and the time taken to set up the layout of a board by shuffling it (as Board.initTiles and initPorts do)
+and by drawing it from a memory-mapped BoardPool file.
+Run from the root of the project with: python -m benchmarks.BoardPoolBenchmark
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+from catan import Board
+from catan import NullSink
+from catan.BoardGenerator import BoardGenerator
+from catan.BoardPool import BoardPool
+from random import Random
+from time import perf_counter
+import os
+import tempfile
+
+""" Return the average time taken by a function, in microseconds """
+def timeCall(function, numCalls):
+    startTime = perf_counter()
+    for _ in range(numCalls):
+        function()
+    return (perf_counter() - startTime) / numCalls * 1000000
+
+""" Set up the layout of a new board by shuffling the tiles and ports """
+def shuffleLayout(randomGenerator):
+    board = Board.Board(4, randomGenerator, eventSink=NullSink.NullSink())
+    board.initTiles()
+    board.initPorts()
+
+""" Set up the layout of a new board by drawing it from a pool """
+def drawLayout(pool, randomGenerator):
+    board = Board.Board(4, randomGenerator, eventSink=NullSink.NullSink())
+    board.setLayout(pool.drawLayout(randomGenerator))
+
+def main():
+    numBoards = 500000
+    numCalls = 5000
+
+    generator = BoardGenerator(seed=0)
+    startTime = perf_counter()
+    records = generator.generate(numBoards)
+    elapsed = perf_counter() - startTime
+    print("Balanced boards generated per minute: %.0f (%.1f%% of shuffled boards accepted)"
+          % (numBoards / elapsed * 60, generator.getAcceptanceRate() * 100))
+
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "boards.catanpool")
+    BoardPool.save(path, records.tobytes())
+    pool = BoardPool(path)
+    print("Pool of %d boards: %d bytes" % (len(pool), os.path.getsize(path)))
+
+    print("Average time to set up the layout of a board, in microseconds")
+    randomGenerator = Random(0)
+    print("Shuffled:            %.1f" % timeCall(lambda: shuffleLayout(randomGenerator), numCalls))
+    print("Drawn from the pool: %.1f" % timeCall(lambda: drawLayout(pool, randomGenerator), numCalls))
+    pool.close()
+    os.remove(path)
+    os.rmdir(directory)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""
+Measures the average latency of the Board queries that are called most often while a game
+is played: intersection and hexagon adjacency, port lookups, and settlement legality.
+Run from the root of the project with: python -m benchmarks.BoardQueryBenchmark
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+from catan import Board
+from random import Random
+from timeit import timeit
+
+""" Time a query against every intersection on the board and return the average microseconds per call """
+def timeQuery(query, points, repeats):
+    seconds = timeit(lambda: [query(point) for point in points], number=repeats)
+    return seconds / (repeats * len(points)) * 1000000
+
+def main():
+    board = Board.Board(4, Random(0))
+    board.initTiles()
+    board.initPorts()
+    points = board.hexIntersections
+    repeats = 200
+
+    print("Average latency per call, in microseconds")
+    print("getAdjacentIntersections: %.3f" % timeQuery(board.getAdjacentIntersections, points, repeats))
+    print("getAdjacentHexes:         %.3f" % timeQuery(board.getAdjacentHexes, points, repeats))
+    print("getPortType:              %.3f" % timeQuery(board.getPortType, points, repeats))
+    print("legalPlacement:           %.3f" % timeQuery(board.legalPlacement, points, repeats))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Measures the time RandComp takes to score candidate locations one at a time and with NumPy arrays:
+every intersection on the board (as for an initial settlement), and every empty edge (as for a road).
+The board is taken from the middle of a game, after 15 turns, and the values are not cached.
+Run from the root of the project with: python -m benchmarks.CandidateScoringBenchmark
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+from catan import Game
+from catan import NullSink
+from catan.CandidateScorer import CandidateScorer
+from time import perf_counter
+
+""" Return the average time taken by a function, in microseconds """
+def timeCall(function, numCalls):
+    startTime = perf_counter()
+    for _ in range(numCalls):
+        function()
+    return (perf_counter() - startTime) / numCalls * 1000000
+
+def main():
+    numCalls = 500
+    game = Game.Game(seed=0, maxTurns=15, eventSink=NullSink.NullSink())
+    game.play()
+    board = game.board
+    player = game.players[0]
+    board.queryCache.maxSize = 0
+
+    scorer = CandidateScorer.getShared(board)
+    hexValues = scorer.getHexValues(player.resourcePoints, player.tradeRates)
+    roads = [board.topology.edgePoints[edge] for edge in range(len(board.edgeOwners)) if board.edgeOwners[edge] == 0]
+    edges = [board.topology.findEdge(road.p1, road.p2) for road in roads]
+
+    print("Average time to score every candidate, in microseconds")
+    print("%d intersections, one at a time: %.1f" % (len(board.hexIntersections), timeCall(
+        lambda: [player.getHexValue(location) for location in board.hexIntersections], numCalls)))
+    print("%d intersections, with arrays:   %.1f" % (len(board.hexIntersections), timeCall(
+        lambda: scorer.getHexValues(player.resourcePoints, player.tradeRates), numCalls)))
+    print("%d edges, one at a time:         %.1f" % (len(roads), timeCall(
+        lambda: [player.getRoadValue(road) for road in roads], numCalls)))
+    print("%d edges, with arrays:           %.1f" % (len(roads), timeCall(
+        lambda: scorer.getRoadValues(hexValues, edges, board.bitBoard.roadVertices[0], board.blockedVertices),
+        numCalls)))
+
+if __name__ == "__main__":
+    main()
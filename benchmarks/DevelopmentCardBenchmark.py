@@ -0,0 +1,43 @@
+"""
+Measures the cost of development cards: the time taken to draw every card of a deck, and the number of
+games played per second, and the average number of turns per game, with and without development cards.
+Run from the root of the project with: python -m benchmarks.DevelopmentCardBenchmark
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+from catan import Game
+from catan import NullSink
+from catan.DevelopmentDeck import DevelopmentDeck
+from random import Random
+from time import perf_counter
+
+def main():
+    numDecks = 20000
+    numGames = 200
+
+    randomGenerator = Random(0)
+    numDraws = 0
+    startTime = perf_counter()
+    for _ in range(numDecks):
+        deck = DevelopmentDeck(randomGenerator)
+        while deck.draw() != -1:
+            numDraws += 1
+    print("Average time to draw a development card: %.2f microseconds" %
+          ((perf_counter() - startTime) / numDraws * 1000000))
+
+    print("%-24s %14s %14s" % ("Development cards", "Games/second", "Turns/game"))
+    for useDevelopmentCards in (False, True):
+        numTurns = 0
+        startTime = perf_counter()
+        for seed in range(numGames):
+            game = Game.Game(seed=seed, eventSink=NullSink.NullSink(), useDevelopmentCards=useDevelopmentCards)
+            game.play()
+            numTurns += game.board.turnNumber
+        elapsed = perf_counter() - startTime
+        print("%-24s %14.1f %14.1f" % ("on" if useDevelopmentCards else "off", numGames / elapsed,
+                                       numTurns / numGames))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Measures the memory used by complete games: the peak memory allocated while a game is played,
+and the memory still held by the finished Game object (board, pieces and players).
+Run from the root of the project with: python -m benchmarks.GameMemoryBenchmark
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+from catan import Game
+from catan import NullSink
+from catan import Topology
+import tracemalloc
+
+def main():
+    numGames = 20
+    totalPeak = 0
+    totalRetained = 0
+
+    """ Create the shared board layout first, so it is not counted as part of the first game """
+    Topology.Topology.getShared()
+
+    for i in range(numGames):
+        tracemalloc.start()
+        game = Game.Game(seed=i, eventSink=NullSink.NullSink())
+        game.play()
+        totalRetained += tracemalloc.get_traced_memory()[0]
+        totalPeak += tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        del game
+
+    print("Average memory per game over", numGames, "games, in KB")
+    print("Peak while playing:     %.1f" % (totalPeak / numGames / 1024))
+    print("Retained by final game: %.1f" % (totalRetained / numGames / 1024))
+
+if __name__ == "__main__":
+    main()
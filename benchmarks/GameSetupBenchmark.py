@@ -0,0 +1,31 @@
+"""
+Measures the time taken to set up a new game (the board, its layout and the players) and the memory
+allocated while setting it up. Players share the layout of the game's board, so no board is built for
+any player.
+Run from the root of the project with: python -m benchmarks.GameSetupBenchmark
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+from catan import Game
+from catan import NullSink
+from time import perf_counter
+import tracemalloc
+
+def main():
+    numGames = 2000
+    startTime = perf_counter()
+    for i in range(numGames):
+        Game.Game(seed=i, eventSink=NullSink.NullSink())
+    print("Average time to set up a game, in microseconds: %.1f" % ((perf_counter() - startTime) / numGames * 1000000))
+
+    tracemalloc.start()
+    game = Game.Game(seed=0, eventSink=NullSink.NullSink())
+    print("Memory allocated while setting up a game, in kilobytes: %.1f" % (tracemalloc.get_traced_memory()[0] / 1024))
+    tracemalloc.stop()
+    print("Players sharing the layout of the board:",
+          sum([1 for player in game.players if player.currentBoard.layout is game.board.layout]))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Measures the time taken to compute the statistics of many board layouts: with a Python loop over the
+Board of each layout (the pips next to each intersection, the pips of each resource, and the best opening
+found by trying every pair of intersections), and with the LayoutAnalytics class over an array of layouts.
+Run from the root of the project with: python -m benchmarks.LayoutAnalyticsBenchmark
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+from catan import Board
+from catan import NullSink
+from catan.BoardPool import BoardPool
+from catan.LayoutAnalytics import LayoutAnalytics
+from catan.Player import Player
+from itertools import combinations
+from random import Random
+from time import perf_counter
+import numpy
+
+""" Compute the statistics of a layout one intersection and one tile at a time """
+def analyzeBoard(board):
+    vertexPips = [sum([tile.value for tile in tiles]) for tiles in board.vertexTiles]
+    resourcePips = [0] * 5
+    for tile in board.tiles:
+        if tile.hexType != "desert":
+            resourcePips[Player.getResourceIndex(tile.hexType)] += tile.value
+    bestOpening = 0
+    for first, second in combinations(range(len(vertexPips)), 2):
+        if second not in board.topology.vertexNeighbors[first]:
+            bestOpening = max(bestOpening, vertexPips[first] + vertexPips[second])
+    return vertexPips, resourcePips, bestOpening
+
+def main():
+    numLayouts = 2000
+    numPoolLayouts = 100000
+    boards = []
+    for i in range(numLayouts):
+        board = Board.Board(1, Random(i), eventSink=NullSink.NullSink())
+        board.initTiles()
+        board.initPorts()
+        boards.append(board)
+    records = numpy.frombuffer(b"".join([BoardPool.encodeLayout(board.layout.hexTypes, board.layout.numbers,
+                                                                board.layout.portTypes) for board in boards]),
+                               dtype=numpy.uint8).reshape(numLayouts, BoardPool.recordSize)
+
+    startTime = perf_counter()
+    for board in boards:
+        analyzeBoard(board)
+    loopTime = perf_counter() - startTime
+    startTime = perf_counter()
+    LayoutAnalytics(records)
+    arrayTime = perf_counter() - startTime
+    print("Average time to analyze a layout, in microseconds")
+    print("Python loop over each Board: %.1f" % (loopTime / numLayouts * 1000000))
+    print("LayoutAnalytics (%d):     %.1f" % (numLayouts, arrayTime / numLayouts * 1000000))
+
+    """ Repeat the layouts to measure a batch of the size of a large board pool """
+    startTime = perf_counter()
+    LayoutAnalytics(records[[i % numLayouts for i in range(numPoolLayouts)]])
+    print("LayoutAnalytics (%d):   %.1f" % (numPoolLayouts, (perf_counter() - startTime) / numPoolLayouts * 1000000))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Measures the time taken to keep longest road up to date while a player builds adversarial networks of
+15 roads (the most a player can build): the roads around 3 hexagons that meet at one intersection, which
+have the most routes to try; the same roads split by opposing settlements; and a single winding road.
+Each road is placed with Board.addRoad, which only finds the longest road of the component the road joins,
+with the cache of component lengths cleared before each network and with the lengths already cached.
+For comparison, the longest road is also found by following every route of the player's whole network
+after each road is placed, and the roads are placed without keeping longest road up to date.
+Run from the root of the project with: python -m benchmarks.LongestRoadBenchmark
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+from catan import Board
+from catan import NullSink
+from catan.LongestRoad import LongestRoad
+from random import Random
+from time import perf_counter
+
+""" Return the edges around the specified hexagons, in the order they are reached from the first edge """
+def getHexagonEdges(topology, hexIds):
+    vertices = set()
+    for hexId in hexIds:
+        vertices.update(topology.hexVertices[hexId])
+    edges = [edge for edge in range(len(topology.edges))
+             if topology.edges[edge][0] in vertices and topology.edges[edge][1] in vertices]
+    return orderEdges(topology, edges)
+
+""" Put a list of connected edges in an order where every edge touches an earlier edge """
+def orderEdges(topology, edges):
+    ordered = [edges[0]]
+    remaining = set(edges[1:])
+    while remaining:
+        touched = {vertex for edge in ordered for vertex in topology.edges[edge]}
+        edge = min(edge for edge in remaining if not touched.isdisjoint(topology.edges[edge]))
+        ordered.append(edge)
+        remaining.discard(edge)
+    return ordered
+
+""" Return the edges of a road of 15 edges that never visits an intersection twice """
+def getWindingEdges(topology, randomGenerator):
+    while True:
+        vertex = randomGenerator.randrange(len(topology.vertices))
+        visited = {vertex}
+        edges = []
+        while len(edges) < 15:
+            choices = [edge for edge in topology.vertexEdges[vertex]
+                       if topology.edges[edge][0] not in visited or topology.edges[edge][1] not in visited]
+            if len(choices) == 0:
+                break
+            edge = randomGenerator.choice(choices)
+            vertex = topology.edges[edge][1] if topology.edges[edge][0] == vertex else topology.edges[edge][0]
+            visited.add(vertex)
+            edges.append(edge)
+        if len(edges) == 15:
+            return edges
+
+""" Find the longest road of a player by following every route of the player's roads from every intersection """
+def findLongestRoadNaive(board, playerNum):
+    topology = board.topology
+    roads = {edge for edge in range(len(topology.edges)) if board.edgeOwners[edge] == playerNum}
+
+    def extend(vertex, used):
+        longest = 0
+        for edge in topology.vertexEdges[vertex]:
+            if edge in roads and edge not in used:
+                nextVertex = topology.edges[edge][1] if topology.edges[edge][0] == vertex else topology.edges[edge][0]
+                if board.vertexOwners[nextVertex] not in (0, playerNum):
+                    longest = max(longest, 1)
+                else:
+                    longest = max(longest, 1 + extend(nextVertex, used | {edge}))
+        return longest
+
+    return max([extend(vertex, frozenset()) for vertex in range(len(topology.vertices))])
+
+""" Set up an empty board, with settlements of an opposing player at the specified intersections """
+def makeBoard(blockedVertices):
+    board = Board.Board(2, Random(0), eventSink=NullSink.NullSink())
+    board.initTiles()
+    board.initPorts()
+    for vertex in blockedVertices:
+        board.addSettlement(board.topology.vertices[vertex], "blue", 2, True)
+    return board
+
+"""
+Return the average time taken to place each road of a network on a new board, in microseconds, and the
+length of the longest road of the network. If track is False, the board does not keep longest road up to
+date, to show the time taken by the rest of Board.addRoad.
+"""
+def timeNetwork(edges, blockedVertices, naive, clearCache, numRepeats, track=True):
+    elapsed = 0
+    for _ in range(numRepeats):
+        board = makeBoard(blockedVertices)
+        if not track:
+            board.joinRoadComponents = lambda playerNum, edge, initialPlacement: None
+        if clearCache:
+            LongestRoad.lengthCache.clear()
+        startTime = perf_counter()
+        for edge in edges:
+            location = board.topology.edgePoints[edge]
+            board.addRoad(location.p1, location.p2, "red", 1, True)
+            if naive:
+                findLongestRoadNaive(board, 1)
+        elapsed += perf_counter() - startTime
+    return elapsed / (numRepeats * len(edges)) * 1000000, board.roadLengths[0]
+
+def main():
+    numRepeats = 20
+    topology = Board.Board(2, Random(0), eventSink=NullSink.NullSink()).topology
+
+    """ Hexagons 18 (the center), 12 and 13 all meet at one intersection, and have exactly 15 edges """
+    hexagonEdges = getHexagonEdges(topology, [18, 12, 13])
+
+    """ Block 2 intersections (that follow the distance rule) where 3 of the roads meet """
+    blockedVertices = []
+    for vertex in range(len(topology.vertices)):
+        if (len([edge for edge in topology.vertexEdges[vertex] if edge in hexagonEdges]) == 3
+                and len(blockedVertices) < 2
+                and all(vertex not in topology.vertexNeighbors[blocked] for blocked in blockedVertices)):
+            blockedVertices.append(vertex)
+    networks = [("3 hexagons", hexagonEdges, []),
+                ("3 hexagons, 2 settlements", hexagonEdges, blockedVertices),
+                ("winding road", getWindingEdges(topology, Random(0)), [])]
+
+    print("Average time to place each road of a network of 15 roads, in microseconds")
+    print("%-26s %8s %12s %12s %12s %12s" % ("Network", "Longest", "Every route", "Cold cache", "Warm cache",
+                                              "No tracking"))
+    for name, edges, blocked in networks:
+        naiveTime, longest = timeNetwork(edges, blocked, True, True, 1)
+        coldTime = timeNetwork(edges, blocked, False, True, numRepeats)[0]
+        warmTime = timeNetwork(edges, blocked, False, False, numRepeats)[0]
+        untrackedTime = timeNetwork(edges, blocked, False, False, numRepeats, False)[0]
+        print("%-26s %8d %12.1f %12.1f %12.1f %12.1f" % (name, longest, naiveTime, coldTime, warmTime, untrackedTime))
+
+if __name__ == "__main__":
+    main()
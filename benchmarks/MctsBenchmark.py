@@ -0,0 +1,51 @@
+"""
+Measures the speed of the MctsComp player's search, in iterations (simulated games) per second, with
+each rollout policy, searching the builds of player 1 on a board taken from the middle of a game (seen
+through the read-only view that games give their players).
+Also plays a few games with an MctsComp player in the first seat, and reports the time per game and
+the number of games the MctsComp player won.
+Run from the root of the project with: python -m benchmarks.MctsBenchmark
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+from catan import Game
+from catan import MctsComp
+from catan import NullSink
+from catan import RandComp
+from catan.Simulation import Simulation
+from random import Random
+from time import perf_counter
+
+def main():
+    numSearches = 20
+    numGames = 8
+
+    game = Game.Game(seed=0, maxTurns=15, eventSink=NullSink.NullSink())
+    game.play()
+
+    print("Iterations per second, searching the builds of player 1")
+    for rolloutPolicy in ("greedy", "random"):
+        player = MctsComp.MctsComp(1, "red", "MctsComp", 4, Random(0), NullSink.NullSink(),
+                                   rolloutPolicy=rolloutPolicy)
+        player.currentBoard = game.boardView
+        player.resources = [4, 4, 4, 4, 4]
+        actions = Simulation.listBuildActions(game.boardView, 1, player.resources, player.tradeRates)
+        for _ in range(numSearches):
+            player.search("build", [("end",)] + actions)
+        print(rolloutPolicy + ": %.0f" % player.getIterationsPerSecond())
+
+    numWins = 0
+    startTime = perf_counter()
+    for i in range(numGames):
+        game = Game.Game([MctsComp.MctsComp] + [RandComp.RandComp] * 3, seed=i, maxTurns=1000,
+                         eventSink=NullSink.NullSink())
+        game.play()
+        if game.board.winner == 1:
+            numWins += 1
+    print("Average time per game with 1 MctsComp player, in seconds: %.2f" % ((perf_counter() - startTime) / numGames))
+    print("Games won by the MctsComp player:", numWins, "out of", numGames)
+
+if __name__ == "__main__":
+    main()
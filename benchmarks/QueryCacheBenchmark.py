@@ -0,0 +1,45 @@
+"""
+Measures the board's query cache: the number of hits and misses over many games, and the time taken
+to play the games with the cache and with it turned off (a cache with no room stores nothing). The runs
+with and without the cache take turns, and the fastest run of each is reported, since the first runs
+are slower whichever way they are played.
+Run from the root of the project with: python -m benchmarks.QueryCacheBenchmark
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+from catan import Game
+from catan import NullSink
+from time import perf_counter
+
+""" Play games with consecutive seeds, and return the time taken and the total cache hits and misses """
+def playGames(numGames, cacheSize):
+    hits = 0
+    misses = 0
+    startTime = perf_counter()
+    for i in range(numGames):
+        game = Game.Game(seed=i, maxTurns=1000, eventSink=NullSink.NullSink())
+        game.board.queryCache.maxSize = cacheSize
+        game.play()
+        hits += game.board.queryCache.hits
+        misses += game.board.queryCache.misses
+    return perf_counter() - startTime, hits, misses
+
+def main():
+    numGames = 200
+    numRepeats = 3
+    cacheSize = Game.Game(seed=0, eventSink=NullSink.NullSink()).board.queryCache.maxSize
+    runs = {}
+    for _ in range(numRepeats):
+        for size in (cacheSize, 0):
+            seconds, hits, misses = playGames(numGames, size)
+            if size not in runs or seconds < runs[size][0]:
+                runs[size] = (seconds, hits, misses)
+    for label, size in (("Cache on: ", cacheSize), ("Cache off:", 0)):
+        seconds, hits, misses = runs[size]
+        print(label, "%.2f seconds for" % seconds, numGames, "games,", hits, "hits,", misses, "misses",
+              "(hit rate %.2f)" % (hits / max(1, hits + misses)))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Measures the start-up time of a worker process, which no longer loads PySimpleGUI, and the time taken
+to draw SVG snapshots of a board: the first snapshot of a layout, which draws the static layer, and
+each later snapshot of the same game, which only draws the pieces.
+Run from the root of the project with: python -m benchmarks.RenderBenchmark
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+from catan import Game
+from catan import GameRecorder
+from catan import NullSink
+from catan import Replayer
+from catan.SvgRenderer import SvgRenderer
+from time import perf_counter
+import subprocess
+import sys
+
+""" Return the average time taken to run a Python statement in a new interpreter, in milliseconds """
+def timeInterpreter(statement, numRuns):
+    startTime = perf_counter()
+    for _ in range(numRuns):
+        if subprocess.run([sys.executable, "-c", statement], capture_output=True).returncode != 0:
+            return -1
+    return (perf_counter() - startTime) / numRuns * 1000
+
+def main():
+    numRuns = 10
+    numGames = 20
+
+    print("Average time to start a new interpreter, in milliseconds")
+    print("Empty interpreter:           %.1f" % timeInterpreter("pass", numRuns))
+    print("Importing catan.BatchRunner: %.1f" % timeInterpreter("import catan.BatchRunner", numRuns))
+    guiTime = timeInterpreter("import PySimpleGUI", numRuns)
+    if guiTime == -1:
+        print("Importing PySimpleGUI:       not installed")
+    else:
+        print("Importing PySimpleGUI:       %.1f" % guiTime)
+
+    """ Reconstruct the board at the start of every turn of some recorded games """
+    boards = []
+    for i in range(numGames):
+        recorder = GameRecorder.GameRecorder(NullSink.NullSink())
+        game = Game.Game(seed=i, maxTurns=1000, eventSink=recorder)
+        game.play()
+        replayer = Replayer.Replayer(recorder.replay)
+        boards.append([replayer.seek(turn).board for turn in range(1, game.board.turnNumber + 1)])
+
+    renderer = SvgRenderer()
+    firstTime = 0.0
+    laterTime = 0.0
+    numLater = 0
+    for gameBoards in boards:
+        startTime = perf_counter()
+        renderer.render(gameBoards[0])
+        firstTime += perf_counter() - startTime
+        startTime = perf_counter()
+        for board in gameBoards[1:]:
+            renderer.render(board)
+        laterTime += perf_counter() - startTime
+        numLater += len(gameBoards) - 1
+
+    print("Average time to draw an SVG snapshot, in microseconds")
+    print("First snapshot of each layout: %.1f" % (firstTime / numGames * 1000000))
+    print("Later snapshots (%d):        %.1f" % (numLater, laterTime / numLater * 1000000))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Measures the size of recorded games and the time taken to jump to a turn of a recorded game,
+which restores the nearest keyframe and applies the actions after it instead of replaying the game.
+Games are limited to 1000 turns, so games that stall without a winner are recorded up to the limit.
+Run from the root of the project with: python -m benchmarks.ReplaySeekBenchmark
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+from catan import Game
+from catan import GameRecorder
+from catan import Replayer
+from time import perf_counter
+
+def main():
+    numGames = 20
+    numSeeks = 20
+    targetTurn = 150
+    replays = []
+
+    for i in range(numGames):
+        recorder = GameRecorder.GameRecorder()
+        Game.Game(seed=i, maxTurns=1000, eventSink=recorder).play()
+        replays.append(recorder.replay)
+
+    """ Jump to the same turn of every game, or the end of the games that finish before it """
+    totalSeek = 0
+    for replay in replays:
+        replayer = Replayer.Replayer(replay)
+        startTime = perf_counter()
+        for _ in range(numSeeks):
+            replayer.seek(targetTurn)
+        totalSeek += (perf_counter() - startTime) / numSeeks
+
+    sizes = [len(replay) for replay in replays]
+    print("Replay size over", numGames, "games, in bytes")
+    print("Average: %.0f" % (sum(sizes) / numGames))
+    print("Largest: %d" % max(sizes))
+    print("Average time to jump to turn", targetTurn, "in milliseconds: %.3f" % (totalSeek / numGames * 1000))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Plays many headless Settlers of Catan games across a pool of worker processes, for the purpose
+of evaluating player types. Each game is identified by its seed, and the result of each game is
+returned as a compact GameResult. Run from the root of the project, for example:
+python -m catan.BatchRunner --games 1000 --workers 8 --players RandComp,RandComp,RandComp,RandComp
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+from catan import BoardPool
+from catan import Game
+from catan import GameRecorder
+from catan import GameResult
+from catan import NdjsonSink
+from catan import NullSink
+from catan import SampledSink
+from argparse import ArgumentParser
+from importlib import import_module
+from multiprocessing import Pool
+from time import perf_counter
+import os
+
+class BatchRunner:
+    """ The sink that receives the events of every game played by this process """
+    workerSink = NullSink.NullSink()
+
+    """ The pool of board layouts opened by this process, or None to shuffle the layout of every game """
+    workerBoardPool = None
+
+    """
+    playerTypes is a list of Player subclasses, one per seat. numWorkers is the number of worker
+    processes (1 plays every game in this process), and maxTurns ends games that stall without a winner.
+    If eventLogPath is specified, the events of 1 in every sampleRate games are written to it as NDJSON,
+    with each worker process writing to its own file next to the path. If replayDirectory is specified,
+    a replay of every game is written to it, named after the seed of the game. If boardPoolPath is
+    specified, every game draws its layout from the BoardPool file, which each worker memory-maps.
+    If useDevelopmentCards is False, the games are played without development cards.
+    """
+    def __init__(self, playerTypes, pointsToWin=10, numWorkers=os.cpu_count(), maxTurns=1000,
+                 eventLogPath=None, sampleRate=1, replayDirectory=None, boardPoolPath=None, useDevelopmentCards=True):
+        self.playerTypes = playerTypes
+        self.numPlayers = len(playerTypes)
+        self.pointsToWin = pointsToWin
+        self.numWorkers = numWorkers
+        self.maxTurns = maxTurns
+        self.eventLogPath = eventLogPath
+        self.sampleRate = sampleRate
+        self.replayDirectory = replayDirectory
+        self.boardPoolPath = boardPoolPath
+        self.useDevelopmentCards = useDevelopmentCards
+
+    """
+    Create the event sink for the games played by this process, with its own log file in worker processes,
+    and open the pool of board layouts (if any)
+    """
+    @staticmethod
+    def initWorker(eventLogPath, sampleRate, isWorker, boardPoolPath=None):
+        if boardPoolPath is None:
+            BatchRunner.workerBoardPool = None
+        else:
+            BatchRunner.workerBoardPool = BoardPool.BoardPool(boardPoolPath)
+        if eventLogPath is None:
+            BatchRunner.workerSink = NullSink.NullSink()
+        else:
+            if isWorker:
+                root, extension = os.path.splitext(eventLogPath)
+                eventLogPath = root + "." + str(os.getpid()) + extension
+            BatchRunner.workerSink = SampledSink.SampledSink(NdjsonSink.NdjsonSink(eventLogPath), sampleRate)
+
+    """ Return the Player subclass with the specified name, found in the catan module of the same name """
+    @staticmethod
+    def getPlayerType(playerTypeName):
+        return getattr(import_module("catan." + playerTypeName), playerTypeName)
+
+    """ Play a single game, reporting its events to the sink of this process, and return its result """
+    @staticmethod
+    def playGame(gameSettings):
+        seed, playerTypes, pointsToWin, maxTurns, replayDirectory, useDevelopmentCards = gameSettings
+        if replayDirectory is None:
+            game = Game.Game(playerTypes, pointsToWin, maxTurns, seed, BatchRunner.workerSink,
+                             BatchRunner.workerBoardPool, useDevelopmentCards)
+            game.play()
+        else:
+            recorder = GameRecorder.GameRecorder(BatchRunner.workerSink)
+            game = Game.Game(playerTypes, pointsToWin, maxTurns, seed, recorder, BatchRunner.workerBoardPool,
+                             useDevelopmentCards)
+            game.play()
+            recorder.save(os.path.join(replayDirectory, str(seed) + ".catanreplay"))
+        scores = tuple(player.score for player in game.players)
+        return GameResult.GameResult(seed, game.board.winner, game.board.turnNumber, scores)
+
+    """ Play numGames games with consecutive seeds starting at firstSeed, and return their results in order """
+    def run(self, numGames, firstSeed=0):
+        allSettings = [(firstSeed + i, self.playerTypes, self.pointsToWin, self.maxTurns, self.replayDirectory,
+                        self.useDevelopmentCards) for i in range(numGames)]
+        if self.replayDirectory is not None:
+            os.makedirs(self.replayDirectory, exist_ok=True)
+        if self.numWorkers <= 1:
+            self.initWorker(self.eventLogPath, self.sampleRate, False, self.boardPoolPath)
+            results = [self.playGame(gameSettings) for gameSettings in allSettings]
+            BatchRunner.workerSink.close()
+            return results
+
+        """
+        Send games to the workers in chunks, so each worker plays several games per message.
+        Event sinks write their buffered events at the end of each game, so nothing is lost when workers exit.
+        """
+        chunkSize = max(1, numGames // (self.numWorkers * 8))
+        with Pool(self.numWorkers, BatchRunner.initWorker,
+                  (self.eventLogPath, self.sampleRate, True, self.boardPoolPath)) as pool:
+            return pool.map(BatchRunner.playGame, allSettings, chunkSize)
+
+def main():
+    parser = ArgumentParser(description="Play many headless Settlers of Catan games")
+    parser.add_argument("--games", type=int, default=100, help="number of games to play")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="number of worker processes")
+    parser.add_argument("--players", default="RandComp,RandComp,RandComp,RandComp",
+                        help="comma-separated player types, one per seat")
+    parser.add_argument("--points", type=int, default=10, help="points needed to win a game")
+    parser.add_argument("--max-turns", type=int, default=1000, help="turn limit for games without a winner")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game")
+    parser.add_argument("--results", action="store_true", help="print the result of every game")
+    parser.add_argument("--events", help="NDJSON file to write game events to (not written if not specified)")
+    parser.add_argument("--sample", type=int, default=1, help="write every event for 1 in this many games")
+    parser.add_argument("--replays", help="directory to write a replay of every game to (not written if not specified)")
+    parser.add_argument("--board-pool", help="board pool file to draw the layout of every game from (shuffled if not "
+                                             "specified), written by catan.BoardGenerator")
+    parser.add_argument("--no-development-cards", action="store_true", help="play without development cards")
+    args = parser.parse_args()
+
+    playerTypes = [BatchRunner.getPlayerType(name) for name in args.players.split(",")]
+    runner = BatchRunner(playerTypes, args.points, args.workers, args.max_turns, args.events, args.sample,
+                         args.replays, args.board_pool, not args.no_development_cards)
+    startTime = perf_counter()
+    results = runner.run(args.games, args.seed)
+    elapsed = perf_counter() - startTime
+
+    """ Print one line per game (seed, winner, turns, scores), then the win counts and throughput """
+    if args.results:
+        for result in results:
+            print(result.seed, result.winner, result.turnNumber, " ".join(str(score) for score in result.scores))
+    wins = [0] * (len(playerTypes) + 1)
+    for result in results:
+        if result.winner == -1:
+            wins[0] += 1
+        else:
+            wins[result.winner] += 1
+    for i in range(len(playerTypes)):
+        print("Player", i + 1, "(" + playerTypes[i].__name__ + ") won", wins[i + 1], "games")
+    print(wins[0], "games ended without a winner")
+    print("Played", len(results), "games in %.2f seconds (%.1f games/second)" % (elapsed, len(results) / elapsed))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Bitboard representation of the pieces on the Settlers of Catan board. Each player's settlements,
+cities and roads are stored as Python integers with one bit per intersection or edge id from the
+Topology, so that legality checks are a few integer operations and copying the state of the board
+only copies a handful of integers. Kept up to date by the Board class alongside its lists of pieces.
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+
+class BitBoard:
+
+    def __init__(self, topology, numPlayers):
+        self.topology = topology
+        self.numPlayers = numPlayers
+
+        """ One mask per player for each type of piece, plus the intersections touched by each player's roads """
+        self.settlements = [0] * numPlayers
+        self.cities = [0] * numPlayers
+        self.roads = [0] * numPlayers
+        self.roadVertices = [0] * numPlayers
+
+        """ Masks of every occupied intersection and every edge with a road, for any player """
+        self.occupied = 0
+        self.allRoads = 0
+
+    """ Return a copy of this bitboard, which shares the static masks of the topology """
+    def copy(self):
+        newBitBoard = BitBoard.__new__(BitBoard)
+        newBitBoard.topology = self.topology
+        newBitBoard.numPlayers = self.numPlayers
+        newBitBoard.settlements = list(self.settlements)
+        newBitBoard.cities = list(self.cities)
+        newBitBoard.roads = list(self.roads)
+        newBitBoard.roadVertices = list(self.roadVertices)
+        newBitBoard.occupied = self.occupied
+        newBitBoard.allRoads = self.allRoads
+        return newBitBoard
+
+    """ Return the ids of the bits that are set in a mask, in increasing order """
+    @staticmethod
+    def getBits(mask):
+        bits = []
+        while mask:
+            lowestBit = mask & -mask
+            bits.append(lowestBit.bit_length() - 1)
+            mask ^= lowestBit
+        return bits
+
+    def addSettlement(self, vertex, playerNum):
+        self.settlements[playerNum - 1] |= 1 << vertex
+        self.occupied |= 1 << vertex
+
+    """ Replace a player's settlement with a city """
+    def addCity(self, vertex, playerNum):
+        self.settlements[playerNum - 1] &= ~(1 << vertex)
+        self.cities[playerNum - 1] |= 1 << vertex
+
+    def addRoad(self, edge, playerNum):
+        self.roads[playerNum - 1] |= 1 << edge
+        self.allRoads |= 1 << edge
+        self.roadVertices[playerNum - 1] |= self.topology.edgeVertexMasks[edge]
+
+    def removeSettlement(self, vertex, playerNum):
+        self.settlements[playerNum - 1] &= ~(1 << vertex)
+        self.occupied &= ~(1 << vertex)
+
+    """ Replace a player's city with the settlement it was built on """
+    def removeCity(self, vertex, playerNum):
+        self.cities[playerNum - 1] &= ~(1 << vertex)
+        self.settlements[playerNum - 1] |= 1 << vertex
+
+    """ Remove a road, and each of its intersections that is not touched by another of the player's roads """
+    def removeRoad(self, edge, playerNum):
+        self.roads[playerNum - 1] &= ~(1 << edge)
+        self.allRoads &= ~(1 << edge)
+        for vertex in self.topology.edges[edge]:
+            if self.topology.vertexEdgeMasks[vertex] & self.roads[playerNum - 1] == 0:
+                self.roadVertices[playerNum - 1] &= ~(1 << vertex)
+
+    """ Return a mask of every intersection occupied by a player's settlements and cities """
+    def getBuildings(self, playerNum):
+        return self.settlements[playerNum - 1] | self.cities[playerNum - 1]
+
+    """ Return a mask of every intersection where the distance rule prevents a new settlement """
+    def getBlocked(self):
+        blocked = 0
+        for vertex in self.getBits(self.occupied):
+            blocked |= self.topology.closedNeighborMasks[vertex]
+        return blocked
+
+    """ Determine whether an intersection and all of its neighbors are unoccupied """
+    def legalPlacement(self, vertex):
+        return self.topology.closedNeighborMasks[vertex] & self.occupied == 0
+
+    """ Determine whether an intersection is touched by a player's roads """
+    def isConnected(self, vertex, playerNum):
+        return (self.roadVertices[playerNum - 1] >> vertex) & 1 == 1
+
+    """ Return a mask of the intersections a player's roads can be extended from (not occupied by an opponent) """
+    def getExtendableVertices(self, playerNum):
+        return self.roadVertices[playerNum - 1] & ~(self.occupied & ~self.getBuildings(playerNum))
+
+    """ Determine whether a road on an empty edge would connect to a player's road network """
+    def isRoadConnected(self, edge, playerNum):
+        return ((self.allRoads >> edge) & 1 == 0
+                and self.topology.edgeVertexMasks[edge] & self.getExtendableVertices(playerNum) != 0)
+
+    """ Return a mask of every intersection where a player could legally build a settlement """
+    def getPossibleSettlements(self, playerNum):
+        return self.roadVertices[playerNum - 1] & ~self.getBlocked()
+
+    """ Return a mask of every empty edge where a player could legally build a road """
+    def getPossibleRoads(self, playerNum):
+        possibleRoads = 0
+        for vertex in self.getBits(self.getExtendableVertices(playerNum)):
+            possibleRoads |= self.topology.vertexEdgeMasks[vertex]
+        return possibleRoads & ~self.allRoads
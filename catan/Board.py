@@ -10,44 +10,55 @@ Created on Sep 2, 2022
 
 @author: Andrew Hubbard
 """
+from catan import BitBoard
+from catan import BoardLayout
+from catan import BoardSnapshot
 from catan import City
+from catan import ConsoleSink
+from catan import DevelopmentDeck
 from catan import Dice
-from catan import Hexagon
-from catan import Point
-from catan import DoublePoint
-from catan import Port
+from catan import LongestRoad
+from catan import NullSink
+from catan import QueryCache
 from catan import Settlement
 from catan import Road
-from ctypes import windll
-from math import sqrt
-from random import shuffle
-import PySimpleGUI
+from catan import Topology
+from random import Random
+import copy
+import itertools
 
 """
 Structure to keep track of the Settlers of Catan board, all of the objects 
 on the board, and each player's score, resources, and development cards
 """
 class Board:
+    """ Source of the epoch of every board state, so that no two different states share an epoch """
+    epochs = itertools.count()
 
-    def __init__(self, numPlayers):
-        """ Identify the coordinates of the center of the screen """
-        user32 = windll.user32
-        self.centerX = user32.GetSystemMetrics(0) / 2.0
-        self.centerY = user32.GetSystemMetrics(1) / 2.0
+    """
+    randomGenerator is the stream of random numbers used to set up the tiles and ports, and
+    diceRandomGenerator is the stream used to roll the dice (each randomly seeded if not specified).
+    Every piece placed and every error is reported to eventSink (printed to the screen if not specified).
+    """
+    def __init__(self, numPlayers, randomGenerator=None, diceRandomGenerator=None, eventSink=None):
+        if randomGenerator is None:
+            randomGenerator = Random()
+        if eventSink is None:
+            eventSink = ConsoleSink.ConsoleSink()
+        self.randomGenerator = randomGenerator
+        self.eventSink = eventSink
 
-        """ Assign the width and height of each hexagon that makes up the Catan board """
-        self.height = self.centerY / 5.6
-        self.width = self.height * 1.15
-        self.smallWidth = self.width / 2.0
+        """ Integer layout of the hexagons, intersections, edges and ports on the board """
+        self.topology = Topology.Topology.getShared()
+
+        """
+        Tiles, numbers and ports of the board, shared with every clone of the board and every player.
+        The board has no tiles or ports until initTiles and initPorts (or setLayout) are called.
+        """
+        self.useLayout(BoardLayout.BoardLayout.getEmpty())
 
         """ Initialize all of the data that the Board class will use """
         self.hexNumbers = [5, 2, 6, 3, 8, 10, 9, 12, 11, 4, 8, 10, 9, 4, 5, 6, 3, 11]
-        self.hexIntersections = []
-        self.tiles = []
-        self.hexCenters = []
-        self.ports = []
-        self.portPoint1Locations = []
-        self.portPoint2Locations = []
         self.settlements = [[]]
         self.cities = [[]]
         self.roads = [[]]
@@ -60,52 +71,161 @@ class Board:
             self.roads.append([])
             self.numResources.append(0)
             self.playerScores.append(0)
-        self.dice = Dice.Dice()
+        self.dice = Dice.Dice(diceRandomGenerator)
         self.robberLocation = None
+        self.robberHex = -1
+
+        """
+        Production table used to resolve dice rolls. hexYields holds the number of resources each player
+        collects from each hexagon (1 per settlement, 2 per city), and production holds the (playerNum,
+        resource type, multiplier) payouts for each dice number, excluding the hexagon blocked by the robber.
+        The hexagons with each number (numberHexes) are part of the layout.
+        """
+        self.hexYields = []
+        self.production = [[] for _ in range(13)]
+
+        """
+        Occupancy index of the intersections on the board. vertexOwners holds the number of the player
+        with a building at each intersection (0 if empty), vertexBuildings holds the kind of building
+        ("settlement", "city" or a blank string), and blockedVertices holds every intersection where the
+        distance rule prevents a new settlement because it or a neighbor is occupied.
+        """
+        self.vertexOwners = [0] * len(self.topology.vertices)
+        self.vertexBuildings = [""] * len(self.topology.vertices)
+        self.blockedVertices = set()
+
+        """ Road index of the edges on the board, holding the number of the player with a road on each edge """
+        self.edgeOwners = [0] * len(self.topology.edges)
+
+        """
+        Legal move frontiers for each player, updated whenever a piece is placed: the intersections
+        where the player could build a settlement, the edges where the player could build a road, and
+        the settlements the player could upgrade to a city. roadVertices holds every intersection
+        touched by each player's roads.
+        """
+        self.settlementFrontiers = [set() for _ in range(numPlayers)]
+        self.roadFrontiers = [set() for _ in range(numPlayers)]
+        self.cityFrontiers = [set() for _ in range(numPlayers)]
+        self.roadVertices = [set() for _ in range(numPlayers)]
+
+        """ Bitboard copy of every player's pieces, used for fast legality checks and cheap copies """
+        self.bitBoard = BitBoard.BitBoard(self.topology, numPlayers)
+
+        """
+        Longest road: the components of each player's roads (a mask of the edges of each component, mapped
+        to the length of its longest road), the length of each player's longest road, and the number of
+        the player holding longest road (0 if nobody does), whose score includes the points for it.
+        These are replaced rather than changed, so they are shared with snapshots and undo tokens.
+        """
+        self.roadComponents = tuple([{} for _ in range(numPlayers)])
+        self.roadLengths = tuple([0] * numPlayers)
+        self.longestRoadOwner = 0
+
+        """
+        Development cards: the number of cards in each player's hidden hand, the number of knights each
+        player has played, and the number of the player holding largest army (0 if nobody does), whose
+        score includes the points for it
+        """
+        self.numDevelopmentCards = [0] * numPlayers
+        self.knightsPlayed = [0] * numPlayers
+        self.largestArmyOwner = 0
+
+        """
+        Copy-on-write flags for the state shared with snapshots and clones of this board: whether this
+        board owns each player's pieces and frontiers, whether it owns the occupancy and road indexes and
+        bitboard, and whether it owns the production table. Shared containers are copied the first time
+        they are changed.
+        """
+        self.ownedPlayerStates = [True] * numPlayers
+        self.ownsPieceState = True
+        self.ownsProduction = True
         self.turnNumber = 1
         self.winner = -1
         self.isVisible = True
 
-    """ This may not be working currently """
+        """
+        The epoch identifies the state of the pieces, the robber and the layout of the board, and changes
+        whenever any of them change (but not when resource counts, scores or the turn number change).
+        The epoch of each player only changes when the player's settlements and cities (which decide
+        the resources it collects and the ports it can use) or the layout change.
+        Query results are cached by epoch, and the cache is shared with clones of the board, which
+        start in the same state.
+        """
+        self.epoch = next(Board.epochs)
+        self.playerEpochs = tuple([self.epoch] * numPlayers)
+        self.queryCache = QueryCache.QueryCache()
+
+    """
+    Draw the board in a window on the screen. The window code, and PySimpleGUI, are only loaded the
+    first time a board is drawn.
+    """
     def drawBoard(self):
         if not self.isVisible:
             return
+        from catan import BoardWindow
+        BoardWindow.BoardWindow(self).draw()
 
-        layout = [
-            [
-                PySimpleGUI.Graph(
-                    canvas_size=(self.centerX * 2, self.centerY * 2),
-                    graph_bottom_left=(0, 0),
-                    graph_top_right=(self.centerX * 2, self.centerY * 2),
-                    key="graph"
-                )
-            ]
-        ]
-
-        window = PySimpleGUI.Window("Catan Game", layout)
-        window.Finalize()
-
-        myIcon = window.Element("Catan Tile")
-
-        for i in range(len(self.tiles)):
-            x = int(self.tiles[i].location.x)
-            y = int(self.tiles[i].location.y)
-
-            if self.tiles[i].hexType == "wood":
-                myIcon.DrawImage(filename="forest.jpg", location=(x, y))
-            elif self.tiles[i].hexType == "brick":
-                myIcon.DrawImage(filename="hill.jpg", location=(x, y))
-            elif self.tiles[i].hexType == "ore":
-                myIcon.DrawImage(filename="mountain.jpg", location=(x, y))
-            elif self.tiles[i].hexType == "sheep":
-                myIcon.DrawImage(filename="pasture.jpg", location=(x, y))
-            elif self.tiles[i].hexType == "wheat":
-                myIcon.DrawImage(filename="plain.jpg", location=(x, y))
-            else:
-                myIcon.DrawImage(filename="desert.jpg", location=(x, y))
-
+    """ Move the robber to the specified hexagon and update the payouts of the numbers it blocks and unblocks """
     def setRobberLocation(self, robberLocation):
+        self.ownProduction()
+        self.markChanged(())
+        oldRobberHex = self.robberHex
         self.robberLocation = robberLocation
+        self.robberHex = self.findHexIndex(robberLocation)
+        if oldRobberHex != -1:
+            self.updateProduction(self.tiles[oldRobberHex].number)
+        if self.robberHex != -1:
+            self.updateProduction(self.tiles[self.robberHex].number)
+
+    """ Rebuild the payouts for a dice number from the hexagons with that number that are not blocked """
+    def updateProduction(self, number):
+        payouts = []
+        for hexId in self.numberHexes[number]:
+            if hexId != self.robberHex:
+                for i in range(self.numPlayers):
+                    if self.hexYields[hexId][i] > 0:
+                        payouts.append((i + 1, self.tiles[hexId].hexType, self.hexYields[hexId][i]))
+        self.production[number] = payouts
+
+    """
+    Add to the resources a player collects from each hexagon next to a newly built settlement or city
+    (or subtract from them, with an amount of -1, when a settlement or city is taken back)
+    """
+    def addProduction(self, point, playerNum, amount=1):
+        numbers = set()
+        for hexId in self.topology.vertexHexes[self.topology.findVertex(point)]:
+            self.hexYields[hexId][playerNum - 1] += amount
+            numbers.add(self.tiles[hexId].number)
+        for number in numbers:
+            self.updateProduction(number)
+
+    """
+    Start a new epoch after the pieces, the robber or the layout of the board change, and a new epoch
+    for each of the specified players whose settlements or cities changed
+    """
+    def markChanged(self, playerNums):
+        self.epoch = next(Board.epochs)
+        if len(playerNums) > 0:
+            playerEpochs = list(self.playerEpochs)
+            for playerNum in playerNums:
+                playerEpochs[playerNum - 1] = self.epoch
+            self.playerEpochs = tuple(playerEpochs)
+
+    """
+    Return the result of a query on the board, computing it with compute(*args) only if it has not been
+    computed already in the current epoch. If playerNum is specified, the result is kept until that
+    player's epoch changes instead, for results that only depend on the layout and the player's own
+    settlements and cities (and the player's state that only changes with them, such as its trade
+    rates). Results must not be changed by the caller, since the same result is returned every time.
+    """
+    def cachedQuery(self, query, args, compute, playerNum=0):
+        if playerNum == 0:
+            return self.queryCache.lookup((query, args, self.epoch), compute, *args)
+        return self.queryCache.lookup((query, args, playerNum, self.playerEpochs[playerNum - 1]), compute, *args)
+
+    """ Return the (playerNum, resource type, multiplier) payouts for a dice roll """
+    def getProduction(self, diceRoll):
+        return self.production[diceRoll]
 
     """ Roll 2 6-sided dice and return the result """
     def rollDice(self):
@@ -117,16 +237,37 @@ class Board:
     """
     def addSettlement(self, point, color, playerNum, initialPlacement):
         if not (self.legalPlacement(point)):
-            print("ERROR: Player", playerNum, "tried to place a settlement at location",
-                  int(point.x), int(point.y), "which is too close to existing settlements")
+            self.eventSink.error(self.turnNumber, playerNum, "Player", playerNum,
+                                 "tried to place a settlement at location", int(point.x), int(point.y),
+                                 "which is too close to existing settlements")
         elif len(self.settlements[playerNum - 1]) >= 5:
-            print("ERROR: Player", playerNum, "has the maximum number of settlements and cannot place any more")
+            self.eventSink.error(self.turnNumber, playerNum, "Player", playerNum,
+                                 "has the maximum number of settlements and cannot place any more")
         else:
+            self.ownPieceState()
+            self.ownProduction()
+            self.ownPlayerState(playerNum)
+            self.markChanged((playerNum,))
             if not initialPlacement:
-                print("Player", playerNum, "scored a point on turn", self.turnNumber,
-                      "by placing a settlement at", int(point.x), int(point.y))
+                self.eventSink.emit("settlement", self.turnNumber, playerNum, {"x": point.x, "y": point.y})
             self.settlements[playerNum - 1].append(Settlement.Settlement(point, color, playerNum))
             self.playerScores[playerNum - 1] += 1
+            self.addProduction(point, playerNum)
+
+            """ Record the settlement in the occupancy index and block the intersections next to it """
+            vertex = self.topology.findVertex(point)
+            self.vertexOwners[vertex] = playerNum
+            self.vertexBuildings[vertex] = "settlement"
+            self.blockedVertices.add(vertex)
+            self.blockedVertices.update(self.topology.vertexNeighbors[vertex])
+            self.updateSettlementFrontiers(vertex, playerNum)
+            self.bitBoard.addSettlement(vertex, playerNum)
+
+            """ The settlement splits the component of any opposing player with 2 or more roads through it """
+            for i in range(self.numPlayers):
+                edgeMask = self.topology.vertexEdgeMasks[vertex] & self.bitBoard.roads[i]
+                if i != playerNum - 1 and edgeMask & (edgeMask - 1):
+                    self.splitRoadComponents(i + 1, BitBoard.BitBoard.getBits(edgeMask), initialPlacement)
 
     """
     Verify that the player has a settlement and the specified location and has a city available to place. 
@@ -135,214 +276,569 @@ class Board:
     def addCity(self, point, color, playerNum, initialPlacement):
         settlementIndex = self.findSettlementIndex(point, playerNum)
         if settlementIndex == -1:
-            print("ERROR: Player", playerNum, "tried to place a city at location",
-                  int(point.x), int(point.y), "but does not have a settlement at this location")
+            self.eventSink.error(self.turnNumber, playerNum, "Player", playerNum,
+                                 "tried to place a city at location", int(point.x), int(point.y),
+                                 "but does not have a settlement at this location")
         elif len(self.cities[playerNum - 1]) >= 4:
-            print("ERROR: Player", playerNum, "has the maximum number of cities and cannot place any more")
+            self.eventSink.error(self.turnNumber, playerNum, "Player", playerNum,
+                                 "has the maximum number of cities and cannot place any more")
         else:
+            self.ownPieceState()
+            self.ownProduction()
+            self.ownPlayerState(playerNum)
+            self.markChanged((playerNum,))
             if not initialPlacement:
-                print("Player", playerNum, "scored a point on turn", self.turnNumber,
-                      "by placing a city at", int(point.x), int(point.y))
+                self.eventSink.emit("city", self.turnNumber, playerNum, {"x": point.x, "y": point.y})
             self.cities[playerNum - 1].append(City.City(point, color, playerNum))
             del self.settlements[playerNum - 1][settlementIndex]
             self.playerScores[playerNum - 1] += 1
+            self.addProduction(point, playerNum)
+            self.vertexBuildings[self.topology.findVertex(point)] = "city"
+            self.cityFrontiers[playerNum - 1].discard(self.topology.findVertex(point))
+            self.bitBoard.addCity(self.topology.findVertex(point), playerNum)
 
     """
     Verify that the player is placing a road on an unoccupied location and the player 
     already has a road connected to the location (or a settlement for initial placements),
     and the player does not have the maximum number of roads placed already.
     If these checks pass, add a road connecting the points specified to the player's roads.
+    A free road (from a road building card) is not reported as bought, but unlike an initial placement,
+    a change of the holder of longest road that it causes is reported.
     """
-    def addRoad(self, point1, point2, color, playerNum, initialPlacement):
-        roadIndex = self.findRoadIndex(point1, point2, -1)
-        if roadIndex != -1:
+    def addRoad(self, point1, point2, color, playerNum, initialPlacement, freeRoad=False):
+        edge = self.topology.findEdge(point1, point2)
+        if edge == -1:
+            self.eventSink.error(self.turnNumber, playerNum, "Player", playerNum, "tried to place a road between",
+                                 int(point1.x), int(point1.y), "and", int(point2.x), int(point2.y),
+                                 "but these points are not connected")
+        elif self.edgeOwners[edge] != 0:
             if point1.x < point2.x or (point1.x == point2.x and point1.y <= point2.y):
-                print("ERROR: Player", playerNum, "tried to place a road between", int(point1.x), int(point1.y),
-                      "and", int(point2.x), int(point2.y), "but there is already a road connecting these points")
+                self.eventSink.error(self.turnNumber, playerNum, "Player", playerNum, "tried to place a road between",
+                                     int(point1.x), int(point1.y), "and", int(point2.x), int(point2.y),
+                                     "but there is already a road connecting these points")
             else:
-                print("ERROR: Player", playerNum, "tried to place a road between", int(point2.x), int(point2.y),
-                      "and", int(point1.x), int(point1.y), "but there is already a road connecting these points")
+                self.eventSink.error(self.turnNumber, playerNum, "Player", playerNum, "tried to place a road between",
+                                     int(point2.x), int(point2.y), "and", int(point1.x), int(point1.y),
+                                     "but there is already a road connecting these points")
         elif len(self.roads[playerNum - 1]) >= 15:
-            print("ERROR: Player", playerNum, "has the maximum number of roads and cannot place any more")
+            self.eventSink.error(self.turnNumber, playerNum, "Player", playerNum,
+                                 "has the maximum number of roads and cannot place any more")
         else:
+            self.ownPieceState()
+            self.ownPlayerState(playerNum)
+            self.markChanged(())
             if point1.x < point2.x or (point1.x == point2.x and point1.y <= point2.y):
-                if not initialPlacement:
-                    print("Player", playerNum, "placed a road between", int(point1.x), int(point1.y),
-                          "and", int(point2.x), int(point2.y), "on turn", self.turnNumber)
+                if not initialPlacement and not freeRoad:
+                    self.eventSink.emit("road", self.turnNumber, playerNum,
+                                        {"x1": point1.x, "y1": point1.y, "x2": point2.x, "y2": point2.y})
                 self.roads[playerNum - 1].append(Road.Road(point1, point2, color, playerNum))
             else:
-                if not initialPlacement:
+                if not initialPlacement and not freeRoad:
                     self.numResources[playerNum - 1] -= 2
-                    print("Player", playerNum, "placed a road between", int(point2.x), int(point2.y),
-                          "and", int(point1.x), int(point1.y), "on turn", self.turnNumber)
+                    self.eventSink.emit("road", self.turnNumber, playerNum,
+                                        {"x1": point2.x, "y1": point2.y, "x2": point1.x, "y2": point1.y})
                 self.roads[playerNum - 1].append(Road.Road(point2, point1, color, playerNum))
+            self.edgeOwners[edge] = playerNum
+            self.updateRoadFrontiers(edge, playerNum)
+            self.bitBoard.addRoad(edge, playerNum)
+            self.joinRoadComponents(playerNum, edge, initialPlacement)
+
+    """
+    Add a new road to the components of a player's roads, joining it with the components that touch it at
+    an intersection that is not blocked by an opposing building
+    """
+    def joinRoadComponents(self, playerNum, edge, initialPlacement):
+        i = playerNum - 1
+        blockedMask = self.getBlockedRoadVertices(playerNum)
+        joinedEdges = 0
+        for vertex in self.topology.edges[edge]:
+            if not (blockedMask >> vertex) & 1:
+                joinedEdges |= self.topology.vertexEdgeMasks[vertex]
+        component = 1 << edge
+        components = {}
+        for oldComponent, length in self.roadComponents[i].items():
+            if oldComponent & joinedEdges:
+                component |= oldComponent
+            else:
+                components[oldComponent] = length
+        components[component] = LongestRoad.LongestRoad.getLength(self.topology, component, blockedMask)
+        self.setRoadComponents(playerNum, components, initialPlacement)
+
+    """
+    Split the component of a player's roads through an intersection where an opposing settlement was
+    just built, finding the component of each of the specified roads of the player at the intersection
+    """
+    def splitRoadComponents(self, playerNum, edges, initialPlacement):
+        i = playerNum - 1
+        roadMask = self.bitBoard.roads[i]
+        blockedMask = self.getBlockedRoadVertices(playerNum)
+        newComponents = []
+        splitEdges = 0
+        for edge in edges:
+            if not (splitEdges >> edge) & 1:
+                component = LongestRoad.LongestRoad.findComponent(self.topology, roadMask, edge, blockedMask)
+                newComponents.append(component)
+                splitEdges |= component
+        components = {component: length for component, length in self.roadComponents[i].items()
+                      if component & splitEdges == 0}
+        for component in newComponents:
+            components[component] = LongestRoad.LongestRoad.getLength(self.topology, component, blockedMask)
+        self.setRoadComponents(playerNum, components, initialPlacement)
+
+    """ Return a mask of the intersections touched by a player's roads """
+    def getRoadVertexMask(self, playerNum):
+        return self.bitBoard.roadVertices[playerNum - 1]
+
+    """
+    Return a mask of the intersections touched by a player's roads that hold an opposing building, which
+    the player's roads cannot pass through
+    """
+    def getBlockedRoadVertices(self, playerNum):
+        i = playerNum - 1
+        return (self.bitBoard.occupied & self.bitBoard.roadVertices[i]
+                & ~(self.bitBoard.settlements[i] | self.bitBoard.cities[i]))
+
+    """ Replace the components of a player's roads, then update the player's longest road and its holder """
+    def setRoadComponents(self, playerNum, components, initialPlacement):
+        roadComponents = list(self.roadComponents)
+        roadComponents[playerNum - 1] = components
+        self.roadComponents = tuple(roadComponents)
+        roadLengths = list(self.roadLengths)
+        roadLengths[playerNum - 1] = max(components.values())
+        self.roadLengths = tuple(roadLengths)
+        self.updateLongestRoad(initialPlacement)
+
+    """
+    Award longest road to the player with the longest road of at least the minimum length. The holder
+    keeps it through a tie, and if the holder is passed or its road is broken, it goes to the player with
+    the strictly longest road, or to nobody if players are tied for the longest road.
+    """
+    def updateLongestRoad(self, initialPlacement):
+        longest = max(self.roadLengths)
+        if longest < LongestRoad.LongestRoad.minimumLength:
+            owner = 0
+        elif self.longestRoadOwner != 0 and self.roadLengths[self.longestRoadOwner - 1] == longest:
+            return
+        elif self.roadLengths.count(longest) == 1:
+            owner = self.roadLengths.index(longest) + 1
+        else:
+            owner = 0
+        if owner != self.longestRoadOwner:
+            if not initialPlacement:
+                self.eventSink.emit("longestRoad", self.turnNumber, owner,
+                                    {"owner": owner, "length": longest if owner != 0 else 0})
+            self.setLongestRoadOwner(owner)
+
+    """
+    Record a knight played by a player, and give largest army to the player if it has played at least
+    the minimum number of knights and more knights than the holder of largest army
+    """
+    def addKnight(self, playerNum):
+        self.knightsPlayed[playerNum - 1] += 1
+        knights = self.knightsPlayed[playerNum - 1]
+        owner = self.largestArmyOwner
+        if (knights >= DevelopmentDeck.DevelopmentDeck.minimumArmySize and owner != playerNum
+                and (owner == 0 or knights > self.knightsPlayed[owner - 1])):
+            self.eventSink.emit("largestArmy", self.turnNumber, playerNum, {"owner": playerNum, "knights": knights})
+            self.setLargestArmyOwner(playerNum)
+
+    """ Give largest army to a player (or to nobody, if 0), moving its points from the previous holder """
+    def setLargestArmyOwner(self, owner):
+        if self.largestArmyOwner != 0:
+            self.playerScores[self.largestArmyOwner - 1] -= DevelopmentDeck.DevelopmentDeck.largestArmyPoints
+        if owner != 0:
+            self.playerScores[owner - 1] += DevelopmentDeck.DevelopmentDeck.largestArmyPoints
+        self.largestArmyOwner = owner
+
+    """ Give longest road to a player (or to nobody, if 0), moving its points from the previous holder """
+    def setLongestRoadOwner(self, owner):
+        if self.longestRoadOwner != 0:
+            self.playerScores[self.longestRoadOwner - 1] -= LongestRoad.LongestRoad.points
+        if owner != 0:
+            self.playerScores[owner - 1] += LongestRoad.LongestRoad.points
+        self.longestRoadOwner = owner
+
+    """ Record the number of resources and development cards that each player holds, which every player can see """
+    def setHandSizes(self, numResources, numDevelopmentCards):
+        self.numResources = numResources
+        self.numDevelopmentCards = numDevelopmentCards
+
+    """
+    Update every player's frontiers after a settlement is placed at an intersection. The intersection
+    and its neighbors can no longer hold a settlement, and opposing players can no longer extend their
+    roads through the intersection.
+    """
+    def updateSettlementFrontiers(self, vertex, playerNum):
+        self.cityFrontiers[playerNum - 1].add(vertex)
+        for i in range(self.numPlayers):
+            """ Only copy the state of opponents whose frontiers are changed by the settlement """
+            if (vertex in self.settlementFrontiers[i]
+                    or not self.settlementFrontiers[i].isdisjoint(self.topology.vertexNeighbors[vertex])):
+                self.ownPlayerState(i + 1)
+                self.settlementFrontiers[i].discard(vertex)
+                self.settlementFrontiers[i].difference_update(self.topology.vertexNeighbors[vertex])
+            if i != playerNum - 1 and vertex in self.roadVertices[i]:
+                self.ownPlayerState(i + 1)
+                for edge in self.topology.vertexEdges[vertex]:
+                    if not self.canExtendRoad(self.getOtherVertex(edge, vertex), i + 1):
+                        self.roadFrontiers[i].discard(edge)
+
+    """
+    Update every player's frontiers after a road is placed on an edge. The edge is no longer open to
+    anyone, and the road's owner can now build from both of its intersections.
+    """
+    def updateRoadFrontiers(self, edge, playerNum):
+        for i in range(self.numPlayers):
+            if edge in self.roadFrontiers[i]:
+                self.ownPlayerState(i + 1)
+                self.roadFrontiers[i].discard(edge)
+        for vertex in self.topology.edges[edge]:
+            self.roadVertices[playerNum - 1].add(vertex)
+            if vertex not in self.blockedVertices:
+                self.settlementFrontiers[playerNum - 1].add(vertex)
+            if self.canExtendRoad(vertex, playerNum):
+                for nextEdge in self.topology.vertexEdges[vertex]:
+                    if self.edgeOwners[nextEdge] == 0:
+                        self.roadFrontiers[playerNum - 1].add(nextEdge)
+
+    """ Return True if a player's road network reaches an intersection that is not occupied by an opponent """
+    def canExtendRoad(self, vertex, playerNum):
+        return (vertex in self.roadVertices[playerNum - 1]
+                and (self.vertexOwners[vertex] == 0 or self.vertexOwners[vertex] == playerNum))
+
+    """ Return the intersection at the opposite end of an edge from the specified intersection """
+    def getOtherVertex(self, edge, vertex):
+        if self.topology.edges[edge][0] == vertex:
+            return self.topology.edges[edge][1]
+        return self.topology.edges[edge][0]
+
+    """
+    Return a snapshot of the state of the board that changes during a game. The board and the snapshot
+    share their containers until the board changes them, so taking a snapshot copies almost nothing.
+    """
+    def snapshot(self):
+        self.ownedPlayerStates = [False] * self.numPlayers
+        self.ownsPieceState = False
+        self.ownsProduction = False
+        return BoardSnapshot.BoardSnapshot(self)
+
+    """ Return the board to the state held by a snapshot, which can be restored any number of times """
+    def restore(self, snapshot):
+        self.settlements = list(snapshot.settlements)
+        self.cities = list(snapshot.cities)
+        self.roads = list(snapshot.roads)
+        self.settlementFrontiers = list(snapshot.settlementFrontiers)
+        self.roadFrontiers = list(snapshot.roadFrontiers)
+        self.cityFrontiers = list(snapshot.cityFrontiers)
+        self.roadVertices = list(snapshot.roadVertices)
+        self.numResources = list(snapshot.numResources)
+        self.playerScores = list(snapshot.playerScores)
+        self.numDevelopmentCards = list(snapshot.numDevelopmentCards)
+        self.knightsPlayed = list(snapshot.knightsPlayed)
+        self.largestArmyOwner = snapshot.largestArmyOwner
+        self.vertexOwners = snapshot.vertexOwners
+        self.vertexBuildings = snapshot.vertexBuildings
+        self.blockedVertices = snapshot.blockedVertices
+        self.edgeOwners = snapshot.edgeOwners
+        self.hexYields = snapshot.hexYields
+        self.production = snapshot.production
+        self.bitBoard = snapshot.bitBoard
+        self.roadComponents = snapshot.roadComponents
+        self.roadLengths = snapshot.roadLengths
+        self.longestRoadOwner = snapshot.longestRoadOwner
+        self.robberLocation = snapshot.robberLocation
+        self.robberHex = snapshot.robberHex
+        self.turnNumber = snapshot.turnNumber
+        self.winner = snapshot.winner
+        self.epoch = snapshot.epoch
+        self.playerEpochs = snapshot.playerEpochs
+        self.ownedPlayerStates = [False] * self.numPlayers
+        self.ownsPieceState = False
+        self.ownsProduction = False
+
+    """
+    Return a copy of the board for trying out moves without changing this board. The copy shares the
+    layout of the board and shares everything else until either board changes it. Moves made on the
+    copy are reported to eventSink (ignored if not specified), and the copy rolls its own dice using
+    diceRandomGenerator (randomly seeded if not specified), so the game's events and dice are unaffected.
+    """
+    def clone(self, eventSink=None, diceRandomGenerator=None):
+        if eventSink is None:
+            eventSink = NullSink.NullSink()
+        snapshot = self.snapshot()
+        newBoard = copy.copy(self)
+        newBoard.eventSink = eventSink
+        newBoard.dice = Dice.Dice(diceRandomGenerator)
+        newBoard.restore(snapshot)
+        return newBoard
+
+    """ Copy a player's pieces and frontiers before changing them, if they are shared with another board """
+    def ownPlayerState(self, playerNum):
+        i = playerNum - 1
+        if not self.ownedPlayerStates[i]:
+            self.settlements[i] = list(self.settlements[i])
+            self.cities[i] = list(self.cities[i])
+            self.roads[i] = list(self.roads[i])
+            self.settlementFrontiers[i] = set(self.settlementFrontiers[i])
+            self.roadFrontiers[i] = set(self.roadFrontiers[i])
+            self.cityFrontiers[i] = set(self.cityFrontiers[i])
+            self.roadVertices[i] = set(self.roadVertices[i])
+            self.ownedPlayerStates[i] = True
+
+    """ Copy the occupancy and road indexes and the bitboard before changing them, if they are shared """
+    def ownPieceState(self):
+        if not self.ownsPieceState:
+            self.vertexOwners = list(self.vertexOwners)
+            self.vertexBuildings = list(self.vertexBuildings)
+            self.blockedVertices = set(self.blockedVertices)
+            self.edgeOwners = list(self.edgeOwners)
+            self.bitBoard = self.bitBoard.copy()
+            self.ownsPieceState = True
+
+    """ Copy the production table before changing it, if it is shared """
+    def ownProduction(self):
+        if not self.ownsProduction:
+            self.hexYields = [list(hexYield) for hexYield in self.hexYields]
+            self.production = list(self.production)
+            self.ownsProduction = True
+
+    """
+    Apply a move to the board in place and return an undo token, which the undo method uses to restore
+    exactly the state before the move, or -1 if the move is not legal. Undo tokens must be undone in
+    the reverse order of the moves. Moves are not reported as events, the same as initial placements,
+    since they are only being tried out.
+    """
+    def applySettlement(self, point, color, playerNum):
+        token = ("settlement", playerNum, self.topology.findVertex(point), None,
+                 tuple(self.playerScores), self.numResources[playerNum - 1], self.epoch, self.playerEpochs,
+                 self.roadComponents, self.roadLengths, self.longestRoadOwner)
+        numSettlements = len(self.settlements[playerNum - 1])
+        self.addSettlement(point, color, playerNum, True)
+        if len(self.settlements[playerNum - 1]) == numSettlements:
+            return -1
+        return token
+
+    def applyCity(self, point, color, playerNum):
+        settlementIndex = self.findSettlementIndex(point, playerNum)
+        if settlementIndex == -1:
+            replacedSettlement = (-1, None)
+        else:
+            replacedSettlement = (settlementIndex, self.settlements[playerNum - 1][settlementIndex])
+        token = ("city", playerNum, self.topology.findVertex(point), replacedSettlement,
+                 tuple(self.playerScores), self.numResources[playerNum - 1], self.epoch, self.playerEpochs,
+                 self.roadComponents, self.roadLengths, self.longestRoadOwner)
+        numCities = len(self.cities[playerNum - 1])
+        self.addCity(point, color, playerNum, True)
+        if len(self.cities[playerNum - 1]) == numCities:
+            return -1
+        return token
+
+    def applyRoad(self, point1, point2, color, playerNum):
+        token = ("road", playerNum, self.topology.findEdge(point1, point2), None,
+                 tuple(self.playerScores), self.numResources[playerNum - 1], self.epoch, self.playerEpochs,
+                 self.roadComponents, self.roadLengths, self.longestRoadOwner)
+        numRoads = len(self.roads[playerNum - 1])
+        self.addRoad(point1, point2, color, playerNum, True)
+        if len(self.roads[playerNum - 1]) == numRoads:
+            return -1
+        return token
+
+    def applyRobber(self, robberLocation):
+        if self.findHexIndex(robberLocation) == -1:
+            self.eventSink.error(self.turnNumber, 0, "Tried to move the robber to location", robberLocation.x,
+                                 robberLocation.y, "which is not the center of a hexagon")
+            return -1
+        token = ("robber", self.robberLocation, self.epoch)
+        self.setRobberLocation(robberLocation)
+        return token
+
+    """ Take back the move that returned an undo token (nothing is done for a move that was not legal) """
+    def undo(self, token):
+        if token == -1:
+            return
+        if token[0] == "robber":
+            self.setRobberLocation(token[1])
+            self.epoch = token[2]
+            return
+
+        (kind, playerNum, pieceId, replacedSettlement, scores, numResources, epoch, playerEpochs,
+         self.roadComponents, self.roadLengths, self.longestRoadOwner) = token
+        self.ownPieceState()
+        for i in range(self.numPlayers):
+            self.ownPlayerState(i + 1)
+        match kind:
+            case "settlement":
+                self.ownProduction()
+                self.settlements[playerNum - 1].pop()
+                self.addProduction(self.topology.vertices[pieceId], playerNum, -1)
+                self.vertexOwners[pieceId] = 0
+                self.vertexBuildings[pieceId] = ""
+                self.cityFrontiers[playerNum - 1].discard(pieceId)
+                self.bitBoard.removeSettlement(pieceId, playerNum)
+                self.refreshVertices([pieceId] + self.topology.vertexNeighbors[pieceId])
+                self.refreshEdges(self.topology.vertexEdges[pieceId], range(1, self.numPlayers + 1))
+            case "city":
+                self.ownProduction()
+                city = self.cities[playerNum - 1].pop()
+                self.settlements[playerNum - 1].insert(replacedSettlement[0], replacedSettlement[1])
+                self.addProduction(city.location, playerNum, -1)
+                self.vertexBuildings[pieceId] = "settlement"
+                self.cityFrontiers[playerNum - 1].add(pieceId)
+                self.bitBoard.removeCity(pieceId, playerNum)
+            case "road":
+                self.roads[playerNum - 1].pop()
+                self.edgeOwners[pieceId] = 0
+                self.bitBoard.removeRoad(pieceId, playerNum)
+                """
+                The edge is open to every player again, and the road's owner may no longer reach its
+                intersections or the edges next to them. No other player's frontiers changed.
+                """
+                self.refreshEdges([pieceId], range(1, self.numPlayers + 1))
+                for vertex in self.topology.edges[pieceId]:
+                    if not self.bitBoard.isConnected(vertex, playerNum):
+                        self.roadVertices[playerNum - 1].discard(vertex)
+                        self.settlementFrontiers[playerNum - 1].discard(vertex)
+                    self.refreshEdges(self.topology.vertexEdges[vertex], [playerNum])
+        self.playerScores[:] = scores
+        self.numResources[playerNum - 1] = numResources
+
+        """ The board is back in the state before the move, so query results cached then are valid again """
+        self.epoch = epoch
+        self.playerEpochs = playerEpochs
+
+    """ Recompute whether intersections are blocked, and whether they are in each player's settlement frontier """
+    def refreshVertices(self, vertices):
+        for vertex in vertices:
+            if self.bitBoard.legalPlacement(vertex):
+                self.blockedVertices.discard(vertex)
+            else:
+                self.blockedVertices.add(vertex)
+            for i in range(self.numPlayers):
+                if vertex in self.roadVertices[i] and vertex not in self.blockedVertices:
+                    self.settlementFrontiers[i].add(vertex)
+                else:
+                    self.settlementFrontiers[i].discard(vertex)
+
+    """ Recompute whether edges are in the road frontier of each of the specified players """
+    def refreshEdges(self, edges, playerNums):
+        for playerNum in playerNums:
+            extendableVertices = self.bitBoard.getExtendableVertices(playerNum)
+            for edge in edges:
+                if self.edgeOwners[edge] == 0 and self.topology.edgeVertexMasks[edge] & extendableVertices != 0:
+                    self.roadFrontiers[playerNum - 1].add(edge)
+                else:
+                    self.roadFrontiers[playerNum - 1].discard(edge)
 
     """ Set up all of the resource tiles on the Catan game board """
     def initTiles(self):
-        """ Create Hexagon objects for each Hexagon on the Catan board and put them in a random order """
-        self.tiles.append(Hexagon.Hexagon("desert"))
+        """ Create a list of the type of each Hexagon on the Catan board and put them in a random order """
+        hexTypes = ["desert"]
         for _ in range(3):
-            self.tiles.append(Hexagon.Hexagon("ore"))
+            hexTypes.append("ore")
         for _ in range(3):
-            self.tiles.append(Hexagon.Hexagon("brick"))
+            hexTypes.append("brick")
         for _ in range(4):
-            self.tiles.append(Hexagon.Hexagon("sheep"))
+            hexTypes.append("sheep")
         for _ in range(4):
-            self.tiles.append(Hexagon.Hexagon("wheat"))
+            hexTypes.append("wheat")
         for _ in range(4):
-            self.tiles.append(Hexagon.Hexagon("wood"))
-        shuffle(self.tiles)
-
-        """ 
-        Assign locations of the center of each Hexagon on the Catan board, 
-        starting at the top and moving counter-clockwise toward the center 
-        """
-        self.hexCenters.append(Point.Point(self.centerX, self.centerY - 2 * self.height * 2))
-        self.hexCenters.append(
-            Point.Point(self.centerX - (self.width + self.smallWidth), self.centerY - 3 * self.height))
-        self.hexCenters.append(
-            Point.Point(self.centerX - (self.width * 2 + self.smallWidth * 2), self.centerY - self.height * 2))
-        self.hexCenters.append(Point.Point(self.centerX - (self.width * 2 + self.smallWidth * 2), self.centerY))
-        self.hexCenters.append(
-            Point.Point(self.centerX - (self.width * 2 + self.smallWidth * 2), self.centerY + self.height * 2))
-        self.hexCenters.append(
-            Point.Point(self.centerX - (self.width + self.smallWidth), self.centerY + 3 * self.height))
-        self.hexCenters.append(Point.Point(self.centerX, self.centerY + 2 * self.height * 2))
-        self.hexCenters.append(
-            Point.Point(self.centerX + (self.width + self.smallWidth), self.centerY + 3 * self.height))
-        self.hexCenters.append(
-            Point.Point(self.centerX + (self.width * 2 + self.smallWidth * 2), self.centerY + self.height * 2))
-        self.hexCenters.append(Point.Point(self.centerX + (self.width * 2 + self.smallWidth * 2), self.centerY))
-        self.hexCenters.append(
-            Point.Point(self.centerX + (self.width * 2 + self.smallWidth * 2), self.centerY - self.height * 2))
-        self.hexCenters.append(
-            Point.Point(self.centerX + (self.width + self.smallWidth), self.centerY - 3 * self.height))
-        self.hexCenters.append(Point.Point(self.centerX, self.centerY - self.height * 2))
-        self.hexCenters.append(Point.Point(self.centerX - (self.width + self.smallWidth), self.centerY - self.height))
-        self.hexCenters.append(Point.Point(self.centerX - (self.width + self.smallWidth), self.centerY + self.height))
-        self.hexCenters.append(Point.Point(self.centerX, self.centerY + self.height * 2))
-        self.hexCenters.append(Point.Point(self.centerX + (self.width + self.smallWidth), self.centerY + self.height))
-        self.hexCenters.append(Point.Point(self.centerX + (self.width + self.smallWidth), self.centerY - self.height))
-        self.hexCenters.append(Point.Point(self.centerX, self.centerY))
+            hexTypes.append("wood")
+        self.randomGenerator.shuffle(hexTypes)
 
-        """
-        Assign numbers to each Hexagon on the Catan board, except for the desert
-        which initially contains the robber instead of a number
-        """
+        """ Assign the numbers to the hexagons in order, skipping the desert """
+        numbers = []
         counter = 0
-        for i in range(len(self.tiles)):
-            self.tiles[i].setLocation(self.hexCenters[i])
-            if self.tiles[i].hexType != "desert":
-                self.tiles[i].setNumber(self.hexNumbers[counter])
+        for hexType in hexTypes:
+            if hexType != "desert":
+                numbers.append(self.hexNumbers[counter])
                 counter = counter + 1
             else:
-                self.robberLocation = self.tiles[i].location
-
-        """ Assign the location of each intersection at the edge of a hexagon """
-        for i in range(len(self.hexCenters)):
-            self.hexIntersections.append(Point.Point(self.hexCenters[i].x + self.width, self.hexCenters[i].y))
-            self.hexIntersections.append(Point.Point(self.hexCenters[i].x - self.width, self.hexCenters[i].y))
-            self.hexIntersections.append(
-                Point.Point(self.hexCenters[i].x + self.smallWidth, self.hexCenters[i].y + self.height))
-            self.hexIntersections.append(
-                Point.Point(self.hexCenters[i].x - self.smallWidth, self.hexCenters[i].y + self.height))
-            self.hexIntersections.append(
-                Point.Point(self.hexCenters[i].x + self.smallWidth, self.hexCenters[i].y - self.height))
-            self.hexIntersections.append(
-                Point.Point(self.hexCenters[i].x - self.smallWidth, self.hexCenters[i].y - self.height))
-
-        """ Remove duplicates by converting to a Python set and back to a list """
-        self.hexIntersections = [*set(self.hexIntersections)]
+                numbers.append(0)
+        self.setTiles(hexTypes, numbers)
+
+    """
+    Place a hexagon of each specified type with each specified number, in order of hexagon id.
+    Used to set up a random board and to restore the layout of a recorded game.
+    """
+    def setTiles(self, hexTypes, numbers):
+        self.setLayout(self.layout.withTiles(hexTypes, numbers))
 
     """ Set up all of the ports on the Catan game board """
     def initPorts(self):
-        """ Create Port objects for each Port on the Catan board and put them in a random order """
+        """ Create a list of the type of each Port on the Catan board and put them in a random order """
+        portTypes = []
         for _ in range(4):
-            self.ports.append(Port.Port("general"))
-        self.ports.append(Port.Port("brick"))
-        self.ports.append(Port.Port("ore"))
-        self.ports.append(Port.Port("sheep"))
-        self.ports.append(Port.Port("wheat"))
-        self.ports.append(Port.Port("wood"))
-
-        shuffle(self.ports)
-
-        """ Assign locations of the each Port on the Catan board """
-        self.portPoint1Locations.append(Point.Point(self.centerX - self.smallWidth, self.centerY + 5 * self.height))
-        self.portPoint2Locations.append(Point.Point(self.centerX + self.smallWidth, self.centerY + 5 * self.height))
-
-        self.portPoint1Locations.append(
-            Point.Point(self.centerX - (self.width + self.smallWidth * 2), self.centerY + 2 * self.height * 2))
-        self.portPoint2Locations.append(
-            Point.Point(self.centerX - (self.width * 2 + self.smallWidth), self.centerY + 3 * self.height))
-
-        self.portPoint1Locations.append(
-            Point.Point(self.centerX - (3 * self.width + self.smallWidth * 2), self.centerY))
-        self.portPoint2Locations.append(
-            Point.Point(self.centerX - (self.width * 2 + 3 * self.smallWidth), self.centerY + self.height))
-
-        self.portPoint1Locations.append(
-            Point.Point(self.centerX - (3 * self.width + self.smallWidth * 2), self.centerY - self.height * 2))
-        self.portPoint2Locations.append(
-            Point.Point(self.centerX - (self.width * 2 + 3 * self.smallWidth), self.centerY - 3 * self.height))
-
-        self.portPoint1Locations.append(
-            Point.Point(self.centerX - (self.width + self.smallWidth * 2), self.centerY - 2 * self.height * 2))
-        self.portPoint2Locations.append(Point.Point(self.centerX - self.width, self.centerY - 2 * self.height * 2))
-
-        self.portPoint1Locations.append(
-            Point.Point(self.centerX + self.width + self.smallWidth * 2, self.centerY - 2 * self.height * 2))
-        self.portPoint2Locations.append(Point.Point(self.centerX + self.width, self.centerY - 2 * self.height * 2))
-
-        self.portPoint1Locations.append(
-            Point.Point(self.centerX + (3 * self.width + self.smallWidth * 2), self.centerY - self.height * 2))
-        self.portPoint2Locations.append(
-            Point.Point(self.centerX + (self.width * 2 + 3 * self.smallWidth), self.centerY - 3 * self.height))
-
-        self.portPoint1Locations.append(
-            Point.Point(self.centerX + (3 * self.width + self.smallWidth * 2), self.centerY))
-        self.portPoint2Locations.append(
-            Point.Point(self.centerX + (self.width * 2 + 3 * self.smallWidth), self.centerY + self.height))
-
-        self.portPoint1Locations.append(
-            Point.Point(self.centerX + (self.width + self.smallWidth * 2), self.centerY + 2 * self.height * 2))
-        self.portPoint2Locations.append(
-            Point.Point(self.centerX + (self.width * 2 + self.smallWidth), self.centerY + 3 * self.height))
-
-        for i in range(len(self.ports)):
-            self.ports[i].setPortLocations(
-                DoublePoint.DoublePoint(self.portPoint1Locations[i], self.portPoint2Locations[i]))
+            portTypes.append("general")
+        portTypes.append("brick")
+        portTypes.append("ore")
+        portTypes.append("sheep")
+        portTypes.append("wheat")
+        portTypes.append("wood")
+
+        self.randomGenerator.shuffle(portTypes)
+        self.setPorts(portTypes)
+
+    """ Place a port of each specified type, in the fixed order of the port locations """
+    def setPorts(self, portTypes):
+        self.setLayout(self.layout.withPorts(portTypes))
+
+    """
+    Use a layout for the tiles and ports of the board, sharing it with any other board that uses it.
+    Called while the board is set up, before any piece is placed, so the robber starts in the desert.
+    """
+    def setLayout(self, layout):
+        self.useLayout(layout)
+        self.hexYields = [[0] * self.numPlayers for _ in range(len(layout.tiles))]
+        for tile in layout.tiles:
+            if tile.hexType == "desert":
+                self.setRobberLocation(tile.location)
+        self.markChanged(range(1, self.numPlayers + 1))
+
+    """ Point the shortcuts to the tables of the layout (such as self.tiles) at the tables of a layout """
+    def useLayout(self, layout):
+        self.layout = layout
+        self.tiles = layout.tiles
+        self.hexCenters = layout.hexCenters
+        self.hexIntersections = layout.hexIntersections
+        self.vertexTiles = layout.vertexTiles
+        self.numberHexes = layout.numberHexes
+        self.ports = layout.ports
+        self.portPoint1Locations = layout.portPoint1Locations
+        self.portPoint2Locations = layout.portPoint2Locations
+        self.vertexPortTypes = layout.vertexPortTypes
 
     """ Return the tile at the specified location, or -1 if not found """
     def findHexIndex(self, point):
-
-        for i in range(len(self.tiles)):
-            if point == self.tiles[i].location:
-                return i
-        return -1
+        return self.topology.findHex(point)
 
     """
     Return the index of the settlement at the specified location, or -1 if not found. 
     If playerNum is not -1, only return a settlement index for the specified player.
     """
     def findSettlementIndex(self, point, playerNum):
-        for i in range(len(self.settlements)):
-            for j in range(len(self.settlements[i])):
-                if (point == self.settlements[i][j].location and
-                        (playerNum == -1 or self.settlements[i][j].playerNum == playerNum)):
-                    return j
-        return -1
+        return self.findBuildingIndex(point, playerNum, "settlement", self.settlements)
 
     """
     Return the index of the city at the specified location, or -1 if not found. 
     If playerNum is not -1, only return a city index for the specified player.
     """
     def findCityIndex(self, point, playerNum):
-        for i in range(len(self.cities)):
-            for j in range(len(self.cities[i])):
-                if (point == self.cities[i][j].location and
-                        (playerNum == -1 or self.cities[i][j].playerNum == playerNum)):
-                    return j
+        return self.findBuildingIndex(point, playerNum, "city", self.cities)
+
+    """
+    Use the occupancy index to find the building of the specified kind at a location, and return
+    its index within its owner's list of buildings, or -1 if there is no such building
+    """
+    def findBuildingIndex(self, point, playerNum, buildingType, buildings):
+        vertex = self.topology.findVertex(point)
+        if vertex == -1 or self.vertexBuildings[vertex] != buildingType:
+            return -1
+        owner = self.vertexOwners[vertex]
+        if playerNum != -1 and owner != playerNum:
+            return -1
+        for i in range(len(buildings[owner - 1])):
+            if buildings[owner - 1][i].location == point:
+                return i
         return -1
 
     """
@@ -351,151 +847,82 @@ class Board:
     """
     def findRoadIndex(self, point1, point2, playerNum):
         """
-        Return the road connecting the specified locations, or -1 if not found
+        Use the road index to find the owner of the road connecting the specified locations,
+        and return the index of the road within the owner's list of roads, or -1 if not found
         """
-        for i in range(len(self.roads)):
-            for j in range(len(self.roads[i])):
-                if ((point1 == self.roads[i][j].location1 and point2 == self.roads[i][j].location2)
-                        or (point1 == self.roads[i][j].location2 and point2 == self.roads[i][j].location1)
-                        and (playerNum == -1 or self.roads[i][j].playerNum == playerNum)):
-                    return j
+        edge = self.topology.findEdge(point1, point2)
+        if edge == -1 or self.edgeOwners[edge] == 0:
+            return -1
+        owner = self.edgeOwners[edge]
+        if playerNum != -1 and owner != playerNum:
+            return -1
+        for i in range(len(self.roads[owner - 1])):
+            if self.topology.findEdge(self.roads[owner - 1][i].location1, self.roads[owner - 1][i].location2) == edge:
+                return i
         return -1
 
     """ Return True if the two points are adjacent to each other or False if they are not """
     def isAdjacent(self, point1, point2):
-
-        distance = sqrt((point2.x - point1.x) ** 2 + (point2.y - point1.y) ** 2)
-        if abs(distance - self.smallWidth * 2) < 2:
-            return True
-        else:
+        vertex1 = self.topology.findVertex(point1)
+        if vertex1 == -1:
             return False
+        return self.topology.findVertex(point2) in self.topology.vertexNeighbors[vertex1]
 
     """ Return the type of port at a specified location, or a blank string if the location is not at a port """
     def getPortType(self, point):
-        for i in range(len(self.ports)):
-            if point == self.ports[i].portLocations.p1 or point == self.ports[i].portLocations.p2:
-                return self.ports[i].portType
-        return ""
+        vertex = self.topology.findVertex(point)
+        if vertex == -1:
+            return ""
+        return self.vertexPortTypes[vertex]
 
     """
     Create a list of every point adjacent to an intersection (should not include the point itself),
     for the purpose of determining where a settlement or a road can be built
     """
     def getAdjacentIntersections(self, point):
-        adjacentPoints = []
+        vertex = self.topology.findVertex(point)
+        if vertex != -1:
+            return list(self.topology.vertexNeighborPoints[vertex])
 
-        for i in range(len(self.hexIntersections)):
-            if point != self.hexIntersections[i] and Board.isAdjacent(self, self.hexIntersections[i], point):
-                adjacentPoints.append(self.hexIntersections[i])
-        return adjacentPoints
+        """ The center of a hexagon is adjacent to the intersections at its corners """
+        hexId = self.topology.findHex(point)
+        if hexId != -1:
+            return list(self.topology.hexVertexPoints[hexId])
+        return []
 
     """
     Create a list of every hexagon adjacent to an intersection, 
     for the purpose of determining which tiles to collect resources from
     """
     def getAdjacentHexes(self, point):
-        myHexes = []
-        myInts = [Board.findHexIndex(self, Point.Point(point.x + self.width, point.y)),
-                  Board.findHexIndex(self, Point.Point(point.x - self.width, point.y)),
-                  Board.findHexIndex(self, Point.Point(point.x + self.smallWidth, point.y + self.height)),
-                  Board.findHexIndex(self, Point.Point(point.x + self.smallWidth, point.y - self.height)),
-                  Board.findHexIndex(self, Point.Point(point.x + self.smallWidth, point.y + self.height)),
-                  Board.findHexIndex(self, Point.Point(point.x + self.smallWidth, point.y - self.height))]
-
-        for i in range(6):
-            if myInts[i] != -1:
-                myHexes.append(self.tiles[i])
-
-        return myHexes
+        vertex = self.topology.findVertex(point)
+        if vertex == -1:
+            return []
+        return list(self.vertexTiles[vertex])
 
     """
     Determine whether an intersection is connected to a player's road network
     """
     def isConnected(self, point, playerNum):
-        for i in range(len(self.roads[playerNum - 1])):
-            if self.roads[playerNum - 1][i].location1 == point or self.roads[playerNum - 1][i].location2 == point:
-                return True
-        return False
+        vertex = self.topology.findVertex(point)
+        return vertex != -1 and self.bitBoard.isConnected(vertex, playerNum)
 
     """
     Determine whether an intersection is legal for placing a settlement
     (no settlements or cities at the intersection or any adjacent intersections)
     """
     def legalPlacement(self, point):
-        isHexLegal = True
-
-        if Board.findSettlementIndex(self, point, -1) != -1 or Board.findCityIndex(self, point, -1) != -1:
-            isHexLegal = False
-        adjacentHexes = Board.getAdjacentIntersections(self, point)
-        for i in range(len(adjacentHexes)):
-            if (Board.findSettlementIndex(self, adjacentHexes[i], -1) != -1
-                    or Board.findCityIndex(self, adjacentHexes[i], -1) != -1):
-                isHexLegal = False
-        return isHexLegal
+        vertex = self.topology.findVertex(point)
+        return vertex != -1 and vertex not in self.blockedVertices
 
     """ Return a list of possible locations for a player to build a city (replaces a settlement) """
     def getPossibleCityLocations(self, playerNum):
-        possibleCityLocations = []
-        for i in range(len(self.settlements[playerNum - 1])):
-            possibleCityLocations.append(self.settlements[playerNum - 1][i].location)
-        return possibleCityLocations
+        return [self.hexIntersections[vertex] for vertex in sorted(self.cityFrontiers[playerNum - 1])]
 
     """ Return a list of possible locations for a player to build a settlement """
     def getPossibleSettlementLocations(self, playerNum):
-        playerRoadPoints = []
-        possibleSettleLocations = []
-
-        """ Create a list of all locations currently connected to the player's roads """
-        for i in range(len(self.roads[playerNum - 1])):
-            playerRoadPoints.append(self.roads[playerNum - 1][i].location1)
-            playerRoadPoints.append(self.roads[playerNum - 1][i].location2)
-
-        """ Remove duplicates by converting to a Python set and back to a list """
-        playerRoadPoints = [*set(playerRoadPoints)]
-
-        """ Include only locations where a settlement can be legally placed """
-        for i in range(len(playerRoadPoints)):
-            if self.legalPlacement(playerRoadPoints[i]):
-                possibleSettleLocations.append(playerRoadPoints[i])
-
-        return possibleSettleLocations
+        return [self.hexIntersections[vertex] for vertex in sorted(self.settlementFrontiers[playerNum - 1])]
 
     """ Return a list of possible locations for a player to build a road """
     def getPossibleRoadLocations(self, playerNum):
-        tempRoadPoints = []
-        playerRoadPoints = []
-        allRoadLocations = []
-        possibleRoadLocations = []
-
-        """ Create a list of all locations currently connected to the player's roads """
-        for i in range(len(self.roads[playerNum - 1])):
-            tempRoadPoints.append(self.roads[playerNum - 1][i].location1)
-            tempRoadPoints.append(self.roads[playerNum - 1][i].location2)
-
-        """ Remove duplicates by converting to a Python set and back to a list """
-        tempRoadPoints = [*set(tempRoadPoints)]
-
-        """ Only keep points not occupied by an opposing player's settlement or city """
-        for i in range(len(tempRoadPoints)):
-            mySettlementIndex = self.findSettlementIndex(tempRoadPoints[i], playerNum)
-            myCityIndex = self.findCityIndex(tempRoadPoints[i], playerNum)
-            anySettlementIndex = self.findSettlementIndex(tempRoadPoints[i], -1)
-            anyCityIndex = self.findCityIndex(tempRoadPoints[i], -1)
-
-            if ((mySettlementIndex != -1 or anySettlementIndex == -1)
-                    and (myCityIndex != -1 or anyCityIndex == -1)):
-                playerRoadPoints.append(tempRoadPoints[i])
-
-        """ Create a list of possible roads, removing any for which the road already exists """
-        for i in range(len(playerRoadPoints)):
-            neighbors = self.getAdjacentIntersections(playerRoadPoints[i])
-            for j in range(len(neighbors)):
-                if self.findRoadIndex(playerRoadPoints[i], neighbors[j], -1) == -1:
-                    allRoadLocations.append(DoublePoint.DoublePoint(playerRoadPoints[i], neighbors[j]))
-
-        """ Remove duplicates """
-        for roadLocation in allRoadLocations:
-            if roadLocation not in possibleRoadLocations:
-                possibleRoadLocations.append(roadLocation)
-
-        return possibleRoadLocations
+        return [self.topology.edgePoints[edge] for edge in sorted(self.roadFrontiers[playerNum - 1])]
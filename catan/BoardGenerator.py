@@ -0,0 +1,254 @@
+"""
+Generates balanced board layouts in large batches with NumPy, by rejection sampling: each batch shuffles
+the tiles, the numbers and the ports of many boards at once, checks every fairness constraint on the
+whole batch with array operations, and keeps the boards that pass. The constraints are:
+    no 6 or 8 next to another 6 or 8 (separateRedNumbers)
+    no group of more than maxClusterSize connected tiles of the same resource
+    the average number of ways to roll each resource, per tile of that resource, within pipTolerance
+    of the average over every tile with a number
+Unlike Board.initTiles, which always places the numbers in the same order, the numbers are shuffled too.
+The layouts can be written to a BoardPool file, which games and workers draw from without generating
+anything. Run from the root of the project, for example:
+python -m catan.BoardGenerator --boards 1000000 --output boards.catanpool
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+from catan import Topology
+from catan.BoardPool import BoardPool
+from catan.ReplayCodec import ReplayCodec
+from argparse import ArgumentParser
+from itertools import combinations
+from time import perf_counter
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class BoardGenerator:
+    """ The tiles, numbers and ports of every board, which are shuffled for each new board """
+    hexTypes = ["desert"] + ["ore"] * 3 + ["brick"] * 3 + ["sheep"] * 4 + ["wheat"] * 4 + ["wood"] * 4
+    hexNumbers = [5, 2, 6, 3, 8, 10, 9, 12, 11, 4, 8, 10, 9, 4, 5, 6, 3, 11]
+    portTypes = ["general"] * 4 + ["brick", "ore", "sheep", "wheat", "wood"]
+
+    """ Number of ways to roll each number with 2 dice """
+    pips = [0, 0, 1, 2, 3, 4, 5, 0, 5, 4, 3, 2, 1]
+
+    """
+    seed sets the stream of random numbers (randomly seeded if not specified), and batchSize is the
+    number of boards shuffled and checked at once
+    """
+    def __init__(self, seed=None, separateRedNumbers=True, maxClusterSize=2, pipTolerance=0.75, batchSize=65536):
+        self.randomGenerator = numpy.random.default_rng(seed)
+        self.separateRedNumbers = separateRedNumbers
+        self.maxClusterSize = maxClusterSize
+        self.pipTolerance = pipTolerance
+        self.batchSize = batchSize
+        self.numGenerated = 0
+        self.numAccepted = 0
+
+        """ Codes of the resource tiles and ports, using the codes of the ReplayCodec class """
+        self.desertCode = ReplayCodec.hexTypes.index("desert")
+        self.resourceCodes = numpy.array([ReplayCodec.hexTypes.index(hexType) for hexType in BoardGenerator.hexTypes
+                                          if hexType != "desert"], dtype=numpy.uint8)
+        self.resourceCounts = numpy.bincount(self.resourceCodes, minlength=len(ReplayCodec.hexTypes))
+        self.portCodes = numpy.array([ReplayCodec.portTypes.index(portType)
+                                      for portType in BoardGenerator.portTypes], dtype=numpy.uint8)
+
+        """ The 6s and 8s, the other numbers, and the average number of ways to roll the number of a tile """
+        self.redNumbers = numpy.array([number for number in BoardGenerator.hexNumbers if number in (6, 8)],
+                                      dtype=numpy.uint8)
+        self.otherNumbers = numpy.array([number for number in BoardGenerator.hexNumbers if number not in (6, 8)],
+                                        dtype=numpy.uint8)
+        self.pipTable = numpy.array(BoardGenerator.pips, dtype=numpy.float64)
+        self.averagePips = self.pipTable[BoardGenerator.hexNumbers].mean()
+
+        """
+        The pairs of hexagons next to each other, and the incidence matrix of the pairs, which counts the
+        pairs that include each hexagon
+        """
+        topology = Topology.Topology.getShared()
+        centers = topology.hexCenters
+        numHexes = len(centers)
+        pairs = [(a, b) for a in range(numHexes) for b in range(a + 1, numHexes)
+                 if (abs(centers[a].x - centers[b].x), abs(centers[a].y - centers[b].y)) in ((3, 1), (0, 2))]
+        self.firstHexes = numpy.array([pair[0] for pair in pairs], dtype=numpy.intp)
+        self.secondHexes = numpy.array([pair[1] for pair in pairs], dtype=numpy.intp)
+        self.incidence = numpy.zeros((len(pairs), numHexes), dtype=numpy.float32)
+        self.incidence[numpy.arange(len(pairs)), self.firstHexes] = 1
+        self.incidence[numpy.arange(len(pairs)), self.secondHexes] = 1
+
+        """
+        Every placement of the desert and of the 6s and 8s, skipping the placements with a 6 or 8 next to
+        another 6 or 8 if they must be separate. Each placement is reached by the same number of ways to
+        shuffle the tiles and numbers, so choosing one of them at random and shuffling the rest around it
+        gives the same boards as shuffling everything and rejecting the boards with red numbers together,
+        without shuffling any board that would be rejected.
+        """
+        adjacent = numpy.zeros((numHexes, numHexes), dtype=bool)
+        adjacent[self.firstHexes, self.secondHexes] = True
+        adjacent[self.secondHexes, self.firstHexes] = True
+        redHexes = numpy.array(list(combinations(range(numHexes), len(self.redNumbers))), dtype=numpy.intp)
+        if separateRedNumbers:
+            for first, second in combinations(range(len(self.redNumbers)), 2):
+                redHexes = redHexes[~adjacent[redHexes[:, first], redHexes[:, second]]]
+        deserts = numpy.repeat(numpy.arange(numHexes, dtype=numpy.intp), len(redHexes))
+        redHexes = numpy.tile(redHexes, (numHexes, 1))
+        usable = ~(redHexes == deserts[:, None]).any(axis=1)
+        self.placementDeserts = deserts[usable]
+        self.placementRedHexes = redHexes[usable]
+
+    """ Determine whether NumPy is installed, so that boards can be generated """
+    @staticmethod
+    def isAvailable():
+        return numpy is not None
+
+    """
+    Return the records of numBoards balanced boards, as an array with one row of BoardPool.recordSize
+    bytes per board
+    """
+    def generate(self, numBoards):
+        batches = []
+        numFound = 0
+        while numFound < numBoards:
+            batch = self.generateBatch()
+            batches.append(batch)
+            numFound += len(batch)
+        return numpy.concatenate(batches)[:numBoards]
+
+    """ Return a random permutation of a list of values for each of numRows rows """
+    def shuffleRows(self, values, numRows):
+        return values[self.randomGenerator.random((numRows, len(values))).argsort(axis=1)]
+
+    """
+    Shuffle a batch of boards, and return the records of the boards that meet every constraint.
+    The tiles are shuffled first, and the numbers are only shuffled for the boards whose tiles meet
+    the cluster constraint.
+    """
+    def generateBatch(self):
+        size = self.batchSize
+        placements = self.randomGenerator.integers(len(self.placementDeserts), size=size)
+        deserts = self.placementDeserts[placements]
+        redHexes = self.placementRedHexes[placements]
+
+        """ Place the desert, then the shuffled resource tiles on the other hexagons in order """
+        rows = numpy.arange(size)
+        others = numpy.ones((size, len(BoardGenerator.hexTypes)), dtype=bool)
+        others[rows, deserts] = False
+        hexCodes = numpy.full(others.shape, self.desertCode, dtype=numpy.uint8)
+        hexCodes[others] = self.shuffleRows(self.resourceCodes, size).ravel()
+
+        accepted = self.hasSmallClusters(hexCodes)
+        hexCodes = hexCodes[accepted]
+        others = others[accepted]
+        redHexes = redHexes[accepted]
+
+        """ Place the shuffled 6s and 8s on their hexagons, then the other numbers on the rest in order """
+        rows = numpy.arange(len(hexCodes))[:, None]
+        numbers = numpy.zeros(hexCodes.shape, dtype=numpy.uint8)
+        numbers[rows, redHexes] = self.shuffleRows(self.redNumbers, len(hexCodes))
+        others[rows, redHexes] = False
+        numbers[others] = self.shuffleRows(self.otherNumbers, len(hexCodes)).ravel()
+
+        accepted = self.hasBalancedPips(hexCodes, numbers)
+        hexCodes = hexCodes[accepted]
+        numbers = numbers[accepted]
+        portCodes = self.shuffleRows(self.portCodes, len(hexCodes))
+        self.numGenerated += size
+        self.numAccepted += len(hexCodes)
+        return numpy.concatenate((hexCodes, numbers, portCodes), axis=1)
+
+    """
+    Return whether each board in a batch of hexagon codes and numbers meets every constraint, for
+    checking boards that were not made by generateBatch
+    """
+    def isBalanced(self, hexCodes, numbers):
+        accepted = self.hasSmallClusters(hexCodes) & self.hasBalancedPips(hexCodes, numbers)
+        if self.separateRedNumbers:
+            red = (numbers == 6) | (numbers == 8)
+            accepted &= ~(red[:, self.firstHexes] & red[:, self.secondHexes]).any(axis=1)
+        return accepted
+
+    """ Return whether each board in a batch has no resource with too many or too few pips per tile """
+    def hasBalancedPips(self, hexCodes, numbers):
+        numBoards = len(hexCodes)
+        if self.pipTolerance is None:
+            return numpy.ones(numBoards, dtype=bool)
+
+        """ Add up the pips of each type of tile on each board in a single pass """
+        numTypes = len(self.resourceCounts)
+        keys = hexCodes + numpy.arange(numBoards, dtype=numpy.intp)[:, None] * numTypes
+        typePips = numpy.bincount(keys.ravel(), weights=self.pipTable[numbers].ravel(),
+                                  minlength=numBoards * numTypes).reshape(numBoards, numTypes)
+        resources = self.resourceCounts > 0
+        averagePips = typePips[:, resources] / self.resourceCounts[resources]
+        return (numpy.abs(averagePips - self.averagePips) <= self.pipTolerance).all(axis=1)
+
+    """ Return whether each board in a batch has no group of connected tiles of a resource that is too large """
+    def hasSmallClusters(self, hexCodes):
+        numBoards, numHexes = hexCodes.shape
+        if self.maxClusterSize >= self.resourceCounts.max():
+            return numpy.ones(numBoards, dtype=bool)
+        sameType = ((hexCodes[:, self.firstHexes] == hexCodes[:, self.secondHexes])
+                    & (hexCodes[:, self.firstHexes] != self.desertCode))
+
+        """
+        A group of 3 or more connected tiles always has a tile next to 2 others, so groups of at most 2
+        tiles only need the number of neighbors of each tile with the same resource
+        """
+        if self.maxClusterSize <= 2:
+            sameNeighbors = sameType.astype(numpy.float32) @ self.incidence
+            return sameNeighbors.max(axis=1) <= self.maxClusterSize - 1
+
+        """
+        Otherwise label every group of connected tiles with the lowest hexagon id in the group, by
+        repeatedly giving both tiles of each pair of neighbors with the same resource the lower of their
+        labels. A group has at most 4 tiles, so 3 passes over the pairs reach every tile in it.
+        """
+        labels = numpy.tile(numpy.arange(numHexes, dtype=numpy.intp), (numBoards, 1))
+        for _ in range(3):
+            for i in range(len(self.firstHexes)):
+                first = labels[:, self.firstHexes[i]]
+                second = labels[:, self.secondHexes[i]]
+                lowest = numpy.where(sameType[:, i], numpy.minimum(first, second), first)
+                labels[:, self.firstHexes[i]] = lowest
+                labels[:, self.secondHexes[i]] = numpy.where(sameType[:, i], lowest, second)
+
+        """ Count the tiles with each label on each board """
+        boardOffsets = numpy.arange(numBoards, dtype=numpy.intp)[:, None] * numHexes
+        groupSizes = numpy.bincount((labels + boardOffsets).ravel(), minlength=numBoards * numHexes)
+        return groupSizes.reshape(numBoards, numHexes).max(axis=1) <= self.maxClusterSize
+
+    """ Return the fraction of the boards shuffled so far that met every constraint """
+    def getAcceptanceRate(self):
+        if self.numGenerated == 0:
+            return 0.0
+        return self.numAccepted / self.numGenerated
+
+def main():
+    parser = ArgumentParser(description="Generate balanced Settlers of Catan boards and write them to a pool")
+    parser.add_argument("--boards", type=int, default=100000, help="number of boards to generate")
+    parser.add_argument("--output", required=True, help="board pool file to write")
+    parser.add_argument("--seed", type=int, help="seed of the random numbers (random if not specified)")
+    parser.add_argument("--max-cluster", type=int, default=2,
+                        help="largest group of connected tiles of the same resource")
+    parser.add_argument("--pip-tolerance", type=float, default=0.75,
+                        help="largest difference of each resource's average pips from the average of every tile")
+    parser.add_argument("--allow-adjacent-red", action="store_true", help="allow a 6 or 8 next to a 6 or 8")
+    args = parser.parse_args()
+
+    if not BoardGenerator.isAvailable():
+        print("NumPy is required to generate boards")
+        return
+    generator = BoardGenerator(args.seed, not args.allow_adjacent_red, args.max_cluster, args.pip_tolerance)
+    startTime = perf_counter()
+    records = generator.generate(args.boards)
+    elapsed = perf_counter() - startTime
+    BoardPool.save(args.output, records.tobytes())
+    print("Generated", len(records), "boards in %.2f seconds (%.0f boards/minute, %.1f%% accepted)"
+          % (elapsed, len(records) / elapsed * 60, generator.getAcceptanceRate() * 100))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Immutable layout of a Settlers of Catan board: the type and number of each tile, the type of each port,
+and the tables derived from them (the tiles next to each intersection, the hexagons with each number and
+the port next to each intersection). A layout never changes once it is created, so the Board of a game,
+its clones and snapshots, and every player share a single layout by reference, and only the pieces,
+the robber and the resources are copied or changed. Every table is a tuple, and setting an attribute
+raises an error, so a player cannot change the layout by accident.
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+from catan import DoublePoint
+from catan import Hexagon
+from catan import Point
+from catan import Port
+from catan import Topology
+
+class BoardLayout:
+    __slots__ = ("topology", "hexTypes", "numbers", "portTypes", "tiles", "hexCenters", "hexIntersections",
+                 "vertexTiles", "numberHexes", "portPoint1Locations", "portPoint2Locations", "ports",
+                 "vertexPortTypes")
+
+    """ The layout with no tiles and no ports, shared by every Board before it is set up """
+    emptyLayout = None
+
+    """
+    Create the layout with a hexagon of each specified type with each specified number, in order of
+    hexagon id, and a port of each specified type, in the fixed order of the port locations
+    """
+    def __init__(self, hexTypes=(), numbers=(), portTypes=()):
+        topology = Topology.Topology.getShared()
+        object.__setattr__(self, "topology", topology)
+        object.__setattr__(self, "hexTypes", tuple(hexTypes))
+        object.__setattr__(self, "numbers", tuple(numbers))
+        object.__setattr__(self, "portTypes", tuple(portTypes))
+
+        """
+        Create each Hexagon with its location and number, and record the hexagons with each number
+        (the desert has no number, and initially contains the robber instead)
+        """
+        tiles = []
+        numberHexes = [[] for _ in range(13)]
+        for i in range(len(hexTypes)):
+            tiles.append(Hexagon.Hexagon(hexTypes[i], topology.hexCenters[i], numbers[i]))
+            if hexTypes[i] != "desert":
+                numberHexes[numbers[i]].append(i)
+        object.__setattr__(self, "tiles", tuple(tiles))
+        object.__setattr__(self, "numberHexes", tuple([tuple(hexIds) for hexIds in numberHexes]))
+
+        """ Locations of the hexagons and intersections, and the tiles next to each intersection """
+        if len(tiles) > 0:
+            object.__setattr__(self, "hexCenters", tuple(topology.hexCenters))
+            object.__setattr__(self, "hexIntersections", tuple(topology.vertices))
+            object.__setattr__(self, "vertexTiles", tuple([tuple([tiles[hexId] for hexId in hexIds])
+                                                           for hexIds in topology.vertexHexes]))
+        else:
+            object.__setattr__(self, "hexCenters", ())
+            object.__setattr__(self, "hexIntersections", ())
+            object.__setattr__(self, "vertexTiles", ())
+
+        """ Create each Port with its type and location, and record the type of port next to each intersection """
+        portPoint1Locations = []
+        portPoint2Locations = []
+        ports = []
+        if len(portTypes) > 0:
+            for portCoordinates in topology.portCoordinates:
+                portPoint1Locations.append(Point.Point(portCoordinates[0][0], portCoordinates[0][1]))
+                portPoint2Locations.append(Point.Point(portCoordinates[1][0], portCoordinates[1][1]))
+            for i in range(len(portTypes)):
+                ports.append(Port.Port(portTypes[i], DoublePoint.DoublePoint(portPoint1Locations[i],
+                                                                             portPoint2Locations[i])))
+            vertexPortTypes = tuple(["" if portIndex == -1 else ports[portIndex].portType
+                                     for portIndex in topology.vertexPorts])
+        else:
+            vertexPortTypes = ()
+        object.__setattr__(self, "portPoint1Locations", tuple(portPoint1Locations))
+        object.__setattr__(self, "portPoint2Locations", tuple(portPoint2Locations))
+        object.__setattr__(self, "ports", tuple(ports))
+        object.__setattr__(self, "vertexPortTypes", vertexPortTypes)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("BoardLayout objects are immutable")
+
+    def __reduce__(self):
+        return BoardLayout, (self.hexTypes, self.numbers, self.portTypes)
+
+    """ Return the layout with no tiles and no ports, created the first time it is requested """
+    @staticmethod
+    def getEmpty():
+        if BoardLayout.emptyLayout is None:
+            BoardLayout.emptyLayout = BoardLayout()
+        return BoardLayout.emptyLayout
+
+    """ Return a layout with the specified tiles and the ports of this layout """
+    def withTiles(self, hexTypes, numbers):
+        return BoardLayout(hexTypes, numbers, self.portTypes)
+
+    """ Return a layout with the tiles of this layout and the specified ports """
+    def withPorts(self, portTypes):
+        return BoardLayout(self.hexTypes, self.numbers, portTypes)
@@ -0,0 +1,79 @@
+"""
+A file of pre-generated board layouts, which games draw from instead of shuffling a new layout.
+The file holds the magic bytes "CATP", the format version and the number of layouts as varints,
+followed by a fixed-size record for each layout: the code of the type of each hexagon, the number of
+each hexagon (0 for the desert) and the code of the type of each port, 1 byte each, using the codes of
+the ReplayCodec class. The file is memory-mapped rather than read, so every worker process reading the
+same pool shares a single copy of it, and only the records that are drawn are ever loaded.
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+from catan import BoardLayout
+from catan.ReplayCodec import ReplayCodec
+import mmap
+
+class BoardPool:
+    magic = b"CATP"
+    version = 1
+
+    """ Number of bytes in the record of each layout: 19 hexagon types, 19 numbers and 9 port types """
+    recordSize = 47
+
+    """ Open a pool written by the save method, raising ValueError if the file is not a pool """
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as poolFile:
+            self.data = mmap.mmap(poolFile.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.data[:len(BoardPool.magic)] != BoardPool.magic:
+            raise ValueError("File is not a Catan board pool")
+        offset = len(BoardPool.magic)
+        version, offset = ReplayCodec.readVarint(self.data, offset)
+        if version != BoardPool.version:
+            raise ValueError("Unsupported Catan board pool version " + str(version))
+        self.numBoards, offset = ReplayCodec.readVarint(self.data, offset)
+        self.recordsStart = offset
+        if len(self.data) < self.recordsStart + self.numBoards * BoardPool.recordSize:
+            raise ValueError("Catan board pool is truncated")
+
+    def __len__(self):
+        return self.numBoards
+
+    """ Write the records of a list of layouts, given as one bytes-like object, to a new pool file """
+    @staticmethod
+    def save(path, records):
+        header = bytearray(BoardPool.magic)
+        ReplayCodec.writeVarint(header, BoardPool.version)
+        ReplayCodec.writeVarint(header, len(records) // BoardPool.recordSize)
+        with open(path, "wb") as poolFile:
+            poolFile.write(header)
+            poolFile.write(records)
+
+    """ Return the record of a layout with the specified hexagon types, numbers and port types """
+    @staticmethod
+    def encodeLayout(hexTypes, numbers, portTypes):
+        return bytes([ReplayCodec.hexTypes.index(hexType) for hexType in hexTypes] + list(numbers)
+                     + [ReplayCodec.portTypes.index(portType) for portType in portTypes])
+
+    """ Return the record of the layout stored in the pool at an index """
+    def getRecord(self, index):
+        start = self.recordsStart + index * BoardPool.recordSize
+        return self.data[start:start + BoardPool.recordSize]
+
+    """ Return the layout stored in the pool at an index """
+    def getLayout(self, index):
+        record = self.getRecord(index)
+        return BoardLayout.BoardLayout([ReplayCodec.hexTypes[code] for code in record[:19]], list(record[19:38]),
+                                       [ReplayCodec.portTypes[code] for code in record[38:]])
+
+    """ Return the index of a layout drawn from the pool at random, using the specified stream of random numbers """
+    def drawIndex(self, randomGenerator):
+        return randomGenerator.randrange(self.numBoards)
+
+    """ Return a layout drawn from the pool at random, using the specified stream of random numbers """
+    def drawLayout(self, randomGenerator):
+        return self.getLayout(self.drawIndex(randomGenerator))
+
+    def close(self):
+        self.data.close()
@@ -0,0 +1,49 @@
+"""
+Structure to hold the state of a Board that changes during a game: each player's pieces, frontiers,
+resource counts, development cards and scores, the occupancy and road indexes, longest road and largest
+army, the production table and the robber. The layout of the board (tiles, ports and intersections)
+never changes once the board is set up, so it is not part of a snapshot. A snapshot shares its containers
+with the board it was taken from, which copies each container before changing it, so a snapshot must be
+treated as read-only.
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+
+class BoardSnapshot:
+    __slots__ = ("settlements", "cities", "roads", "settlementFrontiers", "roadFrontiers", "cityFrontiers",
+                 "roadVertices", "numResources", "playerScores", "numDevelopmentCards", "knightsPlayed",
+                 "largestArmyOwner", "vertexOwners", "vertexBuildings", "blockedVertices", "edgeOwners",
+                 "hexYields", "production", "bitBoard", "roadComponents", "roadLengths", "longestRoadOwner",
+                 "robberLocation", "robberHex", "turnNumber", "winner", "epoch", "playerEpochs")
+
+    def __init__(self, board):
+        self.settlements = tuple(board.settlements)
+        self.cities = tuple(board.cities)
+        self.roads = tuple(board.roads)
+        self.settlementFrontiers = tuple(board.settlementFrontiers)
+        self.roadFrontiers = tuple(board.roadFrontiers)
+        self.cityFrontiers = tuple(board.cityFrontiers)
+        self.roadVertices = tuple(board.roadVertices)
+        self.numResources = tuple(board.numResources)
+        self.playerScores = tuple(board.playerScores)
+        self.numDevelopmentCards = tuple(board.numDevelopmentCards)
+        self.knightsPlayed = tuple(board.knightsPlayed)
+        self.largestArmyOwner = board.largestArmyOwner
+        self.vertexOwners = board.vertexOwners
+        self.vertexBuildings = board.vertexBuildings
+        self.blockedVertices = board.blockedVertices
+        self.edgeOwners = board.edgeOwners
+        self.hexYields = board.hexYields
+        self.production = board.production
+        self.bitBoard = board.bitBoard
+        self.roadComponents = board.roadComponents
+        self.roadLengths = board.roadLengths
+        self.longestRoadOwner = board.longestRoadOwner
+        self.robberLocation = board.robberLocation
+        self.robberHex = board.robberHex
+        self.turnNumber = board.turnNumber
+        self.winner = board.winner
+        self.epoch = board.epoch
+        self.playerEpochs = board.playerEpochs
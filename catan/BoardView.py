@@ -0,0 +1,139 @@
+"""
+A read-only view of the Board of a game, which the game gives to its players in place of the Board itself,
+so that a player cannot change the shared state of the game by accident. The view reads through to the
+board, returning numbers, strings and points as they are and the lists, sets and dictionaries of the board
+as tuples, frozen sets and read-only mappings (as are the lists, sets and dictionaries in a list, such as
+the pieces of each player). The layout of the board, which cannot be changed, and the topology, which
+describes the geometry shared by every board, are returned as they are. The objects the board uses to keep
+its state (such as its bitboard, dice and event sink) cannot be read, and players can only call the queries
+of the board. Players build their pieces with the functions the Game gives them, and try out moves on a
+copy of the board made with clone.
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+from catan import Point
+from types import MappingProxyType
+
+class BoardView:
+    """ Board methods that only read the board, or make a private copy of it, which players may call """
+    queries = frozenset(["cachedQuery", "canExtendRoad", "getOtherVertex", "getBlockedRoadVertices", "clone",
+                         "getRoadVertexMask", "findHexIndex", "findSettlementIndex", "findCityIndex",
+                         "findBuildingIndex", "findRoadIndex", "isAdjacent", "getPortType", "getAdjacentIntersections",
+                         "getAdjacentHexes", "isConnected", "legalPlacement", "getPossibleCityLocations",
+                         "getPossibleSettlementLocations", "getPossibleRoadLocations"])
+
+    """ Attributes of the board that are set with its layout, before the game starts, and never change """
+    layoutAttributes = frozenset(["numPlayers", "topology", "layout", "tiles", "hexCenters", "hexIntersections",
+                                  "vertexTiles", "numberHexes", "ports", "portPoint1Locations", "portPoint2Locations",
+                                  "vertexPortTypes"])
+
+    """
+    Attributes of the board that only change when its epoch changes (when a piece is built or the robber
+    moves). Players read them many times in each turn, so the view keeps their frozen forms until the
+    epoch of the board changes.
+    """
+    pieceAttributes = frozenset(["settlements", "cities", "roads", "settlementFrontiers", "roadFrontiers",
+                                 "cityFrontiers", "roadVertices", "vertexOwners", "vertexBuildings", "blockedVertices",
+                                 "edgeOwners", "hexYields", "production", "roadComponents", "roadLengths"])
+
+    """ Attributes of the board that change during a turn, such as scores and resource counts, read on every use """
+    stateAttributes = frozenset(["turnNumber", "winner", "robberHex", "robberLocation", "longestRoadOwner",
+                                 "largestArmyOwner", "playerScores", "numResources", "numDevelopmentCards",
+                                 "knightsPlayed", "hexNumbers", "isVisible", "epoch", "playerEpochs"])
+
+    """ Types of the values of the board that cannot be changed, which the view returns as they are """
+    immutableTypes = (int, float, str, bool, type(None), Point.Point)
+
+    """ Types of the containers of the board, which the view returns as tuples, frozen sets or read-only mappings """
+    containerTypes = (list, tuple, set, dict)
+
+    """
+    The board, and the frozen forms of the attributes in pieceAttributes read in the epoch frozenEpoch, are
+    kept in private attributes, so that they cannot be reached or changed through the view by accident
+    """
+    def __init__(self, board):
+        object.__setattr__(self, "_BoardView__board", board)
+        object.__setattr__(self, "_BoardView__frozenEpoch", board.epoch)
+        object.__setattr__(self, "_BoardView__frozenPieces", {})
+
+    """
+    Return a property that reads an attribute in pieceAttributes, keeping its frozen form for the rest of
+    the epoch of the board
+    """
+    @staticmethod
+    def makePieceProperty(name):
+        def readPieces(self):
+            board = self.__board
+            if board.epoch != self.__frozenEpoch:
+                object.__setattr__(self, "_BoardView__frozenEpoch", board.epoch)
+                self.__frozenPieces.clear()
+            frozen = self.__frozenPieces.get(name)
+            if frozen is None:
+                frozen = BoardView.freeze(getattr(board, name))
+                self.__frozenPieces[name] = frozen
+            return frozen
+        return property(readPieces)
+
+    """ Return a property that reads an attribute in stateAttributes, frozen if it is a container """
+    @staticmethod
+    def makeStateProperty(name):
+        def readState(self):
+            value = getattr(self.__board, name)
+            if type(value) in BoardView.containerTypes:
+                return BoardView.freeze(value)
+            return value
+        return property(readState)
+
+    """
+    Read any other attribute of the board. Queries that may be called and attributes of the layout are
+    stored on the view, so they are found directly the next time. The other methods of the board, and the
+    objects the board uses to keep its state, raise an AttributeError.
+    """
+    def __getattr__(self, name):
+        value = getattr(self.__board, name)
+        if name in BoardView.layoutAttributes:
+            if type(value) is list:
+                value = BoardView.freeze(value)
+            object.__setattr__(self, name, value)
+            return value
+        if type(value) in BoardView.immutableTypes:
+            return value
+        if type(value) in BoardView.containerTypes:
+            return BoardView.freeze(value)
+        if callable(value):
+            if name not in BoardView.queries:
+                raise AttributeError("Players can only call the queries of the board, not Board." + name)
+            object.__setattr__(self, name, value)
+            return value
+        raise AttributeError("Players cannot read Board." + name + ", which the board uses to keep its state")
+
+    """
+    Return a container of the board as a tuple (or a set as a frozen set, and a dictionary as a read-only
+    mapping), with the lists, sets or dictionaries in it (such as the pieces of each player) frozen the same
+    way. The items of a container of the board are all of the same type.
+    """
+    @staticmethod
+    def freeze(value):
+        if type(value) is set:
+            return frozenset(value)
+        if type(value) is dict:
+            return MappingProxyType(value)
+        if len(value) > 0:
+            if type(value[0]) is list:
+                return tuple(map(tuple, value))
+            if type(value[0]) is set:
+                return tuple(map(frozenset, value))
+            if type(value[0]) is dict:
+                return tuple(map(MappingProxyType, value))
+        return tuple(value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("BoardView objects are read-only")
+
+""" Players read the pieces and state of the board many times in each turn, so each is read by a property """
+for attributeName in BoardView.pieceAttributes:
+    setattr(BoardView, attributeName, BoardView.makePieceProperty(attributeName))
+for attributeName in BoardView.stateAttributes:
+    setattr(BoardView, attributeName, BoardView.makeStateProperty(attributeName))
@@ -0,0 +1,61 @@
+"""
+Draws a Settlers of Catan board in a window on the screen with PySimpleGUI.
+This module is only imported when a board is drawn, so PySimpleGUI (and the Windows screen metrics used
+to size the window) are not loaded by games that are never shown, such as the games played by workers.
+The SvgRenderer class draws a board without a screen.
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+import PySimpleGUI
+
+class BoardWindow:
+    """ Picture of each type of hexagon, with the desert used for any other type """
+    tileImages = {"wood": "forest.jpg", "brick": "hill.jpg", "ore": "mountain.jpg", "sheep": "pasture.jpg",
+                  "wheat": "plain.jpg"}
+
+    def __init__(self, board):
+        self.board = board
+        self.initScreenGeometry()
+
+    """ Identify the pixel dimensions of the board based on the size of the screen (Windows only) """
+    def initScreenGeometry(self):
+        from ctypes import windll
+
+        """ Identify the coordinates of the center of the screen """
+        user32 = windll.user32
+        self.centerX = user32.GetSystemMetrics(0) / 2.0
+        self.centerY = user32.GetSystemMetrics(1) / 2.0
+
+        """ Assign the width and height of each hexagon that makes up the Catan board """
+        self.height = self.centerY / 5.6
+        self.width = self.height * 1.15
+        self.smallWidth = self.width / 2.0
+
+    """ Return the pixel coordinates of a location on the board, for the purpose of drawing it """
+    def getPixelLocation(self, point):
+        return self.board.topology.toPixel(point, self.centerX, self.centerY, self.smallWidth, self.height)
+
+    """ This may not be working currently """
+    def draw(self):
+        layout = [
+            [
+                PySimpleGUI.Graph(
+                    canvas_size=(self.centerX * 2, self.centerY * 2),
+                    graph_bottom_left=(0, 0),
+                    graph_top_right=(self.centerX * 2, self.centerY * 2),
+                    key="graph"
+                )
+            ]
+        ]
+
+        window = PySimpleGUI.Window("Catan Game", layout)
+        window.Finalize()
+
+        myIcon = window.Element("Catan Tile")
+
+        for tile in self.board.tiles:
+            x, y = self.getPixelLocation(tile.location)
+            myIcon.DrawImage(filename=BoardWindow.tileImages.get(tile.hexType, "desert.jpg"),
+                             location=(int(x), int(y)))
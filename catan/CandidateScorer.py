@@ -0,0 +1,116 @@
+"""
+Scores every possible settlement, city or road location for the RandComp player at once with NumPy
+arrays, instead of one location at a time. The layout of the board is turned into arrays once: the
+number of ways to roll each resource next to each intersection, the port next to each intersection,
+the neighbors of each intersection and the intersections of each edge. Each value is computed with
+the same arithmetic, in the same order, as RandComp.getHexValue and RandComp.getRoadValue, so the
+values (and the locations chosen with them) are exactly the same.
+NumPy is optional: if it is not installed, isAvailable returns False and RandComp scores each
+location on its own.
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+from catan.Player import Player
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class CandidateScorer:
+    """ The scorer built most recently, which is shared by every player using a board with the same layout """
+    sharedScorer = None
+
+    def __init__(self, board):
+        topology = board.topology
+        numVertices = len(topology.vertices)
+        self.layout = board.layout
+
+        """ Number of ways to roll each resource at the hexagons next to each intersection """
+        self.vertexPips = numpy.zeros((numVertices, 5))
+        for vertex in range(numVertices):
+            for tile in board.vertexTiles[vertex]:
+                resourceIndex = Player.getResourceIndex(tile.hexType)
+                if resourceIndex != -1:
+                    self.vertexPips[vertex, resourceIndex] += tile.value
+
+        """ Intersections next to a general port, and intersections next to a port for each resource """
+        self.generalPortVertices = numpy.array([vertex for vertex in range(numVertices)
+                                                if board.vertexPortTypes[vertex] == "general"], dtype=numpy.intp)
+        resourcePorts = [(vertex, Player.getResourceIndex(board.vertexPortTypes[vertex]))
+                         for vertex in range(numVertices)
+                         if board.vertexPortTypes[vertex] not in ("", "general")]
+        self.resourcePortVertices = numpy.array([port[0] for port in resourcePorts], dtype=numpy.intp)
+        self.resourcePortIndexes = numpy.array([port[1] for port in resourcePorts], dtype=numpy.intp)
+
+        """ The neighbors of each intersection, in the order of the topology, padded with -1 """
+        self.vertexNeighbors = numpy.full((numVertices, 3), -1, dtype=numpy.intp)
+        for vertex in range(numVertices):
+            for i in range(len(topology.vertexNeighbors[vertex])):
+                self.vertexNeighbors[vertex, i] = topology.vertexNeighbors[vertex][i]
+        self.edgeVertices = numpy.array(topology.edges, dtype=numpy.intp)
+        self.vertexBits = numpy.arange(numVertices, dtype=numpy.int64)
+
+    """ Determine whether NumPy is installed, so that scores can be computed with arrays """
+    @staticmethod
+    def isAvailable():
+        return numpy is not None
+
+    """ Return a scorer for the layout of a board, building a new one only if the layout is different """
+    @staticmethod
+    def getShared(board):
+        if CandidateScorer.sharedScorer is None or not CandidateScorer.sharedScorer.matches(board):
+            CandidateScorer.sharedScorer = CandidateScorer(board)
+        return CandidateScorer.sharedScorer
+
+    """ Determine whether the scorer was built from the current layout of a board """
+    def matches(self, board):
+        return self.layout is board.layout
+
+    """
+    Return the value of a settlement or city at every intersection for a player with the specified
+    resource access and trade rates, matching RandComp.getHexValue at each intersection
+    """
+    def getHexValues(self, resourcePoints, tradeRates):
+        resourcePoints = numpy.array(resourcePoints, dtype=numpy.float64)
+        tradeRates = numpy.array(tradeRates, dtype=numpy.float64)
+        tempResourcePoints = self.vertexPips + resourcePoints
+        tempTradeRates = numpy.tile(tradeRates, (len(self.vertexPips), 1))
+        generalRates = tempTradeRates[self.generalPortVertices]
+        tempTradeRates[self.generalPortVertices] = numpy.where(generalRates == 4, 3, generalRates)
+        tempTradeRates[self.resourcePortVertices, self.resourcePortIndexes] = 2
+
+        """ Add the value of each resource in order, the same as the loop in getHexValue """
+        terms = 4.0 * (tempResourcePoints / tempTradeRates - resourcePoints / tradeRates)
+        hexValues = terms[:, 0].copy()
+        for k in range(1, terms.shape[1]):
+            hexValues += terms[:, k]
+        return hexValues
+
+    """
+    Return the value of a road on each of the specified edges, matching RandComp.getRoadValue, from
+    the value of every intersection, a mask of the intersections touched by the player's roads and
+    a set of the intersections blocked by the distance rule
+    """
+    def getRoadValues(self, hexValues, edges, roadVertexMask, blockedVertices):
+        connected = ((numpy.int64(roadVertexMask) >> self.vertexBits) & 1) == 1
+        legal = numpy.ones(len(hexValues), dtype=bool)
+        legal[list(blockedVertices)] = False
+        endpoints = self.edgeVertices[numpy.array(edges, dtype=numpy.intp)]
+
+        """
+        Only count the value of intersections that are not already part of the player's road network,
+        adding each term in the same order as getRoadValue (adding 0 in place of each skipped term)
+        """
+        roadValues = numpy.zeros(len(edges))
+        for end in range(2):
+            vertices = endpoints[:, end]
+            counted = ~connected[vertices]
+            roadValues += numpy.where(counted, hexValues[vertices], 0.0)
+            for i in range(self.vertexNeighbors.shape[1]):
+                neighbors = self.vertexNeighbors[vertices, i]
+                useNeighbor = counted & (neighbors != -1) & legal[neighbors]
+                roadValues += numpy.where(useNeighbor, hexValues[neighbors] / 10, 0.0)
+        return roadValues
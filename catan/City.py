@@ -1,5 +1,7 @@
 """
-Structure to hold the location, color, and player number of each city on the Catan board
+Structure to hold the location, color, and player number of each city on the Catan board.
+Cities are immutable and interned, so every city a player builds at the same location
+is the same object. The id of a city is the id of its location.
 
 Created on Sep 2, 2022
 
@@ -7,8 +9,25 @@ Created on Sep 2, 2022
 """
 
 class City:
+    __slots__ = ("location", "color", "playerNum", "id")
 
-    def __init__(self, location, color, playerNum):
-        self.location = location
-        self.color = color
-        self.playerNum = playerNum
+    """ Every City created so far, keyed by its location id, color and player number """
+    internedCities = {}
+
+    def __new__(cls, location, color, playerNum):
+        key = (location.id, color, playerNum)
+        city = City.internedCities.get(key)
+        if city is None:
+            city = object.__new__(cls)
+            object.__setattr__(city, "location", location)
+            object.__setattr__(city, "color", color)
+            object.__setattr__(city, "playerNum", playerNum)
+            object.__setattr__(city, "id", location.id)
+            City.internedCities[key] = city
+        return city
+
+    def __setattr__(self, name, value):
+        raise AttributeError("City objects are immutable")
+
+    def __reduce__(self):
+        return City, (self.location, self.color, self.playerNum)
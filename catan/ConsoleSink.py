@@ -0,0 +1,82 @@
+"""
+An instance of the abstract EventSink class that prints a human-readable description of each event
+to the screen, for following a single game as it is played
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+from catan.EventSink import EventSink
+
+class ConsoleSink(EventSink):
+
+    def handleEvent(self, event):
+        description = self.describeEvent(event)
+        if len(description) > 0:
+            print(*description)
+
+    """ Return the parts of the text describing an event, or an empty list for events that are not printed """
+    @staticmethod
+    def describeEvent(event):
+        p = event.payload
+        player = event.playerNum
+        match event.kind:
+            case "setup":
+                return ["Shuffling and placing Catan tiles and ports for the game with seed", p["seed"]]
+            case "boardReady":
+                return ["Finished setting up the board"]
+            case "initialSettlement":
+                return ["Player", player, "placed its", p["round"], "settlement at", p["x"], p["y"]]
+            case "initialRoad":
+                return ["Player", player, "placed its", p["round"], "road between", p["x1"], p["y1"],
+                        "and", p["x2"], p["y2"]]
+            case "settlement":
+                return ["Player", player, "scored a point on turn", event.turnNumber,
+                        "by placing a settlement at", p["x"], p["y"]]
+            case "city":
+                return ["Player", player, "scored a point on turn", event.turnNumber,
+                        "by placing a city at", p["x"], p["y"]]
+            case "road":
+                return ["Player", player, "placed a road between", p["x1"], p["y1"], "and", p["x2"], p["y2"],
+                        "on turn", event.turnNumber]
+            case "longestRoad":
+                if p["owner"] == 0:
+                    return ["No player holds longest road after turn", event.turnNumber]
+                return ["Player", player, "took longest road with", p["length"], "roads on turn", event.turnNumber]
+            case "largestArmy":
+                return ["Player", player, "took largest army with", p["knights"], "knights on turn", event.turnNumber]
+            case "buyDevelopmentCard":
+                return ["Player", player, "bought a development card on turn", event.turnNumber]
+            case "developmentCard":
+                match p["card"]:
+                    case "knight":
+                        return ["Player", player, "played a knight on turn", event.turnNumber]
+                    case "roadBuilding":
+                        return ["Player", player, "played road building and built", len(p["roads"]), "roads"]
+                    case "yearOfPlenty":
+                        return ["Player", player, "played year of plenty and took", p["resources"][0], "and",
+                                p["resources"][1]]
+                    case _:
+                        return ["Player", player, "played monopoly and took", p["amount"], p["resource"]]
+            case "port":
+                return ["Player", player, "just acquired a", p["portType"], "port!"]
+            case "trade":
+                if p["port"]:
+                    return ["Player", player, "just traded", p["amount"], p["given"], "for 1", p["received"],
+                            "using a port"]
+                return ["Player", player, "just traded", p["amount"], p["given"], "for 1", p["received"],
+                        "from the bank"]
+            case "discard":
+                return ["Player", player, "discarded", p["amount"], "resources on turn", event.turnNumber]
+            case "resources":
+                return ["Player", player, "has", p["score"], "points, and", p["ore"], "ore,", p["wheat"], "wheat,",
+                        p["sheep"], "sheep,", p["brick"], "brick, and", p["wood"], "wood"]
+            case "gameOver":
+                if p["winner"] == -1:
+                    return ["No player won before the end of turn", p["maxTurns"]]
+                return ["Player", p["winner"], "won with", p["score"], "points at the end of turn",
+                        event.turnNumber, "!"]
+            case "error":
+                return ["ERROR:", p["message"]]
+            case _:
+                return []
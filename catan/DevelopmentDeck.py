@@ -0,0 +1,71 @@
+"""
+The deck of development cards of a Settlers of Catan game: 14 knights, 5 victory points, 2 road building,
+2 year of plenty and 2 monopoly cards. The deck is held as the number of cards of each type left, rather
+than a shuffled list of cards, so a card is drawn in constant time by choosing one of the remaining
+cards at random with the game's own stream of random numbers, and copying the deck copies 5 integers.
+Each player's hidden hand of development cards is held the same way, as a count of each type of card.
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+from random import Random
+
+class DevelopmentDeck:
+    """ Index of each type of card in the counts of a deck or a hand """
+    KNIGHT = 0
+    VICTORY_POINT = 1
+    ROAD_BUILDING = 2
+    YEAR_OF_PLENTY = 3
+    MONOPOLY = 4
+
+    cardTypes = ["knight", "victoryPoint", "roadBuilding", "yearOfPlenty", "monopoly"]
+    cardCounts = (14, 5, 2, 2, 2)
+
+    """ Number of knights needed for largest army, and the number of points it is worth """
+    minimumArmySize = 3
+    largestArmyPoints = 2
+
+    """
+    Create a full deck, drawn from using randomGenerator (randomly seeded if not specified).
+    If isEmpty is True, the deck has no cards, for games played without development cards.
+    """
+    def __init__(self, randomGenerator=None, isEmpty=False):
+        if randomGenerator is None:
+            randomGenerator = Random()
+        self.randomGenerator = randomGenerator
+        if isEmpty:
+            self.counts = [0] * len(DevelopmentDeck.cardCounts)
+        else:
+            self.counts = list(DevelopmentDeck.cardCounts)
+        self.numCards = sum(self.counts)
+
+    def __len__(self):
+        return self.numCards
+
+    """ Draw a card at random and return its type, or -1 if the deck is empty """
+    def draw(self):
+        if self.numCards == 0:
+            return -1
+        cardIndex = self.randomGenerator.randrange(self.numCards)
+        for cardType in range(len(self.counts)):
+            if cardIndex < self.counts[cardType]:
+                self.counts[cardType] -= 1
+                self.numCards -= 1
+                return cardType
+            cardIndex -= self.counts[cardType]
+        return -1
+
+    """ Return the name of a type of card, or a blank string if it is not a type of card """
+    @staticmethod
+    def getCardName(cardType):
+        if 0 <= cardType < len(DevelopmentDeck.cardTypes):
+            return DevelopmentDeck.cardTypes[cardType]
+        return ""
+
+    """ Return the type of card with a name, or -1 if there is no such type """
+    @staticmethod
+    def getCardType(cardName):
+        if cardName in DevelopmentDeck.cardTypes:
+            return DevelopmentDeck.cardTypes.index(cardName)
+        return -1
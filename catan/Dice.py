@@ -6,17 +6,21 @@ Created on Dec 23, 2023
 @author: Andrew Hubbard
 """
 
-from random import randrange
+from random import Random
 
 class Dice:
 
-    def __init__(self):
+    """ randomGenerator is the stream of random numbers used for every roll (randomly seeded if not specified) """
+    def __init__(self, randomGenerator=None):
+        if randomGenerator is None:
+            randomGenerator = Random()
+        self.randomGenerator = randomGenerator
         self.d1 = 0
         self.d2 = 0
         self.sum = 0
 
     def rollDice(self):
-        self.d1 = randrange(6) + 1
-        self.d2 = randrange(6) + 1
+        self.d1 = self.randomGenerator.randrange(6) + 1
+        self.d2 = self.randomGenerator.randrange(6) + 1
         self.sum = self.d1 + self.d2
         return self.sum
@@ -24,8 +24,9 @@ class DoublePoint:
     def __ne__(self, other):
         return not self.__eq__(other)
 
-    """ Allows for duplicate removal from a list of DoublePoint objects """
-    @property
+    """ 
+    Allows DoublePoint objects to be stored in sets and dictionaries. The hash does not depend
+    on the order of the points, so that it is consistent with __eq__.
+    """
     def __hash__(self):
-        return hash(str(int(self.p1.x)) + "," + str(int(self.p1.y))
-                    + str(int(self.p2.x)) + "," + str(int(self.p2.y)))
+        return hash(self.p1) ^ hash(self.p2)
@@ -0,0 +1,39 @@
+"""
+Abstract destination for the events emitted by the game engine. The Game, Board and Player classes
+report every build, trade, discard, port acquisition and error to an EventSink instead of printing,
+so that each game can choose whether events are printed, logged, sampled or discarded.
+
+Includes abstract methods that the class for each type of sink must override.
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+from abc import ABC, abstractmethod
+from catan import GameEvent
+
+class EventSink(ABC):
+
+    """ Called by the Game class before the first event of a game """
+    def startGame(self, seed):
+        pass
+
+    """ Called by the Game class after the last event of a game """
+    def endGame(self):
+        pass
+
+    """ Release any resources held by the sink, after which no more events are emitted """
+    def close(self):
+        pass
+
+    """ Report an event of the specified kind, with a dictionary of details about the event """
+    def emit(self, kind, turnNumber, playerNum, payload):
+        self.handleEvent(GameEvent.GameEvent(kind, turnNumber, playerNum, payload))
+
+    """ Report an error, described by a message made of the specified parts separated by spaces """
+    def error(self, turnNumber, playerNum, *messageParts):
+        self.emit("error", turnNumber, playerNum, {"message": " ".join(str(part) for part in messageParts)})
+
+    @abstractmethod
+    def handleEvent(self, event):
+        pass
@@ -8,90 +8,177 @@ Created on Sep 2, 2022
 @author: Andrew Hubbard
 """
 from catan import Board
+from catan import BoardView
+from catan import ConsoleSink
+from catan import DevelopmentDeck
+from catan import LongestRoad
 from catan import RandComp
+from random import Random
 
 class Game:
-    def __init__(self):
-        """ Initialize the variables for the Game class and call each player's constructor """
+    """ Color of each seat at the table, in order """
+    playerColors = ["red", "blue", "white", "orange", "green", "brown"]
+
+    """
+    Initialize the variables for the Game class and call each player's constructor. playerTypes is a
+    list of Player subclasses, one per seat (4 RandComp players by default), and maxTurns limits the
+    length of the game (-1 for no limit), after which the game ends without a winner.
+    Every random decision in the game is derived from the seed, which is chosen randomly if not specified,
+    so that a game can be replayed exactly from its seed. Every event in the game is reported to
+    eventSink, which prints a description of each event if not specified. If boardPool is specified,
+    the layout of the board is drawn from the BoardPool instead of shuffled. If useDevelopmentCards is
+    False, the deck of development cards is empty, so no player can buy one.
+    """
+    def __init__(self, playerTypes=None, pointsToWin=10, maxTurns=-1, seed=None, eventSink=None, boardPool=None,
+                 useDevelopmentCards=True):
+        if playerTypes is None:
+            playerTypes = [RandComp.RandComp] * 4
+        if seed is None:
+            seed = Random().getrandbits(63)
+        if eventSink is None:
+            eventSink = ConsoleSink.ConsoleSink()
+        self.seed = seed
+        self.eventSink = eventSink
+        self.eventSink.startGame(seed)
+
+        self.boardRandom, self.diceRandom, self.playerRandoms, self.deckRandom = Game.splitSeed(seed, len(playerTypes))
+
         self.players = []
-        self.numPlayers = 4
+        self.numPlayers = len(playerTypes)
         self.maxResources = 7
-        self.pointsToWin = 10
+        self.pointsToWin = pointsToWin
+        self.maxTurns = maxTurns
         self.playerToMove = 1
-        self.board = Board.Board(self.numPlayers)
-        self.players.append(RandComp.RandComp(1, "red", "RandComp", self.numPlayers))
-        self.players.append(RandComp.RandComp(2, "blue", "RandComp", self.numPlayers))
-        self.players.append(RandComp.RandComp(3, "white", "RandComp", self.numPlayers))
-        self.players.append(RandComp.RandComp(4, "orange", "RandComp", self.numPlayers))
-        self.playerColors = ["red", "blue", "white", "orange"]
+
+        """ Number of the player whose score includes the points for longest road and for largest army (or 0) """
+        self.longestRoadOwner = 0
+        self.largestArmyOwner = 0
+        self.board = Board.Board(self.numPlayers, self.boardRandom, self.diceRandom, self.eventSink)
+
+        """ Players only see the board through a read-only view, and build their pieces with functions of the game """
+        self.boardView = BoardView.BoardView(self.board)
+        self.developmentDeck = DevelopmentDeck.DevelopmentDeck(self.deckRandom, not useDevelopmentCards)
+        self.playerColors = Game.playerColors[:self.numPlayers]
+        for i in range(self.numPlayers):
+            self.players.append(playerTypes[i](i + 1, self.playerColors[i], playerTypes[i].__name__,
+                                               self.numPlayers, self.playerRandoms[i], self.eventSink))
+            self.players[i].currentBoard = self.boardView
+            (self.players[i].buildSettlement, self.players[i].buildCity,
+             self.players[i].buildRoad) = self.getBuilders(i + 1)
+            self.players[i].pointsToWin = self.pointsToWin
+            self.players[i].developmentDeck = self.developmentDeck
 
         """ Call the methods to set up the Settlers of Catan board """
-        print("Shuffling and placing Catan tiles and ports")
-        self.board.initTiles()
-        self.board.initPorts()
-        print("Finished setting up the board")
+        self.eventSink.emit("setup", 0, 0, {"seed": self.seed, "numPlayers": self.numPlayers,
+                                            "playerTypes": [player.playerType for player in self.players]})
+        if boardPool is None:
+            self.board.initTiles()
+            self.board.initPorts()
+        else:
+            self.board.setLayout(boardPool.drawLayout(self.boardRandom))
+        self.eventSink.emit("boardReady", 0, 0, {"hexTypes": [tile.hexType for tile in self.board.tiles],
+                                                 "numbers": [tile.number for tile in self.board.tiles],
+                                                 "portTypes": [port.portType for port in self.board.ports]})
 
-    """ Alternate turns between each player until some player wins, and then print the winner """
+    """
+    Split the seed of a game into independent streams of random numbers for setting up the board, rolling
+    the dice, each player's decisions and drawing development cards, so that no state is shared with other
+    games. Returns the board stream, the dice stream, a list of the stream of each player and the deck stream.
+    """
+    @staticmethod
+    def splitSeed(seed, numPlayers):
+        seedGenerator = Random(seed)
+        boardRandom = Random(seedGenerator.getrandbits(64))
+        diceRandom = Random(seedGenerator.getrandbits(64))
+        playerRandoms = [Random(seedGenerator.getrandbits(64)) for _ in range(numPlayers)]
+        deckRandom = Random(seedGenerator.getrandbits(64))
+        return boardRandom, diceRandom, playerRandoms, deckRandom
+
+    """
+    Move points from the score of one player to the score of another, when an award such as longest road
+    changes hands on the board (a player number of 0 is nobody). Returns the number of the new holder.
+    """
+    @staticmethod
+    def moveAwardPoints(players, oldOwner, newOwner, points):
+        if oldOwner != newOwner:
+            if oldOwner != 0:
+                players[oldOwner - 1].score -= points
+            if newOwner != 0:
+                players[newOwner - 1].score += points
+        return newOwner
+
+    """ Alternate turns between each player until some player wins, and then report the winner """
     def play(self):
         self.initPlacement()
-        while self.board.winner == -1:
+        while self.board.winner == -1 and (self.maxTurns == -1 or self.board.turnNumber <= self.maxTurns):
             self.takeTurn()
-        print("Player", self.board.winner, "won with", self.players[self.board.winner - 1].score,
-              "points at the end of turn", self.board.turnNumber, "!")
+        scores = [player.score for player in self.players]
+        if self.board.winner == -1:
+            self.eventSink.emit("gameOver", self.board.turnNumber, 0,
+                                {"winner": -1, "score": 0, "scores": scores, "maxTurns": self.maxTurns})
+        else:
+            self.eventSink.emit("gameOver", self.board.turnNumber, self.board.winner,
+                                {"winner": self.board.winner, "score": scores[self.board.winner - 1],
+                                 "scores": scores, "maxTurns": self.maxTurns})
+        self.eventSink.endGame()
 
     """
-    Place initial settlements and roads for each player and print the location of each settlement and 
-    road chosen. Also print a message for any ports acquired by players in the initial settlement phase.
+    Place initial settlements and roads for each player and report the location of each settlement and 
+    road chosen. Also report any ports acquired by players in the initial settlement phase.
     """
     def initPlacement(self):
         """ Player 1 chooses its first settlement first """
         for i in range(self.numPlayers):
             playerToMove = i + 1
-            settleLocation = self.players[i].chooseInitialSettlementLocation(self.board)
+            settleLocation = self.players[i].chooseInitialSettlementLocation(self.boardView)
             self.board.addSettlement(settleLocation, self.playerColors[i], playerToMove, True)
             self.players[playerToMove - 1].updateResourcePoints(settleLocation)
             self.players[playerToMove - 1].score += 1
-            print("Player", playerToMove, "placed its first settlement at",
-                  int(settleLocation.x), int(settleLocation.y))
+            self.eventSink.emit("initialSettlement", 0, playerToMove,
+                                {"round": "first", "x": settleLocation.x, "y": settleLocation.y})
             newPortType = self.board.getPortType(settleLocation)
             if newPortType != "":
                 self.players[i].gainPortPower(newPortType)
-                print("Player", playerToMove, "just acquired a", newPortType, "port!")
+                self.eventSink.emit("port", 0, playerToMove, {"portType": newPortType})
 
             roadLocation = self.players[i].chooseInitialRoadLocation(settleLocation)
             self.board.addRoad(settleLocation, roadLocation, self.playerColors[i], playerToMove, True)
-            print("Player", playerToMove, "placed its first road between", int(settleLocation.x),
-                  int(settleLocation.y), "and", int(roadLocation.x), int(roadLocation.y))
+            self.eventSink.emit("initialRoad", 0, playerToMove, {"round": "first", "x1": settleLocation.x,
+                                                                 "y1": settleLocation.y, "x2": roadLocation.x,
+                                                                 "y2": roadLocation.y})
 
         """ Player 1 chooses its second settlement last """
         """ Each player gains resources based on the tiles adjacent to their second settlement """
         for i in range(self.numPlayers):
             j = self.numPlayers - i - 1
             playerToMove = j + 1
-            settleLocation = self.players[j].chooseInitialSettlementLocation(self.board)
+            settleLocation = self.players[j].chooseInitialSettlementLocation(self.boardView)
             self.board.addSettlement(settleLocation, self.playerColors[i], playerToMove, True)
             self.players[playerToMove - 1].updateResourcePoints(settleLocation)
             self.players[playerToMove - 1].score += 1
-            print("Player", playerToMove, "placed its second settlement at",
-                  int(settleLocation.x), int(settleLocation.y))
+            self.eventSink.emit("initialSettlement", 0, playerToMove,
+                                {"round": "second", "x": settleLocation.x, "y": settleLocation.y})
             newPortType = self.board.getPortType(settleLocation)
             if newPortType != "":
                 self.players[j].gainPortPower(newPortType)
-                print("Player", playerToMove, "just acquired a", newPortType, "port!")
+                self.eventSink.emit("port", 0, playerToMove, {"portType": newPortType})
 
             """ Collect resources based on tiles adjacent to the player's second settlement """
             neighbors = self.board.getAdjacentHexes(settleLocation)
             for k in range(len(neighbors)):
                 self.players[j].addResource(neighbors[k].hexType)
+            self.updateHandSizes()
 
             roadLocation = self.players[j].chooseInitialRoadLocation(settleLocation)
             self.board.addRoad(settleLocation, roadLocation, self.playerColors[i], playerToMove, True)
-            print("Player", playerToMove, "placed its second road between", int(settleLocation.x),
-                  int(settleLocation.y), "and", int(roadLocation.x), int(roadLocation.y))
+            self.eventSink.emit("initialRoad", 0, playerToMove, {"round": "second", "x1": settleLocation.x,
+                                                                 "y1": settleLocation.y, "x2": roadLocation.x,
+                                                                 "y2": roadLocation.y})
 
     def collectResources(self):
         """  Eventually players should have an option to play knight cards before rolling dice """
         diceRoll = self.board.rollDice()
+        self.eventSink.emit("roll", self.board.turnNumber, self.playerToMove, {"roll": diceRoll})
         if diceRoll == 7:
             """
             Players with more than a certain number of resources (usually half of their hand) 
@@ -100,14 +187,9 @@ class Game:
             for i in range(self.numPlayers):
                 if self.players[i].getTotalResources() > self.maxResources:
                     self.players[i].discard()
+            self.updateHandSizes()
 
-            """ The player whose turn it is moves the robber and steals from another player """
-            playerToRob = self.players[self.playerToMove - 1].getPlayerToRob()
-            self.board.robberLocation = self.players[self.playerToMove - 1].getPointToBlock(playerToRob)
-            resourceNum = self.players[playerToRob - 1].getRandomResource()
-            if resourceNum != -1:
-                self.players[self.playerToMove - 1].gainResource(resourceNum)
-                self.players[playerToRob - 1].loseResource(resourceNum)
+            self.moveRobber()
 
         else:
             """
@@ -115,24 +197,124 @@ class Game:
             matching the dice roll gains resources: 1 for a settlement, or 2 for a city.
             These resources are not collected by the player if the tile is blocked by the robber.
             """
-            for i in range(self.numPlayers):
-                for j in range(len(self.board.settlements[i])):
-                    neighbors = self.board.getAdjacentHexes(self.board.settlements[i][j].location)
-                    for k in range(len(neighbors)):
-                        if neighbors[k].number == diceRoll and neighbors[k].location != self.board.robberLocation:
-                            self.players[i].addResource(neighbors[k].hexType)
-
-                for j in range(len(self.board.cities[i])):
-                    neighbors = self.board.getAdjacentHexes(self.board.cities[i][j].location)
-                    for k in range(len(neighbors)):
-                        if neighbors[k].number == diceRoll and neighbors[k].location != self.board.robberLocation:
-                            self.players[i].addResource(neighbors[k].hexType)
-                            self.players[i].addResource(neighbors[k].hexType)
+            for payout in self.board.getProduction(diceRoll):
+                for _ in range(payout[2]):
+                    self.players[payout[0] - 1].addResource(payout[1])
+            self.updateHandSizes()
+
+    """
+    Record the number of resources and development cards each player holds on the board, after the
+    players' hands change, since players cannot change the board themselves
+    """
+    def updateHandSizes(self):
+        self.board.setHandSizes([sum(player.resources) for player in self.players],
+                                [sum(player.developmentCards) for player in self.players])
+
+    """
+    Return the functions with which a player builds a settlement, city or road for itself on the board,
+    once it has paid for the piece. Players only have a read-only view of the board, and are given these
+    functions in place of the game, so they can only build their own pieces.
+    """
+    def getBuilders(self, playerNum):
+        board = self.board
+        color = self.playerColors[playerNum - 1]
+
+        def buildSettlement(location):
+            board.addSettlement(location, color, playerNum, False)
+
+        def buildCity(location):
+            board.addCity(location, color, playerNum, False)
+
+        def buildRoad(location1, location2):
+            board.addRoad(location1, location2, color, playerNum, False)
+        return buildSettlement, buildCity, buildRoad
+
+    """ The player whose turn it is moves the robber and steals from another player """
+    def moveRobber(self):
+        playerToRob = self.players[self.playerToMove - 1].getPlayerToRob()
+        self.board.setRobberLocation(self.players[self.playerToMove - 1].getPointToBlock(playerToRob))
+        resourceNum = self.players[playerToRob - 1].getRandomResource()
+        if resourceNum != -1:
+            self.players[self.playerToMove - 1].gainResource(resourceNum)
+            self.players[playerToRob - 1].loseResource(resourceNum)
+            self.updateHandSizes()
+        self.eventSink.emit("robber", self.board.turnNumber, self.playerToMove,
+                            {"x": self.board.robberLocation.x, "y": self.board.robberLocation.y,
+                             "victim": playerToRob, "resource": resourceNum})
+
+    """
+    Let the player whose turn it is play a development card, after rolling the dice and before building.
+    A player can play 1 card each turn, and never a card bought on the same turn, since cards are only
+    bought while building. Victory point cards are never played, since they count toward the player's
+    score from the time they are bought.
+    """
+    def playDevelopmentCard(self):
+        player = self.players[self.playerToMove - 1]
+        choice = player.chooseDevelopmentCard()
+        if choice is None:
+            return
+        cardType, arguments = choice
+        if (cardType < 0 or cardType >= len(player.developmentCards) or player.developmentCards[cardType] == 0
+                or cardType == DevelopmentDeck.DevelopmentDeck.VICTORY_POINT):
+            self.eventSink.error(self.board.turnNumber, self.playerToMove, "Player", self.playerToMove,
+                                 "tried to play development card number", cardType, "which it cannot play")
+            return
+        if cardType == DevelopmentDeck.DevelopmentDeck.MONOPOLY and (arguments[0] < 0 or arguments[0] > 4):
+            self.eventSink.error(self.board.turnNumber, self.playerToMove, "Player", self.playerToMove,
+                                 "tried to take resource number", arguments[0], "with a monopoly card")
+            return
+        player.removeDevelopmentCard(cardType)
+        cardName = DevelopmentDeck.DevelopmentDeck.getCardName(cardType)
+        match cardType:
+            case DevelopmentDeck.DevelopmentDeck.KNIGHT:
+                self.eventSink.emit("developmentCard", self.board.turnNumber, self.playerToMove, {"card": cardName})
+                self.board.addKnight(self.playerToMove)
+                self.moveRobber()
+            case DevelopmentDeck.DevelopmentDeck.ROAD_BUILDING:
+                """ Build up to 2 free roads, which are not reported as bought """
+                roads = []
+                for _ in range(2):
+                    roadLocation = player.chooseFreeRoadLocation()
+                    if roadLocation is None:
+                        break
+                    numRoads = len(self.board.roads[self.playerToMove - 1])
+                    self.board.addRoad(roadLocation.p1, roadLocation.p2, player.color, self.playerToMove, False, True)
+                    if len(self.board.roads[self.playerToMove - 1]) == numRoads:
+                        break
+                    roads.append({"x1": roadLocation.p1.x, "y1": roadLocation.p1.y,
+                                  "x2": roadLocation.p2.x, "y2": roadLocation.p2.y})
+                self.eventSink.emit("developmentCard", self.board.turnNumber, self.playerToMove,
+                                    {"card": cardName, "roads": roads})
+            case DevelopmentDeck.DevelopmentDeck.YEAR_OF_PLENTY:
+                for resourceIndex in arguments:
+                    player.gainResource(resourceIndex)
+                resourceTypes = [player.getResourceType(resourceIndex) for resourceIndex in arguments]
+                self.eventSink.emit("developmentCard", self.board.turnNumber, self.playerToMove,
+                                    {"card": cardName, "resources": resourceTypes})
+            case DevelopmentDeck.DevelopmentDeck.MONOPOLY:
+                amount = player.takeAllResources(arguments[0], self.players)
+                self.eventSink.emit("developmentCard", self.board.turnNumber, self.playerToMove,
+                                    {"card": cardName, "resource": player.getResourceType(arguments[0]),
+                                     "amount": amount})
+        self.updateHandSizes()
+
+    """
+    Move the points for longest road and largest army to the players who hold them now, if they changed
+    hands during the turn
+    """
+    def settleAwards(self):
+        self.longestRoadOwner = Game.moveAwardPoints(self.players, self.longestRoadOwner, self.board.longestRoadOwner,
+                                                     LongestRoad.LongestRoad.points)
+        self.largestArmyOwner = Game.moveAwardPoints(self.players, self.largestArmyOwner, self.board.largestArmyOwner,
+                                                     DevelopmentDeck.DevelopmentDeck.largestArmyPoints)
 
     def takeTurn(self):
-        """ Roll the dice, collect resources, and take the current player's turn """
+        """ Roll the dice, collect resources, play a development card, and take the current player's turn """
         self.collectResources()
-        self.board = self.players[self.playerToMove - 1].takeTurn(self.board)
+        self.playDevelopmentCard()
+        self.players[self.playerToMove - 1].takeTurn(self.boardView)
+        self.updateHandSizes()
+        self.settleAwards()
 
         """ Check to see if the player won, and if so, update the winner """
         if self.players[self.playerToMove - 1].score >= self.pointsToWin:
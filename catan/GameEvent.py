@@ -0,0 +1,24 @@
+"""
+Structure to hold a single event emitted by the game engine: the kind of event (such as "settlement",
+"trade" or "error"), the turn on which it happened, the number of the player involved (0 if no player
+is involved), and a dictionary holding the details of the event
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+
+class GameEvent:
+    __slots__ = ("kind", "turnNumber", "playerNum", "payload")
+
+    def __init__(self, kind, turnNumber, playerNum, payload):
+        self.kind = kind
+        self.turnNumber = turnNumber
+        self.playerNum = playerNum
+        self.payload = payload
+
+    """ Return the event as a flat dictionary, for the purpose of writing it to a log """
+    def toDict(self):
+        eventDict = {"kind": self.kind, "turn": self.turnNumber, "player": self.playerNum}
+        eventDict.update(self.payload)
+        return eventDict
@@ -0,0 +1,174 @@
+"""
+An instance of the abstract EventSink class that records a game in a compact binary replay, while
+forwarding every event to another sink. The replay holds the seed, the players, the layout of the
+board, every dice roll and every decision made by each player, encoded by the ReplayCodec class,
+plus a keyframe of the whole state of the game at the start of every keyframeInterval turns, so that
+the Replayer class can jump to any turn without replaying the whole game or invoking any player.
+
+A replay is laid out as:
+    the magic bytes "CATR" and the format version
+    the seed, the number of players and the type of each player
+    the type and number of each hexagon and the type of each port
+    the keyframe interval, then the length of the actions followed by the encoded actions
+    the number of keyframes, then for each keyframe its turn number, the offset of the first action
+    after it, its length and its encoded state
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+from catan import DevelopmentDeck
+from catan import NullSink
+from catan import Player
+from catan import Point
+from catan import ReplayState
+from catan import Topology
+from catan.EventSink import EventSink
+from catan.ReplayCodec import ReplayCodec
+
+class GameRecorder(EventSink):
+    magic = b"CATR"
+    version = 3
+
+    """ Record games with a keyframe every keyframeInterval turns, forwarding events to sink (if specified) """
+    def __init__(self, sink=None, keyframeInterval=10):
+        if sink is None:
+            sink = NullSink.NullSink()
+        self.sink = sink
+        self.keyframeInterval = keyframeInterval
+        self.topology = Topology.Topology.getShared()
+
+        """ The replay of the most recently finished game """
+        self.replay = None
+        self.startRecording(None)
+
+    """ Clear the recording before the first event of a game """
+    def startRecording(self, seed):
+        self.seed = seed
+        self.numPlayers = 0
+        self.playerTypes = []
+        self.header = bytearray()
+        self.actions = bytearray()
+        self.keyframes = []
+        self.state = None
+
+    def startGame(self, seed):
+        self.startRecording(seed)
+        self.sink.startGame(seed)
+
+    """ Assemble the replay of the game once the last event has been recorded """
+    def endGame(self):
+        self.replay = self.getReplay()
+        self.sink.endGame()
+
+    def close(self):
+        self.sink.close()
+
+    def emit(self, kind, turnNumber, playerNum, payload):
+        self.recordEvent(kind, playerNum, payload)
+        self.sink.emit(kind, turnNumber, playerNum, payload)
+
+    def error(self, turnNumber, playerNum, *messageParts):
+        self.sink.error(turnNumber, playerNum, *messageParts)
+
+    def handleEvent(self, event):
+        self.recordEvent(event.kind, event.playerNum, event.payload)
+        self.sink.handleEvent(event)
+
+    """ Convert an event that changes the state of the game to an action and record it """
+    def recordEvent(self, kind, playerNum, payload):
+        match kind:
+            case "setup":
+                self.numPlayers = payload["numPlayers"]
+                self.playerTypes = payload["playerTypes"]
+            case "boardReady":
+                self.writeHeader(payload["hexTypes"], payload["numbers"], payload["portTypes"])
+                self.state = ReplayState.ReplayState(self.numPlayers, payload["hexTypes"], payload["numbers"],
+                                                     payload["portTypes"])
+            case "roll":
+                """ Write a keyframe before the first player rolls on every keyframeInterval turns """
+                self.state.endTurn()
+                if self.state.playerToMove == 1 and self.state.turnNumber % self.keyframeInterval == 0:
+                    keyframe = bytearray()
+                    self.state.writeKeyframe(keyframe)
+                    self.keyframes.append((self.state.turnNumber, len(self.actions), keyframe))
+                self.recordAction((ReplayCodec.ROLL, payload["roll"]))
+            case "initialSettlement":
+                self.recordAction((ReplayCodec.INITIAL_SETTLEMENT, playerNum, self.findVertex(payload)))
+            case "initialRoad":
+                self.recordAction((ReplayCodec.INITIAL_ROAD, playerNum, self.findEdge(payload)))
+            case "settlement":
+                self.recordAction((ReplayCodec.SETTLEMENT, self.findVertex(payload)))
+            case "city":
+                self.recordAction((ReplayCodec.CITY, self.findVertex(payload)))
+            case "road":
+                self.recordAction((ReplayCodec.ROAD, self.findEdge(payload)))
+            case "trade":
+                self.recordAction((ReplayCodec.TRADE, Player.Player.getResourceIndex(payload["given"]),
+                                   Player.Player.getResourceIndex(payload["received"])))
+            case "discard":
+                self.recordAction((ReplayCodec.DISCARD, playerNum, payload["resources"]))
+            case "robber":
+                hexId = self.topology.findHex(Point.Point(payload["x"], payload["y"]))
+                self.recordAction((ReplayCodec.ROBBER, hexId, payload["victim"], payload["resource"]))
+            case "buyDevelopmentCard":
+                self.recordAction((ReplayCodec.BUY_CARD, DevelopmentDeck.DevelopmentDeck.getCardType(payload["card"])))
+            case "developmentCard":
+                cardType = DevelopmentDeck.DevelopmentDeck.getCardType(payload["card"])
+                match cardType:
+                    case DevelopmentDeck.DevelopmentDeck.ROAD_BUILDING:
+                        arguments = [self.findEdge(road) for road in payload["roads"]]
+                    case DevelopmentDeck.DevelopmentDeck.YEAR_OF_PLENTY:
+                        arguments = [Player.Player.getResourceIndex(resource) for resource in payload["resources"]]
+                    case DevelopmentDeck.DevelopmentDeck.MONOPOLY:
+                        arguments = [Player.Player.getResourceIndex(payload["resource"])]
+                    case _:
+                        arguments = []
+                self.recordAction((ReplayCodec.PLAY_CARD, cardType, arguments))
+            case "gameOver":
+                self.recordAction((ReplayCodec.GAME_OVER, payload["winner"]))
+
+    """ Encode an action and apply it to the copy of the state used to write keyframes """
+    def recordAction(self, action):
+        ReplayCodec.writeAction(self.actions, action)
+        self.state.applyAction(action)
+
+    def findVertex(self, payload):
+        return self.topology.findVertex(Point.Point(payload["x"], payload["y"]))
+
+    def findEdge(self, payload):
+        return self.topology.findEdge(Point.Point(payload["x1"], payload["y1"]),
+                                      Point.Point(payload["x2"], payload["y2"]))
+
+    def writeHeader(self, hexTypes, numbers, portTypes):
+        self.header.extend(GameRecorder.magic)
+        ReplayCodec.writeVarint(self.header, GameRecorder.version)
+        ReplayCodec.writeSigned(self.header, self.seed if self.seed is not None else 0)
+        ReplayCodec.writeVarint(self.header, self.numPlayers)
+        for playerType in self.playerTypes:
+            ReplayCodec.writeString(self.header, playerType)
+        for hexType in hexTypes:
+            ReplayCodec.writeVarint(self.header, ReplayCodec.hexTypes.index(hexType))
+        for number in numbers:
+            ReplayCodec.writeVarint(self.header, number)
+        for portType in portTypes:
+            ReplayCodec.writeVarint(self.header, ReplayCodec.portTypes.index(portType))
+        ReplayCodec.writeVarint(self.header, self.keyframeInterval)
+
+    """ Return the replay of the game recorded so far as bytes """
+    def getReplay(self):
+        replay = bytearray(self.header)
+        ReplayCodec.writeVarint(replay, len(self.actions))
+        replay.extend(self.actions)
+        ReplayCodec.writeVarint(replay, len(self.keyframes))
+        for keyframe in self.keyframes:
+            ReplayCodec.writeVarint(replay, keyframe[0])
+            ReplayCodec.writeVarint(replay, keyframe[1])
+            ReplayCodec.writeVarint(replay, len(keyframe[2]))
+            replay.extend(keyframe[2])
+        return bytes(replay)
+
+    """ Write the replay of the most recently finished game to a file """
+    def save(self, path):
+        with open(path, "wb") as replayFile:
+            replayFile.write(self.replay)
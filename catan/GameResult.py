@@ -0,0 +1,22 @@
+"""
+Structure to hold the compact result of one Settlers of Catan game played by the BatchRunner:
+the seed used for the game, the winner (-1 if the turn limit was reached), the number of turns
+played, and each player's final score
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+
+class GameResult:
+    __slots__ = ("seed", "winner", "turnNumber", "scores")
+
+    def __init__(self, seed, winner, turnNumber, scores):
+        self.seed = seed
+        self.winner = winner
+        self.turnNumber = turnNumber
+        self.scores = scores
+
+    """ Return the result as a tuple, for writing to logs or comparing results """
+    def toTuple(self):
+        return self.seed, self.winner, self.turnNumber, self.scores
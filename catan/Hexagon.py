@@ -1,5 +1,7 @@
 """
-Structure to hold the type, location, number, and value of each hexagon on the Catan board
+Structure to hold the type, location, number, and value of each hexagon on the Catan board.
+Hexagons are immutable and interned, so every hexagon with the same type, location and number
+is the same object. The id of a hexagon is the id of its location.
 
 Created on Sep 2, 2022
 
@@ -7,22 +9,39 @@ Created on Sep 2, 2022
 """
 
 class Hexagon:
+    __slots__ = ("hexType", "location", "number", "value", "id")
+
+    """ Every Hexagon created so far, keyed by its type, location id and number """
+    internedHexagons = {}
+
+    def __new__(cls, hexType, location, number):
+        key = (hexType, location.id, number)
+        hexagon = Hexagon.internedHexagons.get(key)
+        if hexagon is None:
+            hexagon = object.__new__(cls)
+            object.__setattr__(hexagon, "hexType", hexType)
+            object.__setattr__(hexagon, "location", location)
+            object.__setattr__(hexagon, "number", number)
+            object.__setattr__(hexagon, "value", Hexagon.getValue(number))
+            object.__setattr__(hexagon, "id", location.id)
+            Hexagon.internedHexagons[key] = hexagon
+        return hexagon
+
+    """ Return the number of ways to roll a number with 2 dice, or 0 for the desert """
+    @staticmethod
+    def getValue(number):
+        if number == 0:
+            return 0
+        elif number < 7:
+            return number - 1
+        else:
+            return 13 - number
 
-    def __init__(self, hexType):
-        self.location = None
-        self.hexType = hexType
-        self.number = 0
-        self.value = 0
-
-    def setLocation(self, location):
-        self.location = location
+    def __setattr__(self, name, value):
+        raise AttributeError("Hexagon objects are immutable")
 
-    def setNumber(self, number):
-        self.number = number
-        if number < 7:
-            self.value = number - 1
-        else:
-            self.value = 13 - number
+    def __reduce__(self):
+        return Hexagon, (self.hexType, self.location, self.number)
 
     ''' Determines whether 2 Hexagon objects are equal (==) to each other '''
     def __eq__(self, other):
@@ -37,4 +56,4 @@ class Hexagon:
 
     ''' Allows for duplicate removal from a list of Hexagon objects '''
     def __hash__(self):
-        return hash(self.location)
+        return self.id
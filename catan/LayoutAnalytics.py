@@ -0,0 +1,207 @@
+"""
+Computes statistics of many board layouts at once with NumPy, to study how the layout of the board
+drives the outcome of games. Layouts are held as a 2-dimensional array with one BoardPool record per
+row (the code of each hexagon type, the number of each hexagon and the code of each port type), and
+every statistic is computed for every layout with array operations:
+    the pips (ways to roll the numbers, as in Hexagon.value) next to each intersection, in total and
+    of each resource
+    the pips of each resource on the whole board, and a scarcity index of each resource (the average
+    pips of a resource divided by the pips of that resource, so scarcer resources have higher values)
+    the reach of each port: the pips next to the 2 intersections of the port
+    the best opening: the largest total pips of 2 intersections that follow the distance rule
+The statistics can be joined with the results of games played by the BatchRunner, to estimate the
+advantage of the first seat on each layout. Run from the root of the project, for example:
+python -m catan.LayoutAnalytics --games 10000 --workers 8
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+from catan import BatchRunner
+from catan import Board
+from catan import BoardPool
+from catan import Game
+from catan import Hexagon
+from catan import NullSink
+from catan import Topology
+from catan.ReplayCodec import ReplayCodec
+from argparse import ArgumentParser
+import os
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class LayoutAnalytics:
+    """ Names of the columns returned by getFeatures """
+    featureNames = ["best opening", "first pick gap", "pip spread", "max scarcity", "best port reach"]
+
+    """ Compute the statistics of each layout in an array of BoardPool records, with one record per row """
+    def __init__(self, records):
+        topology = Topology.Topology.getShared()
+        records = numpy.asarray(records, dtype=numpy.uint8)
+        self.records = records
+        self.numLayouts = len(records)
+        numHexes = len(topology.hexCenters)
+        numResources = len(ReplayCodec.hexTypes) - 1
+        self.hexCodes = records[:, :numHexes]
+        self.numbers = records[:, numHexes:2 * numHexes]
+        self.portCodes = records[:, 2 * numHexes:]
+
+        """
+        Pips of each hexagon, and of each resource at each hexagon (0 for every other resource). Totals
+        never exceed 58, so 16-bit integers keep the arrays of hundreds of thousands of layouts small.
+        """
+        pipTable = numpy.array([Hexagon.Hexagon.getValue(number) for number in range(13)], dtype=numpy.int16)
+        self.hexPips = pipTable[self.numbers]
+        isResource = self.hexCodes[:, :, None] == numpy.arange(numResources)
+        self.hexResourcePips = self.hexPips[:, :, None] * isResource
+
+        """
+        The hexagons next to each intersection, padded with a hexagon with no pips, so the pips next to
+        every intersection are added up at once, one of the 3 hexagons next to each intersection at a time
+        """
+        vertexHexes = numpy.full((len(topology.vertices), 3), numHexes, dtype=numpy.intp)
+        for vertex in range(len(topology.vertices)):
+            vertexHexes[vertex, :len(topology.vertexHexes[vertex])] = topology.vertexHexes[vertex]
+        paddedPips = numpy.concatenate((self.hexPips, numpy.zeros((self.numLayouts, 1), dtype=numpy.int16)), axis=1)
+        paddedResourcePips = numpy.concatenate(
+            (self.hexResourcePips, numpy.zeros((self.numLayouts, 1, numResources), dtype=numpy.int16)), axis=1)
+        self.vertexPips = paddedPips[:, vertexHexes[:, 0]]
+        self.vertexResourcePips = paddedResourcePips[:, vertexHexes[:, 0]]
+        for i in range(1, vertexHexes.shape[1]):
+            self.vertexPips += paddedPips[:, vertexHexes[:, i]]
+            self.vertexResourcePips += paddedResourcePips[:, vertexHexes[:, i]]
+
+        """ Pips and scarcity of each resource on the whole board """
+        self.resourcePips = self.hexResourcePips.sum(axis=1)
+        self.scarcity = self.resourcePips.mean(axis=1, keepdims=True) / numpy.maximum(self.resourcePips, 1)
+
+        """ Pips next to the 2 intersections of each port """
+        portVertices = numpy.array([[vertex for vertex in range(len(topology.vertices))
+                                     if topology.vertexPorts[vertex] == i]
+                                    for i in range(len(topology.portCoordinates))], dtype=numpy.intp)
+        self.portReach = self.vertexPips[:, portVertices].sum(axis=2)
+
+        """
+        The best opening. If the best pair of intersections does not include the intersection with the
+        most pips, both intersections of the pair are next to it (or it could replace one of them), so
+        the best pair is either that intersection with the best intersection not next to it, or 2 of
+        its neighbors (which are never next to each other).
+        """
+        neighbors = numpy.full((len(topology.vertices), 3), -1, dtype=numpy.intp)
+        closedNeighborhood = numpy.eye(len(topology.vertices), dtype=bool)
+        for vertex in range(len(topology.vertices)):
+            neighbors[vertex, :len(topology.vertexNeighbors[vertex])] = topology.vertexNeighbors[vertex]
+            closedNeighborhood[vertex, topology.vertexNeighbors[vertex]] = True
+        rows = numpy.arange(self.numLayouts)
+        bestVertices = self.vertexPips.argmax(axis=1)
+        bestPips = self.vertexPips[rows, bestVertices]
+        partnerPips = numpy.where(closedNeighborhood[bestVertices], -1, self.vertexPips).max(axis=1)
+        neighborPips = numpy.where(neighbors[bestVertices] == -1, -100,
+                                   numpy.take_along_axis(self.vertexPips, numpy.maximum(neighbors[bestVertices], 0),
+                                                         axis=1))
+        neighborPips.sort(axis=1)
+        self.bestOpenings = numpy.maximum(bestPips + partnerPips, neighborPips[:, 1] + neighborPips[:, 2])
+
+        """ Difference between the best intersection and the fifth best, the best left after 4 picks """
+        sortedPips = numpy.sort(self.vertexPips, axis=1)
+        self.firstPickGaps = sortedPips[:, -1] - sortedPips[:, -5]
+
+    """ Determine whether NumPy is installed, so that layouts can be analyzed """
+    @staticmethod
+    def isAvailable():
+        return numpy is not None
+
+    """ Analyze every layout in a board pool, reading the records straight from the memory-mapped file """
+    @staticmethod
+    def fromPool(pool):
+        records = numpy.frombuffer(pool.data, dtype=numpy.uint8, count=len(pool) * BoardPool.BoardPool.recordSize,
+                                   offset=pool.recordsStart)
+        return LayoutAnalytics(records.reshape(len(pool), BoardPool.BoardPool.recordSize))
+
+    """
+    Analyze the layouts of the games with the specified seeds: the layouts shuffled by Board.initTiles
+    and initPorts, or drawn from boardPool if it is specified, exactly as Game sets them up
+    """
+    @staticmethod
+    def fromSeeds(seeds, boardPool=None):
+        records = bytearray()
+        for seed in seeds:
+            boardRandom = Game.Game.splitSeed(seed, 0)[0]
+            if boardPool is None:
+                board = Board.Board(1, boardRandom, eventSink=NullSink.NullSink())
+                board.initTiles()
+                board.initPorts()
+                records.extend(BoardPool.BoardPool.encodeLayout(board.layout.hexTypes, board.layout.numbers,
+                                                                board.layout.portTypes))
+            else:
+                records.extend(boardPool.getRecord(boardPool.drawIndex(boardRandom)))
+        return LayoutAnalytics(numpy.frombuffer(bytes(records), dtype=numpy.uint8).reshape(
+            -1, BoardPool.BoardPool.recordSize))
+
+    """ Return a column of each statistic in featureNames, with one row per layout """
+    def getFeatures(self):
+        return numpy.column_stack((self.bestOpenings, self.firstPickGaps, self.resourcePips.std(axis=1),
+                                   self.scarcity.max(axis=1), self.portReach.max(axis=1))).astype(numpy.float64)
+
+    """
+    Estimate the advantage of the first seat on each layout from the results of games played on the
+    layouts, in the same order as the layouts. Each layout is usually played only once, so the chance
+    that the first seat wins is fitted as a linear function of the features of the layouts (by least
+    squares), and the advantage of each layout is its fitted chance minus the chance of winning from a
+    random seat. Games without a winner count as losses. Returns the advantage of each layout, the
+    coefficient of each feature (after the intercept), and the overall first seat advantage.
+    """
+    def estimateFirstSeatAdvantage(self, results, numPlayers):
+        firstSeatWins = numpy.array([1.0 if result.winner == 1 else 0.0 for result in results])
+        features = self.getFeatures()
+        design = numpy.column_stack((numpy.ones(self.numLayouts), features))
+        coefficients = numpy.linalg.lstsq(design, firstSeatWins, rcond=None)[0]
+        advantages = design @ coefficients - 1.0 / numPlayers
+        return advantages, coefficients[1:], firstSeatWins.mean() - 1.0 / numPlayers
+
+    """
+    Return the distinct layouts among the layouts analyzed, the number of games played on each and the
+    number won by the first seat, for layouts that were played several times (such as layouts drawn
+    from a small pool)
+    """
+    def countFirstSeatWins(self, results):
+        distinctRecords, layoutIndexes = numpy.unique(self.records, axis=0, return_inverse=True)
+        layoutIndexes = layoutIndexes.ravel()
+        firstSeatWins = numpy.array([1 if result.winner == 1 else 0 for result in results])
+        numGames = numpy.bincount(layoutIndexes, minlength=len(distinctRecords))
+        numWins = numpy.bincount(layoutIndexes, weights=firstSeatWins, minlength=len(distinctRecords))
+        return distinctRecords, numGames, numWins.astype(numpy.int64)
+
+def main():
+    parser = ArgumentParser(description="Estimate how the layout of the board affects the first seat")
+    parser.add_argument("--games", type=int, default=1000, help="number of games to play")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="number of worker processes")
+    parser.add_argument("--players", default="RandComp,RandComp,RandComp,RandComp",
+                        help="comma-separated player types, one per seat")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game")
+    parser.add_argument("--board-pool", help="board pool file the games draw their layouts from")
+    args = parser.parse_args()
+
+    if not LayoutAnalytics.isAvailable():
+        print("NumPy is required to analyze layouts")
+        return
+    playerTypes = [BatchRunner.BatchRunner.getPlayerType(name) for name in args.players.split(",")]
+    runner = BatchRunner.BatchRunner(playerTypes, numWorkers=args.workers, boardPoolPath=args.board_pool)
+    results = runner.run(args.games, args.seed)
+    boardPool = None if args.board_pool is None else BoardPool.BoardPool(args.board_pool)
+    analytics = LayoutAnalytics.fromSeeds([result.seed for result in results], boardPool)
+
+    advantages, coefficients, overallAdvantage = analytics.estimateFirstSeatAdvantage(results, len(playerTypes))
+    print("First seat advantage over all layouts: %+.3f" % overallAdvantage)
+    print("Change in the first seat's chance of winning for each unit of each feature:")
+    features = analytics.getFeatures()
+    for i in range(len(LayoutAnalytics.featureNames)):
+        print("  %-16s %+.4f (mean %.2f)" % (LayoutAnalytics.featureNames[i], coefficients[i], features[:, i].mean()))
+    print("Estimated first seat advantage per layout: min %+.3f, median %+.3f, max %+.3f"
+          % (advantages.min(), numpy.median(advantages), advantages.max()))
+
+if __name__ == "__main__":
+    main()
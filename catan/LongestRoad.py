@@ -0,0 +1,95 @@
+"""
+Finds the length of the longest road of a player: the most roads the player can follow in a row
+without using a road twice, where a road may end at, but never pass through, an intersection with a
+building of another player. Finding the longest road of a whole network by trying every route is
+exponential in the number of roads, so the Board only asks for the length of the connected component
+of roads touched by a change (a new road joins the components at its ends, and an opposing settlement
+may split a component in two), and the length of each component is cached by the shape of the
+component, which is shared by every board since the same shapes come up in game after game.
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+from catan import BitBoard
+from catan import QueryCache
+
+class LongestRoad:
+    """ Number of roads needed for longest road, and the number of points it is worth """
+    minimumLength = 5
+    points = 2
+
+    """ Lengths of the components found so far, keyed by the edges of the component and the blocked intersections """
+    lengthCache = QueryCache.QueryCache(maxSize=16384)
+
+    """
+    Return a mask of the edges of the component of a player's roads (given as a mask of edges) that
+    contains an edge, following the roads through every intersection that is not blocked by an
+    opposing building (given as a mask of intersections)
+    """
+    @staticmethod
+    def findComponent(topology, roadMask, edge, blockedMask):
+        component = 1 << edge
+        frontier = component
+        while frontier:
+            reached = 0
+            for nextEdge in BitBoard.BitBoard.getBits(frontier):
+                for vertex in topology.edges[nextEdge]:
+                    if not (blockedMask >> vertex) & 1:
+                        reached |= topology.vertexEdgeMasks[vertex]
+            frontier = reached & roadMask & ~component
+            component |= frontier
+        return component
+
+    """
+    Return the length of the longest road in a component, looking it up in the cache if it has been seen
+    with the same blocked intersections (given as a mask of the blocked intersections touched by any of
+    the player's roads, so that the same component is found again while other components change)
+    """
+    @staticmethod
+    def getLength(topology, component, blockedMask):
+        return LongestRoad.lengthCache.lookup((component, blockedMask), LongestRoad.computeLength, topology,
+                                              component, blockedMask)
+
+    """
+    Find the length of the longest road in a component by following every route from the intersections
+    where a longest road can start. A longest road that cannot be made longer starts at an intersection
+    that is blocked or where every road of the component is used, so if it starts at an intersection with
+    2 roads it is a loop, which could start at any intersection on it. Only intersections with 1 or 3
+    roads, and blocked intersections, need to be tried, unless the component is a single loop.
+    """
+    @staticmethod
+    def computeLength(topology, component, blockedMask):
+        numRoads = component.bit_count()
+        componentVertices = 0
+        for edge in BitBoard.BitBoard.getBits(component):
+            componentVertices |= topology.edgeVertexMasks[edge]
+        startVertices = []
+        for vertex in BitBoard.BitBoard.getBits(componentVertices):
+            if (topology.vertexEdgeMasks[vertex] & component).bit_count() != 2 or (blockedMask >> vertex) & 1:
+                startVertices.append(vertex)
+        if len(startVertices) == 0:
+            return numRoads
+
+        def extend(vertex, used):
+            longest = 0
+            openEdges = topology.vertexEdgeMasks[vertex] & component & ~used
+            while openEdges:
+                edgeBit = openEdges & -openEdges
+                openEdges ^= edgeBit
+                first, second = topology.edges[edgeBit.bit_length() - 1]
+                nextVertex = second if first == vertex else first
+                if (blockedMask >> nextVertex) & 1:
+                    length = 1
+                else:
+                    length = 1 + extend(nextVertex, used | edgeBit)
+                if length > longest:
+                    longest = length
+            return longest
+
+        longest = 0
+        for vertex in startVertices:
+            longest = max(longest, extend(vertex, 0))
+            if longest == numRoads:
+                break
+        return longest
@@ -0,0 +1,282 @@
+"""
+An instance of the abstract Player class that makes its decisions with Monte Carlo tree search (MCTS).
+For each build, robber move and initial placement, the player plays out many simulated futures of the
+game from a copy of the board, choosing the moves to try with upper confidence bounds (UCT) and
+finishing each simulated game with a rollout policy: "greedy" plays the rest of the game the way
+RandComp does, and "random" chooses every move at random. The resources of other players are hidden,
+so they are guessed again for every simulated game.
+
+Each decision runs for a fixed number of iterations, or for a number of seconds if timeBudget is set
+(which makes the player's decisions depend on the speed of the computer). The settings are class
+attributes, which can be changed in a subclass so the player can be chosen by name like any other
+player type, or passed to the constructor. Every search is reported as a "search" event with the
+number of iterations run per second.
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+from catan.Player import Player
+from catan.SearchNode import SearchNode
+from catan.Simulation import Simulation
+from time import perf_counter
+
+class MctsComp(Player):
+    """ Number of simulated games per decision, used unless timeBudget is set """
+    iterations = 100
+
+    """ Number of seconds to search per decision, or None to run a fixed number of iterations """
+    timeBudget = None
+
+    """ Number of turns to play in each simulated game after the moves chosen by the search """
+    rolloutTurns = 8
+
+    """ The policy used to play simulated games: "greedy" or "random" """
+    rolloutPolicy = "greedy"
+
+    """ Weight of exploring rarely tried moves against repeating the moves with the best results """
+    explorationWeight = 0.7
+
+    """ Number of the best initial settlement locations to consider """
+    numInitialCandidates = 10
+
+    def __init__(self, playerNum, color, playerType, numPlayers, randomGenerator=None, eventSink=None,
+                 iterations=None, timeBudget=None, rolloutTurns=None, rolloutPolicy=None):
+        super().__init__(playerNum, color, playerType, numPlayers, randomGenerator, eventSink)
+        if iterations is not None:
+            self.iterations = iterations
+        if timeBudget is not None:
+            self.timeBudget = timeBudget
+        if rolloutTurns is not None:
+            self.rolloutTurns = rolloutTurns
+        if rolloutPolicy is not None:
+            self.rolloutPolicy = rolloutPolicy
+
+        """ The hexagon chosen for the robber by getPlayerToRob, which getPointToBlock returns """
+        self.robberHex = -1
+
+        """ Total iterations and seconds of every search so far, for reporting the speed of the search """
+        self.totalIterations = 0
+        self.totalSearchTime = 0.0
+
+    """ Return the number of iterations run per second over every search so far """
+    def getIterationsPerSecond(self):
+        if self.totalSearchTime == 0:
+            return 0.0
+        return self.totalIterations / self.totalSearchTime
+
+    """ Return the number of ways to roll the numbers next to each intersection """
+    def getVertexValues(self):
+        vertexValues = []
+        tiles = self.currentBoard.tiles
+        for hexIds in self.currentBoard.topology.vertexHexes:
+            vertexValues.append(sum([tiles[hexId].value for hexId in hexIds]))
+        return vertexValues
+
+    """
+    Search for the best of the actions available for a decision, and return it. The decision is one of
+    "build" (the next build of a turn, or ("end",) to end the turn), "robber" ((hexagon, player to rob)
+    pairs), "settlement" or "road" (an initial settlement and the road built next to it).
+    """
+    def search(self, decision, actions):
+        if len(actions) == 1:
+            return actions[0]
+        vertexValues = self.getVertexValues()
+        root = SearchNode(None, None, list(actions))
+        numIterations = 0
+        startTime = perf_counter()
+        while self.hasBudgetLeft(numIterations, startTime):
+            simulation = Simulation.fromBoard(self.currentBoard, self, self.getPlayerToMove(decision),
+                                              self.pointsToWin, self.randomGenerator, vertexValues)
+
+            """ Follow the most promising moves that have been tried until reaching a move not tried yet """
+            node = root
+            while len(node.untriedActions) == 0 and len(node.children) > 0:
+                node = node.selectChild(self.explorationWeight)
+                self.playAction(simulation, decision, node.action)
+
+            """ Try a new move, then finish the simulated game with the rollout policy """
+            if len(node.untriedActions) > 0:
+                action = node.untriedActions.pop(self.randomGenerator.randrange(len(node.untriedActions)))
+                self.playAction(simulation, decision, action)
+                node = node.addChild(action, self.getNextActions(simulation, decision, action))
+            self.finishSimulation(simulation, decision, node.action)
+            node.backpropagate(simulation.evaluate(self.playerNum))
+            numIterations += 1
+
+        seconds = perf_counter() - startTime
+        self.totalIterations += numIterations
+        self.totalSearchTime += seconds
+        self.eventSink.emit("search", self.currentBoard.turnNumber, self.playerNum,
+                            {"decision": decision, "iterations": numIterations, "seconds": seconds,
+                             "iterationsPerSecond": numIterations / seconds if seconds > 0 else 0.0})
+        return root.getMostVisitedChild().action
+
+    """ Determine whether a search should run another iteration (every search runs at least 1) """
+    def hasBudgetLeft(self, numIterations, startTime):
+        if self.timeBudget is None:
+            return numIterations < self.iterations
+        return numIterations == 0 or perf_counter() - startTime < self.timeBudget
+
+    """ Return the player whose turn it is in the simulated games for a decision """
+    def getPlayerToMove(self, decision):
+        match decision:
+            case "build" | "robber":
+                return self.playerNum
+            case _:
+                """ Simulated games start their first turn after the initial placements are finished """
+                return 1
+
+    """ Make a move in a simulated game """
+    def playAction(self, simulation, decision, action):
+        match decision:
+            case "build":
+                if action[0] == "end":
+                    simulation.endTurn()
+                else:
+                    simulation.applyBuild(self.playerNum, action)
+            case "robber":
+                simulation.applyRobber(self.playerNum, action[0], action[1])
+            case _:
+                if action[0] == "settlement":
+                    simulation.applyInitialSettlement(self.playerNum, action[1])
+                else:
+                    simulation.applyInitialRoad(self.playerNum, action[1])
+
+    """ Return the moves available after a move in a simulated game, or an empty list if the decision is over """
+    def getNextActions(self, simulation, decision, action):
+        match decision:
+            case "build":
+                if action[0] == "end" or simulation.board.playerScores[self.playerNum - 1] >= self.pointsToWin:
+                    return []
+                return [("end",)] + simulation.getBuildActions(self.playerNum)
+            case "settlement" if action[0] == "settlement":
+                """ Search the roads from an initial settlement together with the settlement """
+                return [("road", edge) for edge in simulation.topology.vertexEdges[action[1]]
+                        if simulation.board.edgeOwners[edge] == 0]
+            case _:
+                return []
+
+    """ Finish the decision in a simulated game with the rollout policy, then play out the next turns """
+    def finishSimulation(self, simulation, decision, lastAction):
+        match decision:
+            case "build" | "robber":
+                if lastAction[0] != "end":
+                    simulation.finishTurn(self.rolloutPolicy)
+            case _:
+                if lastAction[0] == "settlement":
+                    simulation.applyInitialRoad(self.playerNum, simulation.chooseInitialRoad(lastAction[1]))
+                numPlaced = sum([len(settlements) for settlements in simulation.board.settlements])
+                simulation.finishInitialPlacement(numPlaced)
+        simulation.rollout(self.rolloutTurns, self.rolloutPolicy)
+
+    """ Search the best initial settlement locations, by total number of ways to roll their numbers """
+    def chooseInitialSettlementLocation(self, board):
+        self.currentBoard = board
+        vertexValues = self.getVertexValues()
+        blockedVertices = self.currentBoard.blockedVertices
+        vertices = [vertex for vertex in range(len(vertexValues)) if vertex not in blockedVertices]
+        vertices.sort(key=lambda vertex: -vertexValues[vertex])
+        action = self.search("settlement", [("settlement", vertex) for vertex in vertices[:self.numInitialCandidates]])
+        return self.currentBoard.hexIntersections[action[1]]
+
+    """ Search the roads from an initial settlement, and return the intersection at the other end of the road """
+    def chooseInitialRoadLocation(self, settleLocation):
+        vertex = self.currentBoard.topology.findVertex(settleLocation)
+        edgeOwners = self.currentBoard.edgeOwners
+        edges = [edge for edge in self.currentBoard.topology.vertexEdges[vertex] if edgeOwners[edge] == 0]
+        action = self.search("road", [("road", edge) for edge in edges])
+        return self.currentBoard.hexIntersections[self.currentBoard.getOtherVertex(action[1], vertex)]
+
+    """ Discard half of the player's resources, always from the resources the player has the most of """
+    def discard(self):
+        numDiscardResources = int(self.getTotalResources() / 2)
+        discarded = [0, 0, 0, 0, 0]
+        for _ in range(numDiscardResources):
+            maxResourceType = 0
+            for i in range(len(self.resources)):
+                if (self.resources[i] > self.resources[maxResourceType]
+                        or (self.resources[i] == self.resources[maxResourceType]
+                            and self.resourcePoints[i] > self.resourcePoints[maxResourceType])):
+                    maxResourceType = i
+            self.resources[maxResourceType] -= 1
+            discarded[maxResourceType] += 1
+        self.eventSink.emit("discard", self.currentBoard.turnNumber, self.playerNum,
+                            {"amount": numDiscardResources, "resources": discarded})
+
+    """
+    Search every hexagon the robber can move to, paired with each opponent next to it who has a
+    resource to steal (or the opponent with the most resources, if no opponent next to it has any),
+    and remember the hexagon chosen for getPointToBlock
+    """
+    def getPlayerToRob(self):
+        numResources = self.currentBoard.numResources
+        hexYields = self.currentBoard.hexYields
+        opponents = [i + 1 for i in range(self.numPlayers) if i != self.playerNum - 1]
+        richestOpponent = opponents[0]
+        for opponent in opponents:
+            if numResources[opponent - 1] > numResources[richestOpponent - 1]:
+                richestOpponent = opponent
+
+        actions = []
+        robberHex = self.currentBoard.robberHex
+        for hexId in range(len(hexYields)):
+            if hexId == robberHex:
+                continue
+            victims = [opponent for opponent in opponents
+                       if hexYields[hexId][opponent - 1] > 0 and numResources[opponent - 1] > 0]
+            if len(victims) == 0:
+                victims = [richestOpponent]
+            for victim in victims:
+                actions.append((hexId, victim))
+        action = self.search("robber", actions)
+        self.robberHex = action[0]
+        return action[1]
+
+    def getPointToBlock(self, playerToRob):
+        return self.currentBoard.tiles[self.robberHex].location
+
+    """ Search for the best build, make it, and repeat until the search chooses to end the turn """
+    def takeTurn(self, currentBoard):
+        self.currentBoard = currentBoard
+        while self.score < self.pointsToWin:
+            actions = Simulation.listBuildActions(self.currentBoard, self.playerNum, self.resources, self.tradeRates)
+            if len(actions) == 0:
+                break
+            action = self.search("build", [("end",)] + actions)
+            if action[0] == "end":
+                break
+            self.build(action)
+        return self.currentBoard
+
+    """ Make the trades a build needs with ports or the bank, and then make the build """
+    def build(self, action):
+        match action[0]:
+            case "city":
+                cost = self.cityCost
+            case "settlement":
+                cost = self.settlementCost
+            case _:
+                cost = self.roadCost
+        for trade in Simulation.getTrades(self.resources, self.tradeRates, cost):
+            self.portResource(trade[0], trade[1])
+        self.payCost(cost)
+
+        match action[0]:
+            case "city":
+                location = self.currentBoard.hexIntersections[action[1]]
+                self.buildCity(location)
+                self.updateResourcePoints(location)
+                self.score += 1
+            case "settlement":
+                location = self.currentBoard.hexIntersections[action[1]]
+                self.buildSettlement(location)
+                newPortType = self.currentBoard.getPortType(location)
+                if newPortType != "":
+                    self.gainPortPower(newPortType)
+                    self.eventSink.emit("port", self.currentBoard.turnNumber, self.playerNum, {"portType": newPortType})
+                self.updateResourcePoints(location)
+                self.score += 1
+            case _:
+                roadLocation = self.currentBoard.topology.edgePoints[action[1]]
+                self.buildRoad(roadLocation.p1, roadLocation.p2)
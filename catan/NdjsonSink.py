@@ -0,0 +1,44 @@
+"""
+An instance of the abstract EventSink class that writes each event as one line of JSON (NDJSON)
+to a file. Events are buffered and written in bulk when the buffer is full and at the end of
+each game, and each line includes the seed of the game the event belongs to.
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+from catan.EventSink import EventSink
+import json
+
+class NdjsonSink(EventSink):
+
+    """ Events are appended to the file at the specified path, which is created if it does not exist """
+    def __init__(self, path, bufferSize=4096):
+        self.file = open(path, "a")
+        self.bufferSize = bufferSize
+        self.buffer = []
+        self.gameSeed = None
+
+    def startGame(self, seed):
+        self.gameSeed = seed
+
+    def endGame(self):
+        self.flush()
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+    def handleEvent(self, event):
+        eventDict = {"game": self.gameSeed}
+        eventDict.update(event.toDict())
+        self.buffer.append(json.dumps(eventDict, separators=(",", ":")) + "\n")
+        if len(self.buffer) >= self.bufferSize:
+            self.flush()
+
+    """ Write every buffered event to the file in a single call """
+    def flush(self):
+        if len(self.buffer) > 0:
+            self.file.writelines(self.buffer)
+            self.buffer = []
+        self.file.flush()
@@ -0,0 +1,20 @@
+"""
+An instance of the abstract EventSink class that discards every event without creating it,
+for running games where the cost of reporting events should be as close to zero as possible
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+from catan.EventSink import EventSink
+
+class NullSink(EventSink):
+
+    def emit(self, kind, turnNumber, playerNum, payload):
+        pass
+
+    def error(self, turnNumber, playerNum, *messageParts):
+        pass
+
+    def handleEvent(self, event):
+        pass
@@ -1,8 +1,9 @@
 """
-Stores a copy of the player's game board which is passed back to the Game class after any
-changes are made. Also keeps track of player resource types, player development cards, and
-the number of points this player has (including hidden development cards). If the player
-wins the game, the turn ends and the player returns this information to the game class.
+Refers to the game board, which is passed back to the Game class after any changes are made
+(the layout of the board is shared by reference and cannot be changed). Also keeps track of
+player resource types, player development cards, and the number of points this player has
+(including hidden development cards). If the player wins the game, the turn ends and the player
+returns this information to the game class.
 
 Includes abstract methods that the class for each player type must override.
 
@@ -11,19 +12,46 @@ Created on Dec 1, 2022
 @author: Andrew Hubbard
 """
 from abc import ABC, abstractmethod
-from catan import Board
-from random import randrange
+from catan import ConsoleSink
+from catan import DevelopmentDeck
+from random import Random
 
 class Player(ABC):
     """ Abstract class to hold each Settlers of Catan player in the game """
 
-    """ Initialize all of the data that the player class will use """
-    def __init__(self, playerNum, color, playerType, numPlayers):
+    """ Number of each resource (ore, wheat, sheep, brick, wood) needed to build each type of piece """
+    settlementCost = (0, 1, 1, 1, 1)
+    cityCost = (3, 2, 0, 0, 0)
+    roadCost = (0, 0, 0, 1, 1)
+    developmentCardCost = (1, 1, 1, 0, 0)
+
+    """
+    Initialize all of the data that the player class will use. randomGenerator is the stream of random
+    numbers used for all of this player's decisions (a new, randomly seeded stream if not specified),
+    and eventSink receives the player's trades, discards and errors (printed if not specified).
+    """
+    def __init__(self, playerNum, color, playerType, numPlayers, randomGenerator=None, eventSink=None):
+        if randomGenerator is None:
+            randomGenerator = Random()
+        if eventSink is None:
+            eventSink = ConsoleSink.ConsoleSink()
+        self.randomGenerator = randomGenerator
+        self.eventSink = eventSink
         self.playerNum = playerNum
         self.color = color
         self.playerType = playerType
         self.numPlayers = numPlayers
-        self.currentBoard = Board.Board(numPlayers)
+        """ The board of the game, given to the player by the game before the player makes any decision """
+        self.currentBoard = None
+        """
+        Functions that build a settlement, city or road for the player on the board, given to the player by the
+        game, since the player only has a read-only view of the board
+        """
+        self.buildSettlement = None
+        self.buildCity = None
+        self.buildRoad = None
+        """ Number of points needed to win the game, also set by the game before the player makes any decision """
+        self.pointsToWin = 10
         self.resources = [0, 0, 0, 0, 0]
         self.tradeRates = [4, 4, 4, 4, 4]
         self.tempTradeRates = [4, 4, 4, 4, 4]
@@ -31,27 +59,29 @@ class Player(ABC):
         self.resourcePoints = [0, 0, 0, 0, 0]
         """ Player will need to keep track of its own score because of hidden victory point cards """
         self.score = 0
+        """ Number of each type of development card in the player's hidden hand, indexed as in DevelopmentDeck """
+        self.developmentCards = [0, 0, 0, 0, 0]
+        """ The deck of development cards of the game, given to the player by the game like the board """
+        self.developmentDeck = None
 
     """ Add a resource by index for the player, and add 1 to the player's number of resources """
     def gainResource(self, resourceIndex):
         if resourceIndex < 0 or resourceIndex > 4:
-            print("ERROR: Player", self.playerNum, "tried to collect resource number",
-                  resourceIndex, "which is not a valid resource")
+            self.eventSink.error(self.currentBoard.turnNumber, self.playerNum, "Player", self.playerNum,
+                                 "tried to collect resource number", resourceIndex, "which is not a valid resource")
         else:
             self.resources[resourceIndex] += 1
-            self.currentBoard.numResources[self.playerNum - 1] += 1
 
     """ Remove a resource by index for the player, and subtract 1 from the player's number of resources """
     def loseResource(self, resourceIndex):
         if resourceIndex < 0 or resourceIndex > 4:
-            print("ERROR: Player", self.playerNum, "tried to discard resource number",
-                  resourceIndex, "which is not a valid resource")
+            self.eventSink.error(self.currentBoard.turnNumber, self.playerNum, "Player", self.playerNum,
+                                 "tried to discard resource number", resourceIndex, "which is not a valid resource")
         elif self.resources[resourceIndex] < 1:
-            print("ERROR: Player", self.playerNum, "tried to discard resource number",
-                  resourceIndex, "but has none of this resource")
+            self.eventSink.error(self.currentBoard.turnNumber, self.playerNum, "Player", self.playerNum,
+                                 "tried to discard resource number", resourceIndex, "but has none of this resource")
         else:
             self.resources[resourceIndex] -= 1
-            self.currentBoard.numResources[self.playerNum - 1] -= 1
 
     """ Return the text corresponding to a resource index """
     @staticmethod
@@ -95,32 +125,30 @@ class Player(ABC):
     """ Trade a resource for another resource with a port or the bank """
     def portResource(self, oldResource, newResource):
         if oldResource < 0 or oldResource > 4:
-            print("ERROR: Player", self.playerNum, "tried to trade away invalid resource number",
-                  oldResource, "using a port")
+            self.eventSink.error(self.currentBoard.turnNumber, self.playerNum, "Player", self.playerNum,
+                                 "tried to trade away invalid resource number", oldResource, "using a port")
         elif newResource < 0 or newResource > 4:
-            print("ERROR: Player", self.playerNum, "tried to trade for invalid resource number",
-                  newResource, "using a port")
+            self.eventSink.error(self.currentBoard.turnNumber, self.playerNum, "Player", self.playerNum,
+                                 "tried to trade for invalid resource number", newResource, "using a port")
         elif self.resources[oldResource] < self.tradeRates[oldResource]:
             if self.tradeRates[oldResource] < 4:
-                print("ERROR: Player", self.playerNum, "tried to trade", oldResource.getResourceType(),
-                      "using a port. This player has", self.resources[oldResource], "and needs at least",
-                      self.tradeRates[oldResource], "to make this trade.")
+                self.eventSink.error(self.currentBoard.turnNumber, self.playerNum, "Player", self.playerNum,
+                                     "tried to trade", self.getResourceType(oldResource), "using a port.",
+                                     "This player has", self.resources[oldResource], "and needs at least",
+                                     self.tradeRates[oldResource], "to make this trade.")
             else:
-                print("ERROR: Player", self.playerNum, "tried to trade", oldResource.getResourceType(),
-                      "with the bank. This player has", self.resources[oldResource], "and needs at least",
-                      self.tradeRates[oldResource], "to make this trade.")
+                self.eventSink.error(self.currentBoard.turnNumber, self.playerNum, "Player", self.playerNum,
+                                     "tried to trade", self.getResourceType(oldResource), "with the bank.",
+                                     "This player has", self.resources[oldResource], "and needs at least",
+                                     self.tradeRates[oldResource], "to make this trade.")
         else:
             self.resources[newResource] += 1
             self.resources[oldResource] -= self.tradeRates[oldResource]
 
-            if self.tradeRates[oldResource] < 4:
-                print("Player", self.playerNum, "just traded", self.tradeRates[oldResource],
-                      self.getResourceType(oldResource), "for 1",
-                      self.getResourceType(newResource), "using a port")
-            else:
-                print("Player", self.playerNum, "just traded", self.tradeRates[oldResource],
-                      self.getResourceType(oldResource), "for 1",
-                      self.getResourceType(newResource), "from the bank")
+            self.eventSink.emit("trade", self.currentBoard.turnNumber, self.playerNum,
+                                {"amount": self.tradeRates[oldResource], "given": self.getResourceType(oldResource),
+                                 "received": self.getResourceType(newResource),
+                                 "port": self.tradeRates[oldResource] < 4})
 
     """ Count the total number of resources owned by a player """
     def getTotalResources(self):
@@ -154,7 +182,8 @@ class Player(ABC):
             case "wood":
                 self.tradeRates[4] = 2
             case _:
-                print("ERROR: Invalid port type", portType, "gained by player", self.playerNum)
+                self.eventSink.error(self.currentBoard.turnNumber, self.playerNum, "Invalid port type", portType,
+                                     "gained by player", self.playerNum)
 
     """ Temporarily adjust the trade rates of the player based on a port location being considered """
     def tempGainPortPower(self, portType):
@@ -174,13 +203,14 @@ class Player(ABC):
             case "wood":
                 self.tempTradeRates[4] = 2
             case _:
-                print("ERROR: Invalid port type", portType, "gained by player", self.playerNum, "while testing")
+                self.eventSink.error(self.currentBoard.turnNumber, self.playerNum, "Invalid port type", portType,
+                                     "gained by player", self.playerNum, "while testing")
 
     """ Choose a random resource to be stolen or discarded """
     def getRandomResource(self):
         total = self.getTotalResources()
         if total > 0:
-            resourceNum = randrange(total)
+            resourceNum = self.randomGenerator.randrange(total)
         else:
             return -1
 
@@ -195,13 +225,152 @@ class Player(ABC):
         elif resourceNum < total:
             return 4
         else:
-            print("ERROR: Invalid attempt to choose resource", resourceNum, "out of", total, "resources")
+            self.eventSink.error(self.currentBoard.turnNumber, self.playerNum, "Invalid attempt to choose resource",
+                                 resourceNum, "out of", total, "resources")
+            return -1
+
+    """
+    Apply a move for the player in place, on the player's board, and return an undo token which the
+    undo method uses to restore exactly the state of the player and the board before the move, or -1
+    if the move is not legal or the player cannot afford it. Undo tokens must be undone in the reverse
+    order of the moves. Moves are not reported as events, since they are only being tried out.
+    The player's board must be the player's own copy, made with clone, since the view of the board
+    that the game gives its players cannot be changed.
+    """
+    def applySettlement(self, location):
+        if not self.canAfford(self.settlementCost, "a settlement"):
+            return -1
+        token = self.getUndoToken(self.currentBoard.applySettlement(location, self.color, self.playerNum))
+        if token[1] == -1:
+            return -1
+        self.payCost(self.settlementCost)
+        newPortType = self.currentBoard.getPortType(location)
+        if newPortType != "":
+            self.gainPortPower(newPortType)
+        self.updateResourcePoints(location)
+        self.score += 1
+        return token
+
+    def applyCity(self, location):
+        if not self.canAfford(self.cityCost, "a city"):
+            return -1
+        token = self.getUndoToken(self.currentBoard.applyCity(location, self.color, self.playerNum))
+        if token[1] == -1:
             return -1
+        self.payCost(self.cityCost)
+        self.updateResourcePoints(location)
+        self.score += 1
+        return token
 
-    """ Print the player's current resources to the screen """
+    def applyRoad(self, location1, location2):
+        if not self.canAfford(self.roadCost, "a road"):
+            return -1
+        token = self.getUndoToken(self.currentBoard.applyRoad(location1, location2, self.color, self.playerNum))
+        if token[1] == -1:
+            return -1
+        self.payCost(self.roadCost)
+        return token
+
+    """ Trade a resource for another resource with a port or the bank, at the player's trade rate """
+    def applyTrade(self, oldResource, newResource):
+        if oldResource < 0 or oldResource > 4 or newResource < 0 or newResource > 4:
+            self.eventSink.error(self.currentBoard.turnNumber, self.playerNum, "Player", self.playerNum,
+                                 "tried to trade resource number", oldResource, "for resource number", newResource)
+            return -1
+        if self.resources[oldResource] < self.tradeRates[oldResource]:
+            self.eventSink.error(self.currentBoard.turnNumber, self.playerNum, "Player", self.playerNum,
+                                 "tried to trade", self.getResourceType(oldResource), "but has",
+                                 self.resources[oldResource], "and needs at least", self.tradeRates[oldResource])
+            return -1
+        token = self.getUndoToken(-1)
+        self.resources[newResource] += 1
+        self.resources[oldResource] -= self.tradeRates[oldResource]
+        return token
+
+    """ Take back the move that returned an undo token (nothing is done for a move that was not legal) """
+    def undo(self, token):
+        if token == -1:
+            return
+        self.currentBoard.undo(token[1])
+        self.resources[:] = token[2]
+        self.tradeRates[:] = token[3]
+        self.resourcePoints[:] = token[4]
+        self.score = token[5]
+
+    """
+    Buy a development card from the deck and return its type, or -1 if the deck is empty or the player
+    cannot afford a card. The card is added to the player's hidden hand, and a victory point card counts
+    toward the player's score as soon as it is bought.
+    """
+    def buyDevelopmentCard(self):
+        if self.developmentDeck is None or len(self.developmentDeck) == 0:
+            return -1
+        if not self.canAfford(self.developmentCardCost, "a development card"):
+            return -1
+        self.payCost(self.developmentCardCost)
+        cardType = self.developmentDeck.draw()
+        self.gainDevelopmentCard(cardType)
+        self.eventSink.emit("buyDevelopmentCard", self.currentBoard.turnNumber, self.playerNum,
+                            {"card": DevelopmentDeck.DevelopmentDeck.getCardName(cardType)})
+        return cardType
+
+    """ Add a development card to the player's hand, and count a victory point card toward the player's score """
+    def gainDevelopmentCard(self, cardType):
+        self.developmentCards[cardType] += 1
+        if cardType == DevelopmentDeck.DevelopmentDeck.VICTORY_POINT:
+            self.score += 1
+
+    """ Remove a development card that is being played from the player's hand """
+    def removeDevelopmentCard(self, cardType):
+        self.developmentCards[cardType] -= 1
+
+    """ Take every resource of a type from each other player, for a monopoly card, and return the number taken """
+    def takeAllResources(self, resourceIndex, players):
+        numTaken = 0
+        for player in players:
+            if player is not self:
+                amount = player.resources[resourceIndex]
+                player.resources[resourceIndex] = 0
+                numTaken += amount
+        self.resources[resourceIndex] += numTaken
+        return numTaken
+
+    """ Return an undo token holding a board undo token and the player's state before a move """
+    def getUndoToken(self, boardToken):
+        return ("player", boardToken, tuple(self.resources), tuple(self.tradeRates), tuple(self.resourcePoints),
+                self.score)
+
+    """ Determine whether the player has the resources to pay a cost, and report an error if not """
+    def canAfford(self, cost, pieceName):
+        for i in range(len(cost)):
+            if self.resources[i] < cost[i]:
+                self.eventSink.error(self.currentBoard.turnNumber, self.playerNum, "Player", self.playerNum,
+                                     "cannot afford", pieceName)
+                return False
+        return True
+
+    def payCost(self, cost):
+        for i in range(len(cost)):
+            self.resources[i] -= cost[i]
+
+    """ Report the player's current resources """
     def printResources(self):
-        print("Player", self.playerNum, "has", self.score, "points, and", self.resources[0], "ore,", self.resources[1],
-              "wheat,", self.resources[2], "sheep,", self.resources[3], "brick, and", self.resources[4], "wood")
+        self.eventSink.emit("resources", self.currentBoard.turnNumber, self.playerNum,
+                            {"score": self.score, "ore": self.resources[0], "wheat": self.resources[1],
+                             "sheep": self.resources[2], "brick": self.resources[3], "wood": self.resources[4]})
+
+    """
+    Choose a development card to play after rolling the dice, and return its type and a list of its
+    arguments: the 2 resource indexes to take for year of plenty, or the resource index to take for
+    monopoly (none for a knight or road building). Return None to play no card, as players that do
+    not use development cards always do.
+    """
+    def chooseDevelopmentCard(self):
+        return None
+
+    """ Choose where to build a free road for a road building card, or return None to build no more roads """
+    def chooseFreeRoadLocation(self):
+        return None
 
     @abstractmethod
     def chooseInitialSettlementLocation(self, board):
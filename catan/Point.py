@@ -1,5 +1,7 @@
 """
-Structure to hold the coordinates of each intersection on the Catan board
+Structure to hold the coordinates of each intersection on the Catan board.
+Points are immutable and interned, so that creating the same coordinates twice returns the same
+object. Each Point has an integer id packed from its coordinates, which is also its hash.
 
 Created on Sep 2, 2022
 
@@ -7,21 +9,43 @@ Created on Sep 2, 2022
 """
 
 class Point:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
+    __slots__ = ("x", "y", "id")
+
+    """ Every Point created so far, keyed by its id """
+    internedPoints = {}
+
+    def __new__(cls, x, y):
+        pointId = Point.getId(x, y)
+        point = Point.internedPoints.get(pointId)
+        if point is None:
+            point = object.__new__(cls)
+            object.__setattr__(point, "x", x)
+            object.__setattr__(point, "y", y)
+            object.__setattr__(point, "id", pointId)
+            Point.internedPoints[pointId] = point
+        return point
+
+    """ Pack a pair of integer coordinates into a single integer id """
+    @staticmethod
+    def getId(x, y):
+        return (x + 512) * 1024 + (y + 512)
+
+    ''' Points cannot be changed after they are created, since the same object is shared by every user '''
+    def __setattr__(self, name, value):
+        raise AttributeError("Point objects are immutable")
+
+    ''' Keep the interned object when a Point is copied or sent to another process '''
+    def __reduce__(self):
+        return Point, (self.x, self.y)
 
     ''' Determines whether 2 Point objects are equal (==) to each other '''
     def __eq__(self, other):
-        if int(self.x - other.x) == 0 and int(self.y - other.y) == 0:
-            return True
-        else:
-            return False
+        return self is other or (self.x == other.x and self.y == other.y)
 
-    ''' Determines whether 2 DoublePoint objects are not equal (!=) to each other '''
+    ''' Determines whether 2 Point objects are not equal (!=) to each other '''
     def __ne__(self, other):
         return not self.__eq__(other)
 
     ''' Allows for duplicate removal from a list of Point objects '''
     def __hash__(self):
-        return hash(str(int(self.x)) + "," + str(int(self.y)))
+        return self.id
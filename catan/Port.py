@@ -1,5 +1,6 @@
 """
-Structure to hold the type and location of each port on the Catan board
+Structure to hold the type and location of each port on the Catan board.
+Ports are immutable and interned, so every port with the same type and location is the same object.
 
 Created on Sep 2, 2022
 
@@ -7,10 +8,23 @@ Created on Sep 2, 2022
 """
 
 class Port:
+    __slots__ = ("portType", "portLocations")
 
-    def __init__(self, portType):
-        self.portLocations = None
-        self.portType = portType
+    """ Every Port created so far, keyed by its type and the ids of its locations """
+    internedPorts = {}
 
-    def setPortLocations(self, portLocations):
-        self.portLocations = portLocations
+    def __new__(cls, portType, portLocations):
+        key = (portType, portLocations.p1.id, portLocations.p2.id)
+        port = Port.internedPorts.get(key)
+        if port is None:
+            port = object.__new__(cls)
+            object.__setattr__(port, "portType", portType)
+            object.__setattr__(port, "portLocations", portLocations)
+            Port.internedPorts[key] = port
+        return port
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Port objects are immutable")
+
+    def __reduce__(self):
+        return Port, (self.portType, self.portLocations)
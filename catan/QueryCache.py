@@ -0,0 +1,48 @@
+"""
+Bounded cache of the results of queries on a Board, such as the locations where a player could build.
+Each result is stored under its query, its arguments and the epoch of the board when it was computed,
+so a result is only found again while the board is in the same state. When the cache is full, the
+result used least recently is evicted, which is almost always a result from an earlier epoch.
+The number of hits and misses are counted to show how well the cache is working.
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+from collections import OrderedDict
+
+class QueryCache:
+    """ Marker for a key that is not in the cache, since None is a valid result """
+    missing = object()
+
+    def __init__(self, maxSize=2048):
+        self.maxSize = maxSize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    """ Return the result stored under a key, or compute it with compute(*args) and store it """
+    def lookup(self, key, compute, *args):
+        result = self.entries.get(key, QueryCache.missing)
+        if result is not QueryCache.missing:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return result
+        self.misses += 1
+        result = compute(*args)
+        if self.maxSize > 0:
+            self.entries[key] = result
+            if len(self.entries) > self.maxSize:
+                self.entries.popitem(last=False)
+        return result
+
+    """ Return the fraction of lookups that found a stored result """
+    def getHitRate(self):
+        if self.hits + self.misses == 0:
+            return 0.0
+        return self.hits / (self.hits + self.misses)
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
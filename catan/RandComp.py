@@ -6,12 +6,16 @@ Created on Dec 1, 2022
 
 @author: Andrew Hubbard
 """
+from catan.CandidateScorer import CandidateScorer
+from catan.DevelopmentDeck import DevelopmentDeck
 from catan.Player import Player
-from random import randrange
 
 class RandComp(Player):
-    def __init__(self, playerNum, color, playerType, numPlayers):
-        super().__init__(playerNum, color, playerType, numPlayers)
+    """ Score all of the candidate locations for a decision together with NumPy arrays, if NumPy is installed """
+    useVectorizedScoring = True
+
+    def __init__(self, playerNum, color, playerType, numPlayers, randomGenerator=None, eventSink=None):
+        super().__init__(playerNum, color, playerType, numPlayers, randomGenerator, eventSink)
 
     """
     Calculate the expected value of a possible settlement or city location, based on
@@ -60,6 +64,37 @@ class RandComp(Player):
 
         return roadValue
 
+    """ Return the CandidateScorer for the current board, or None if locations are scored one at a time """
+    def getScorer(self):
+        if not self.useVectorizedScoring or not CandidateScorer.isAvailable():
+            return None
+        return CandidateScorer.getShared(self.currentBoard)
+
+    """
+    Return the value of a settlement or city at each location, computed for every intersection at once
+    if possible. The values of every intersection are cached by the board, keyed on the player's resource
+    points and trade rates as well as the player's pieces.
+    """
+    def getHexValues(self, locations):
+        scorer = self.getScorer()
+        if scorer is None:
+            return [self.getHexValue(location) for location in locations]
+        hexValues = self.currentBoard.cachedQuery("hexValues", (tuple(self.resourcePoints), tuple(self.tradeRates)),
+                                                  scorer.getHexValues, self.playerNum)
+        return hexValues[[self.currentBoard.topology.findVertex(location) for location in locations]].tolist()
+
+    """ Return the value of a road at each possible road location, computed together if possible """
+    def getRoadValues(self, possibleRoads):
+        scorer = self.getScorer()
+        if scorer is None:
+            return [self.getRoadValue(possibleRoad) for possibleRoad in possibleRoads]
+        hexValues = self.currentBoard.cachedQuery("hexValues", (tuple(self.resourcePoints), tuple(self.tradeRates)),
+                                                  scorer.getHexValues, self.playerNum)
+        edges = [self.currentBoard.topology.findEdge(possibleRoad.p1, possibleRoad.p2)
+                 for possibleRoad in possibleRoads]
+        return scorer.getRoadValues(hexValues, edges, self.currentBoard.getRoadVertexMask(self.playerNum),
+                                    self.currentBoard.blockedVertices).tolist()
+
     """ 
     Choose the best possible initial settlement location based on resource 
     probability, resource diversity, access to ports, and a random factor
@@ -69,13 +104,15 @@ class RandComp(Player):
         maxValue = -1
         maxIndex = -1
 
-        for i in range(len(self.currentBoard.hexIntersections)):
-            if self.currentBoard.legalPlacement(self.currentBoard.hexIntersections[i]):
-                random = randrange(20) / 10.0
-                hexValue = self.getHexValue(self.currentBoard.hexIntersections[i]) + random
-                if hexValue > maxValue:
-                    maxValue = hexValue
-                    maxIndex = i
+        legalIndices = [i for i in range(len(self.currentBoard.hexIntersections))
+                        if self.currentBoard.legalPlacement(self.currentBoard.hexIntersections[i])]
+        hexValues = self.getHexValues([self.currentBoard.hexIntersections[i] for i in legalIndices])
+        for j in range(len(legalIndices)):
+            random = self.randomGenerator.randrange(20) / 10.0
+            hexValue = hexValues[j] + random
+            if hexValue > maxValue:
+                maxValue = hexValue
+                maxIndex = legalIndices[j]
 
         return self.currentBoard.hexIntersections[maxIndex]
 
@@ -85,7 +122,7 @@ class RandComp(Player):
     """
     def chooseInitialRoadLocation(self, settleLocation):
         possibleRoadPoints = self.currentBoard.getAdjacentIntersections(settleLocation)
-        roadPointIndex = randrange(len(possibleRoadPoints))
+        roadPointIndex = self.randomGenerator.randrange(len(possibleRoadPoints))
         return possibleRoadPoints[roadPointIndex]
 
     """ 
@@ -97,8 +134,7 @@ class RandComp(Player):
         maxResourceType = -1
         maxResourceAccess = -100
 
-        print("Player", self.playerNum, "discarded", numDiscardResources,
-              "resources on turn", self.currentBoard.turnNumber)
+        discarded = [0, 0, 0, 0, 0]
         for _ in range(numDiscardResources):
             for i in range(len(self.resources)):
                 resourceAccess = self.resources[i] * self.resources[i] + self.resourcePoints[i]
@@ -106,9 +142,9 @@ class RandComp(Player):
                     maxResourceType = i
                     maxResourceAccess = resourceAccess
             self.resources[maxResourceType] -= 1
-
-        """ Set the board's number of resources for the player based on the player's actual resources """
-        self.currentBoard.numResources[self.playerNum - 1] = self.getTotalResources()
+            discarded[maxResourceType] += 1
+        self.eventSink.emit("discard", self.currentBoard.turnNumber, self.playerNum,
+                            {"amount": numDiscardResources, "resources": discarded})
 
     """
     Generate a random number between 0 and 2 and add it to each player's score, 
@@ -119,18 +155,20 @@ class RandComp(Player):
         maxPoints = 0.0
         playerToRob = -1
         cannotRob = 1
+        numResources = self.currentBoard.numResources
+        playerScores = self.currentBoard.playerScores
 
         """ Determine whether any player has a resource to steal """
-        for i in range(len(self.currentBoard.numResources)):
-            if i != (self.playerNum - 1) and self.currentBoard.numResources[i] > 0:
+        for i in range(len(numResources)):
+            if i != (self.playerNum - 1) and numResources[i] > 0:
                 cannotRob = 0
 
         """ Select a player to rob randomly who is leading or close to the lead """
-        for i in range(len(self.currentBoard.playerScores)):
-            random = randrange(20) / 10.0
-            if (((cannotRob == 0 and self.currentBoard.numResources[i] > 0) or cannotRob == 1)
-                    and i != (self.playerNum - 1) and self.currentBoard.playerScores[i] + random > maxPoints):
-                maxPoints = self.currentBoard.playerScores[i] + random
+        for i in range(len(playerScores)):
+            random = self.randomGenerator.randrange(20) / 10.0
+            if (((cannotRob == 0 and numResources[i] > 0) or cannotRob == 1)
+                    and i != (self.playerNum - 1) and playerScores[i] + random > maxPoints):
+                maxPoints = playerScores[i] + random
                 playerToRob = i + 1
         return playerToRob
 
@@ -138,29 +176,18 @@ class RandComp(Player):
     def getPointToBlock(self, playerToRob):
         possibleBlockLocations = []
         """ Create a list of possible locations from which to block playerToRob """
-        for i in range(len(self.currentBoard.settlements)):
-            if len(self.currentBoard.settlements[i]) > 0:
-                for j in range(len(self.currentBoard.settlements[i])):
-                    if self.currentBoard.settlements[i][j].playerNum != playerToRob:
-                        continue
-                    neighbors = (self.currentBoard.getAdjacentHexes(self.currentBoard.settlements[i][j].location))
-                    for k in range(len(neighbors)):
-                        possibleBlockLocations.append(neighbors[k])
-
-        for i in range(len(self.currentBoard.cities)):
-            if len(self.currentBoard.cities[i]) > 0:
-                for j in range(len(self.currentBoard.cities[i])):
-                    if self.currentBoard.cities[i][j].playerNum != playerToRob:
-                        continue
-                    neighbors = (self.currentBoard.getAdjacentHexes(self.currentBoard.cities[i][j].location))
-                    for k in range(len(neighbors)):
-                        possibleBlockLocations.append(neighbors[k])
+        for buildings in self.currentBoard.settlements + self.currentBoard.cities:
+            for building in buildings:
+                if building.playerNum != playerToRob:
+                    continue
+                possibleBlockLocations.extend(self.currentBoard.getAdjacentHexes(building.location))
 
         """ Remove duplicates by converting to a Python set and back to a list """
         possibleBlockLocations = [*set(possibleBlockLocations)]
 
         maxValue = -100
         maxIndices = []
+        playerScores = self.currentBoard.playerScores
 
         """
         Assign a significant negative value if we are blocking ourselves. 
@@ -184,7 +211,7 @@ class RandComp(Player):
                 if anySettlementIndex != -1:
                     if mySettlementIndex == -1:
                         ''' TODO: This references the wrong player '''
-                        hexValue += self.currentBoard.playerScores[self.playerNum - 1]
+                        hexValue += playerScores[self.playerNum - 1]
                     else:
                         hexValue -= 20
 
@@ -196,7 +223,7 @@ class RandComp(Player):
                 if anyCityIndex != -1:
                     if myCityIndex == -1:
                         ''' TODO: This references the wrong player '''
-                        hexValue += (self.currentBoard.playerScores[self.playerNum - 1] * 2)
+                        hexValue += (playerScores[self.playerNum - 1] * 2)
                     else:
                         hexValue -= 40
 
@@ -209,7 +236,7 @@ class RandComp(Player):
                 maxIndices.append(i)
 
         """ Choose one of the best possible locations to block randomly """
-        randomIndex = randrange(len(maxIndices))
+        randomIndex = self.randomGenerator.randrange(len(maxIndices))
 
         return possibleBlockLocations[maxIndices[randomIndex]].location
 
@@ -282,7 +309,8 @@ class RandComp(Player):
                     elif tempResources[1] < 2:
                         tempResources[1] += 1
                     else:
-                        print("ERROR: Invalid attempt to trade resources to build a city")
+                        self.eventSink.error(self.currentBoard.turnNumber, self.playerNum,
+                                             "Invalid attempt to trade resources to build a city")
                     resourcesToTrade.append(maxIndex)
                     tempResources[maxIndex] -= self.tradeRates[maxIndex]
 
@@ -362,7 +390,8 @@ class RandComp(Player):
                     elif tempResources[4] < 1:
                         tempResources[4] += 1
                     else:
-                        print("ERROR: Invalid attempt to trade resources to build a settlement")
+                        self.eventSink.error(self.currentBoard.turnNumber, self.playerNum,
+                                             "Invalid attempt to trade resources to build a settlement")
                     resourcesToTrade.append(maxIndex)
                     tempResources[maxIndex] -= self.tradeRates[maxIndex]
 
@@ -438,7 +467,8 @@ class RandComp(Player):
                     elif tempResources[4] < 1:
                         tempResources[4] += 1
                     else:
-                        print("ERROR: Invalid attempt to trade resources to build a road")
+                        self.eventSink.error(self.currentBoard.turnNumber, self.playerNum,
+                                             "Invalid attempt to trade resources to build a road")
                     resourcesToTrade.append(maxIndex)
                     tempResources[maxIndex] -= self.tradeRates[maxIndex]
 
@@ -463,8 +493,9 @@ class RandComp(Player):
                 elif self.resources[1] < 2 and resourcesToTrade[i] != 1:
                     resourceReceived = 1
                 else:
-                    print("ERROR: Invalid attempt to trade", self.getResourceType(resourcesToTrade[i]),
-                          "by player", self.playerNum, "while trying to build a city")
+                    self.eventSink.error(self.currentBoard.turnNumber, self.playerNum, "Invalid attempt to trade",
+                                         self.getResourceType(resourcesToTrade[i]), "by player", self.playerNum,
+                                         "while trying to build a city")
                     continue
                 self.portResource(resourcesToTrade[i], resourceReceived)
 
@@ -472,9 +503,10 @@ class RandComp(Player):
         if self.resources[0] >= 3 and self.resources[1] >= 2:
             cityIndex = -1
             maxValue = -10
+            cityValues = self.getHexValues(cityPoints)
             for i in range(len(cityPoints)):
-                random = randrange(20) / 10.0
-                cityValue = self.getHexValue(cityPoints[i]) + random
+                random = self.randomGenerator.randrange(20) / 10.0
+                cityValue = cityValues[i] + random
                 if cityValue > maxValue:
                     maxValue = cityValue
                     cityIndex = i
@@ -482,7 +514,7 @@ class RandComp(Player):
             if cityIndex != -1:
                 self.resources[0] -= 3
                 self.resources[1] -= 2
-                self.currentBoard.addCity(cityPoints[cityIndex], self.color, self.playerNum, False)
+                self.buildCity(cityPoints[cityIndex])
                 self.updateResourcePoints(cityPoints[cityIndex])
                 self.score += 1
                 return cityIndex
@@ -510,8 +542,9 @@ class RandComp(Player):
                 elif self.resources[4] < 1 and resourcesToTrade[i] != 4:
                     resourceReceived = 4
                 else:
-                    print("ERROR: Invalid attempt to trade", self.getResourceType(resourcesToTrade[i]),
-                          "by player", self.playerNum, "while trying to build a settlement")
+                    self.eventSink.error(self.currentBoard.turnNumber, self.playerNum, "Invalid attempt to trade",
+                                         self.getResourceType(resourcesToTrade[i]), "by player", self.playerNum,
+                                         "while trying to build a settlement")
                     continue
                 self.portResource(resourcesToTrade[i], resourceReceived)
 
@@ -519,9 +552,10 @@ class RandComp(Player):
         if self.resources[1] > 0 and self.resources[2] > 0 and self.resources[3] > 0 and self.resources[4] > 0:
             settlementIndex = -1
             maxValue = -10
+            settlementValues = self.getHexValues(settlementPoints)
             for i in range(len(settlementPoints)):
-                random = randrange(20) / 10.0
-                settlementValue = self.getHexValue(settlementPoints[i]) + random
+                random = self.randomGenerator.randrange(20) / 10.0
+                settlementValue = settlementValues[i] + random
                 if settlementValue > maxValue:
                     maxValue = settlementValue
                     settlementIndex = i
@@ -531,11 +565,11 @@ class RandComp(Player):
                 self.resources[2] -= 1
                 self.resources[3] -= 1
                 self.resources[4] -= 1
-                self.currentBoard.addSettlement(settlementPoints[settlementIndex], self.color, self.playerNum, False)
+                self.buildSettlement(settlementPoints[settlementIndex])
                 newPortType = self.currentBoard.getPortType(settlementPoints[settlementIndex])
                 if newPortType != "":
                     self.gainPortPower(newPortType)
-                    print("Player", self.playerNum, "just acquired a", newPortType, "port!")
+                    self.eventSink.emit("port", self.currentBoard.turnNumber, self.playerNum, {"portType": newPortType})
                 self.updateResourcePoints(settlementPoints[settlementIndex])
                 self.score += 1
                 return settlementIndex
@@ -559,8 +593,9 @@ class RandComp(Player):
                 elif self.resources[4] < 1 and resourcesToTrade[i] != 4:
                     resourceReceived = 4
                 else:
-                    print("ERROR: Invalid attempt to trade", self.getResourceType(resourcesToTrade[i]),
-                          "by player", self.playerNum, "while trying to build a road")
+                    self.eventSink.error(self.currentBoard.turnNumber, self.playerNum, "Invalid attempt to trade",
+                                         self.getResourceType(resourcesToTrade[i]), "by player", self.playerNum,
+                                         "while trying to build a road")
                     continue
                 self.portResource(resourcesToTrade[i], resourceReceived)
 
@@ -568,9 +603,10 @@ class RandComp(Player):
         if self.resources[3] > 0 and self.resources[4] > 0:
             roadIndex = -1
             maxValue = -10
+            roadValues = self.getRoadValues(roadPoints)
             for i in range(len(roadPoints)):
-                random = randrange(20) / 10.0
-                roadValue = self.getRoadValue(roadPoints[i]) + random
+                random = self.randomGenerator.randrange(20) / 10.0
+                roadValue = roadValues[i] + random
                 if roadValue > maxValue:
                     maxValue = roadValue
                     roadIndex = i
@@ -578,14 +614,73 @@ class RandComp(Player):
             if roadIndex != -1:
                 self.resources[3] -= 1
                 self.resources[4] -= 1
-                self.currentBoard.addRoad(roadPoints[roadIndex].p1, roadPoints[roadIndex].p2, self.color,
-                                          self.playerNum, False)
+                self.buildRoad(roadPoints[roadIndex].p1, roadPoints[roadIndex].p2)
                 return roadIndex
         return -1
 
+    """
+    Play a knight first if the robber is blocking one of the player's hexagons or the knight would win
+    largest army. Otherwise play road building if the player can build roads, year of plenty, monopoly
+    if the other players hold enough resources to make it worthwhile, and finally any other knight.
+    """
+    def chooseDevelopmentCard(self):
+        board = self.currentBoard
+        if self.developmentCards[DevelopmentDeck.KNIGHT] > 0:
+            knights = board.knightsPlayed[self.playerNum - 1] + 1
+            isBlocked = board.robberHex != -1 and board.hexYields[board.robberHex][self.playerNum - 1] > 0
+            winsArmy = (board.largestArmyOwner != self.playerNum and knights >= DevelopmentDeck.minimumArmySize
+                        and (board.largestArmyOwner == 0 or knights > board.knightsPlayed[board.largestArmyOwner - 1]))
+            if isBlocked or winsArmy:
+                return DevelopmentDeck.KNIGHT, []
+        if (self.developmentCards[DevelopmentDeck.ROAD_BUILDING] > 0 and len(board.roads[self.playerNum - 1]) < 14
+                and len(board.getPossibleRoadLocations(self.playerNum)) > 0):
+            return DevelopmentDeck.ROAD_BUILDING, []
+        if self.developmentCards[DevelopmentDeck.YEAR_OF_PLENTY] > 0:
+            return DevelopmentDeck.YEAR_OF_PLENTY, self.chooseYearOfPlentyResources()
+        if self.developmentCards[DevelopmentDeck.MONOPOLY] > 0:
+            opponentResources = sum(board.numResources) - board.numResources[self.playerNum - 1]
+            if opponentResources >= 2 * (self.numPlayers - 1):
+                return DevelopmentDeck.MONOPOLY, [self.resourcePoints.index(min(self.resourcePoints))]
+        if self.developmentCards[DevelopmentDeck.KNIGHT] > 0:
+            return DevelopmentDeck.KNIGHT, []
+        return None
+
+    """
+    Choose the 2 resources to take for year of plenty: the resources missing for a city, a settlement or
+    a road (the first of these that 2 resources complete), and otherwise the resources the player
+    collects the least of
+    """
+    def chooseYearOfPlentyResources(self):
+        scarcestResource = self.resourcePoints.index(min(self.resourcePoints))
+        for cost in (self.cityCost, self.settlementCost, self.roadCost):
+            missing = []
+            for i in range(len(cost)):
+                for _ in range(cost[i] - self.resources[i]):
+                    missing.append(i)
+            if len(missing) <= 2:
+                return missing + [scarcestResource] * (2 - len(missing))
+        return [scarcestResource, scarcestResource]
+
+    """ Choose the best location for a free road while incorporating a random factor, as placeRoad does """
+    def chooseFreeRoadLocation(self):
+        roadPoints = self.currentBoard.getPossibleRoadLocations(self.playerNum)
+        if len(roadPoints) == 0 or len(self.currentBoard.roads[self.playerNum - 1]) >= 15:
+            return None
+        roadIndex = -1
+        maxValue = -10
+        roadValues = self.getRoadValues(roadPoints)
+        for i in range(len(roadPoints)):
+            random = self.randomGenerator.randrange(20) / 10.0
+            roadValue = roadValues[i] + random
+            if roadValue > maxValue:
+                maxValue = roadValue
+                roadIndex = i
+        return roadPoints[roadIndex]
+
     """
     First build a city at a random legal location and repeat until no cities more can be built.
     Then build a settlement at a random legal location and repeat until no settlements more can be built.
+    Then buy a development card, if the player has the resources for one without trading.
     Then build a road at a random legal location and repeat until no more roads can be built.
     """
     def takeTurn(self, currentBoard):
@@ -621,6 +716,11 @@ class RandComp(Player):
             if len(settlementPoints) != 0:
                 settlementPoints.remove(settlementPoints[settlementIndex])
 
+        """ Buy a development card with the resources left over from building cities and settlements """
+        if (self.developmentDeck is not None and len(self.developmentDeck) > 0
+                and all(self.resources[i] >= self.developmentCardCost[i] for i in range(len(self.resources)))):
+            self.buyDevelopmentCard()
+
         while True:
             """ Find all the locations where the player could potentially build a road """
             roadPoints = self.currentBoard.getPossibleRoadLocations(self.playerNum)
@@ -636,7 +736,4 @@ class RandComp(Player):
             if len(roadPoints) != 0:
                 roadPoints.remove(roadPoints[roadIndex])
 
-        """ Set the board's number of resources for the player based on the player's actual resources """
-        self.currentBoard.numResources[self.playerNum - 1] = self.getTotalResources()
-
         return self.currentBoard
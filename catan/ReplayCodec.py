@@ -0,0 +1,175 @@
+"""
+Compact binary encoding of the actions in a recorded Settlers of Catan game. Every number is
+written as a varint (7 bits per byte, with the high bit set on every byte except the last), and
+numbers that can be negative are zigzag encoded first, so that intersection, edge, hexagon and
+resource ids, dice rolls and resource counts almost always take a single byte each. Dice rolls are
+the most common action, so each roll is written together with its action code in a single byte.
+
+Each action is a tuple whose first item is one of the action codes below, followed by its arguments:
+    (ROLL, roll)
+    (SETTLEMENT, vertex), (CITY, vertex), (ROAD, edge)
+    (TRADE, givenResource, receivedResource)
+    (DISCARD, playerNum, [discarded count of each resource])
+    (ROBBER, hexId, playerToRob, stolenResource)
+    (INITIAL_SETTLEMENT, playerNum, vertex), (INITIAL_ROAD, playerNum, edge)
+    (GAME_OVER, winner)
+    (BUY_CARD, cardType)
+    (PLAY_CARD, cardType, [arguments]), where the arguments are the edges of the free roads for road
+    building, the 2 resources taken for year of plenty, the resource taken for monopoly, or none for a
+    knight (whose robber move follows as a ROBBER action)
+Builds, trades, robber moves and development cards are made by the player whose turn it is.
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+
+class ReplayCodec:
+    """ Codes of each type of action. A dice roll is written as the code ROLL plus the number rolled. """
+    SETTLEMENT = 1
+    CITY = 2
+    ROAD = 3
+    TRADE = 4
+    DISCARD = 5
+    ROBBER = 6
+    INITIAL_SETTLEMENT = 7
+    INITIAL_ROAD = 8
+    GAME_OVER = 9
+    BUY_CARD = 10
+    PLAY_CARD = 11
+    ROLL = 16
+
+    """ Codes of each type of hexagon and port """
+    hexTypes = ["ore", "wheat", "sheep", "brick", "wood", "desert"]
+    portTypes = ["ore", "wheat", "sheep", "brick", "wood", "general"]
+
+    """ Append a non-negative integer to a bytearray as a varint """
+    @staticmethod
+    def writeVarint(buffer, value):
+        while value > 0x7F:
+            buffer.append((value & 0x7F) | 0x80)
+            value >>= 7
+        buffer.append(value)
+
+    """ Read a varint starting at an offset in the data, and return the integer and the offset after it """
+    @staticmethod
+    def readVarint(data, offset):
+        value = 0
+        shift = 0
+        while True:
+            byte = data[offset]
+            offset += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value, offset
+            shift += 7
+
+    """ Append an integer that may be negative to a bytearray, zigzag encoded so small magnitudes stay short """
+    @staticmethod
+    def writeSigned(buffer, value):
+        ReplayCodec.writeVarint(buffer, value * 2 if value >= 0 else -value * 2 - 1)
+
+    @staticmethod
+    def readSigned(data, offset):
+        value, offset = ReplayCodec.readVarint(data, offset)
+        if value & 1:
+            return -(value >> 1) - 1, offset
+        return value >> 1, offset
+
+    """ Append a list of non-negative integers, preceded by its length """
+    @staticmethod
+    def writeList(buffer, values):
+        ReplayCodec.writeVarint(buffer, len(values))
+        for value in values:
+            ReplayCodec.writeVarint(buffer, value)
+
+    @staticmethod
+    def readList(data, offset):
+        length, offset = ReplayCodec.readVarint(data, offset)
+        values = []
+        for _ in range(length):
+            value, offset = ReplayCodec.readVarint(data, offset)
+            values.append(value)
+        return values, offset
+
+    """ Append a string, encoded as UTF-8 and preceded by its length """
+    @staticmethod
+    def writeString(buffer, text):
+        encoded = text.encode("utf-8")
+        ReplayCodec.writeVarint(buffer, len(encoded))
+        buffer.extend(encoded)
+
+    @staticmethod
+    def readString(data, offset):
+        length, offset = ReplayCodec.readVarint(data, offset)
+        return bytes(data[offset:offset + length]).decode("utf-8"), offset + length
+
+    """ Append an action to a bytearray """
+    @staticmethod
+    def writeAction(buffer, action):
+        code = action[0]
+        if code == ReplayCodec.ROLL:
+            ReplayCodec.writeVarint(buffer, ReplayCodec.ROLL + action[1])
+            return
+        ReplayCodec.writeVarint(buffer, code)
+        match code:
+            case ReplayCodec.DISCARD:
+                """ Write a bit mask of the resources discarded, followed by the count of each of them """
+                ReplayCodec.writeVarint(buffer, action[1])
+                mask = 0
+                for i in range(len(action[2])):
+                    if action[2][i] != 0:
+                        mask |= 1 << i
+                ReplayCodec.writeVarint(buffer, mask)
+                for count in action[2]:
+                    if count != 0:
+                        ReplayCodec.writeVarint(buffer, count)
+            case ReplayCodec.ROBBER:
+                ReplayCodec.writeVarint(buffer, action[1])
+                ReplayCodec.writeVarint(buffer, action[2])
+                ReplayCodec.writeSigned(buffer, action[3])
+            case ReplayCodec.GAME_OVER:
+                ReplayCodec.writeSigned(buffer, action[1])
+            case ReplayCodec.PLAY_CARD:
+                ReplayCodec.writeVarint(buffer, action[1])
+                ReplayCodec.writeList(buffer, action[2])
+            case _:
+                for argument in action[1:]:
+                    ReplayCodec.writeVarint(buffer, argument)
+
+    """ Read the action starting at an offset in the data, and return the action and the offset after it """
+    @staticmethod
+    def readAction(data, offset):
+        code, offset = ReplayCodec.readVarint(data, offset)
+        if code >= ReplayCodec.ROLL:
+            return (ReplayCodec.ROLL, code - ReplayCodec.ROLL), offset
+        match code:
+            case ReplayCodec.SETTLEMENT | ReplayCodec.CITY | ReplayCodec.ROAD | ReplayCodec.BUY_CARD:
+                argument, offset = ReplayCodec.readVarint(data, offset)
+                return (code, argument), offset
+            case ReplayCodec.TRADE | ReplayCodec.INITIAL_SETTLEMENT | ReplayCodec.INITIAL_ROAD:
+                argument1, offset = ReplayCodec.readVarint(data, offset)
+                argument2, offset = ReplayCodec.readVarint(data, offset)
+                return (code, argument1, argument2), offset
+            case ReplayCodec.DISCARD:
+                playerNum, offset = ReplayCodec.readVarint(data, offset)
+                mask, offset = ReplayCodec.readVarint(data, offset)
+                discarded = [0, 0, 0, 0, 0]
+                for i in range(5):
+                    if (mask >> i) & 1:
+                        discarded[i], offset = ReplayCodec.readVarint(data, offset)
+                return (code, playerNum, discarded), offset
+            case ReplayCodec.ROBBER:
+                hexId, offset = ReplayCodec.readVarint(data, offset)
+                playerToRob, offset = ReplayCodec.readVarint(data, offset)
+                resource, offset = ReplayCodec.readSigned(data, offset)
+                return (code, hexId, playerToRob, resource), offset
+            case ReplayCodec.GAME_OVER:
+                winner, offset = ReplayCodec.readSigned(data, offset)
+                return (code, winner), offset
+            case ReplayCodec.PLAY_CARD:
+                cardType, offset = ReplayCodec.readVarint(data, offset)
+                arguments, offset = ReplayCodec.readList(data, offset)
+                return (code, cardType, arguments), offset
+            case _:
+                raise ValueError("Unknown replay action code " + str(code) + " at offset " + str(offset - 1))
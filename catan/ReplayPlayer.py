@@ -0,0 +1,40 @@
+"""
+An instance of the abstract Player class used to hold a player's resources, trade rates and score
+while a recorded game is replayed. Every decision a replayed player made is read from the recording,
+so this player type never makes decisions of its own and reports an error if it is asked to.
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+from catan.Player import Player
+
+class ReplayPlayer(Player):
+
+    """ Report an attempt to ask a replayed player for a decision """
+    def reportDecision(self, decision):
+        self.eventSink.error(self.currentBoard.turnNumber, self.playerNum, "Replayed player", self.playerNum,
+                             "cannot", decision)
+
+    def chooseInitialSettlementLocation(self, board):
+        self.reportDecision("choose an initial settlement location")
+        return -1
+
+    def chooseInitialRoadLocation(self, settleLocation):
+        self.reportDecision("choose an initial road location")
+        return -1
+
+    def discard(self):
+        self.reportDecision("choose resources to discard")
+
+    def getPlayerToRob(self):
+        self.reportDecision("choose a player to rob")
+        return -1
+
+    def getPointToBlock(self, playerToRob):
+        self.reportDecision("choose a hexagon to block")
+        return -1
+
+    def takeTurn(self, currentBoard):
+        self.reportDecision("take a turn")
+        return currentBoard
@@ -0,0 +1,240 @@
+"""
+The state of a recorded Settlers of Catan game at some point during the game: the board with every
+piece placed so far, and each player's resources, trade rates, development cards and score. Recorded
+actions are applied with the same Board and Player methods used while the game was played, and the whole
+state can be written to and restored from a keyframe, so that a replay can start from any keyframe
+instead of the beginning of the game. Used by the GameRecorder to write keyframes and by the Replayer to read them.
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+from catan import Board
+from catan import DevelopmentDeck
+from catan import Game
+from catan import LongestRoad
+from catan import NullSink
+from catan import ReplayPlayer
+from catan.ReplayCodec import ReplayCodec
+
+class ReplayState:
+
+    """
+    Set up an empty board with the recorded layout. Errors found while applying actions, which mean
+    the recording does not match the rules of the game, are reported to eventSink (ignored if not specified).
+    """
+    def __init__(self, numPlayers, hexTypes, numbers, portTypes, eventSink=None):
+        if eventSink is None:
+            eventSink = NullSink.NullSink()
+        self.numPlayers = numPlayers
+        self.board = Board.Board(numPlayers, eventSink=eventSink)
+        self.board.setTiles(hexTypes, numbers)
+        self.board.setPorts(portTypes)
+        self.topology = self.board.topology
+        self.playerColors = Game.Game.playerColors[:numPlayers]
+        self.players = []
+        for i in range(numPlayers):
+            player = ReplayPlayer.ReplayPlayer(i + 1, self.playerColors[i], "ReplayPlayer", numPlayers,
+                                               eventSink=eventSink)
+            player.currentBoard = self.board
+            self.players.append(player)
+
+        """
+        playerToMove is the next player to take a turn, and currentPlayer is the player whose turn is
+        in progress (0 between turns and during the initial placement)
+        """
+        self.playerToMove = 1
+        self.currentPlayer = 0
+
+        """ Numbers of the players whose scores include the points for longest road and largest army, as in Game """
+        self.longestRoadOwner = 0
+        self.largestArmyOwner = 0
+
+    """ The turn number of the game, which starts at 1 after the initial placement """
+    @property
+    def turnNumber(self):
+        return self.board.turnNumber
+
+    """ Apply a recorded action to the board and the players """
+    def applyAction(self, action):
+        match action[0]:
+            case ReplayCodec.ROLL:
+                self.endTurn()
+                self.startTurn(action[1])
+            case ReplayCodec.SETTLEMENT:
+                player = self.players[self.currentPlayer - 1]
+                for i in range(1, 5):
+                    player.resources[i] -= 1
+                self.placeSettlement(player, action[1], False)
+            case ReplayCodec.CITY:
+                player = self.players[self.currentPlayer - 1]
+                player.resources[0] -= 3
+                player.resources[1] -= 2
+                location = self.topology.vertices[action[1]]
+                self.board.addCity(location, player.color, player.playerNum, False)
+                player.updateResourcePoints(location)
+                player.score += 1
+            case ReplayCodec.ROAD:
+                player = self.players[self.currentPlayer - 1]
+                player.resources[3] -= 1
+                player.resources[4] -= 1
+                self.placeRoad(player, action[1], False)
+            case ReplayCodec.TRADE:
+                self.players[self.currentPlayer - 1].portResource(action[1], action[2])
+            case ReplayCodec.DISCARD:
+                player = self.players[action[1] - 1]
+                for i in range(5):
+                    player.resources[i] -= action[2][i]
+            case ReplayCodec.ROBBER:
+                self.board.setRobberLocation(self.topology.hexCenters[action[1]])
+                if action[3] != -1:
+                    self.players[self.currentPlayer - 1].gainResource(action[3])
+                    self.players[action[2] - 1].loseResource(action[3])
+            case ReplayCodec.INITIAL_SETTLEMENT:
+                player = self.players[action[1] - 1]
+                isSecondSettlement = len(self.board.settlements[player.playerNum - 1]) > 0
+                self.placeSettlement(player, action[2], True)
+
+                """ Collect resources based on tiles adjacent to the player's second settlement """
+                if isSecondSettlement:
+                    for tile in self.board.getAdjacentHexes(self.topology.vertices[action[2]]):
+                        player.addResource(tile.hexType)
+            case ReplayCodec.INITIAL_ROAD:
+                self.placeRoad(self.players[action[1] - 1], action[2], True)
+            case ReplayCodec.BUY_CARD:
+                player = self.players[self.currentPlayer - 1]
+                player.payCost(player.developmentCardCost)
+                player.gainDevelopmentCard(action[1])
+            case ReplayCodec.PLAY_CARD:
+                self.playDevelopmentCard(self.players[self.currentPlayer - 1], action[1], action[2])
+            case ReplayCodec.GAME_OVER:
+                self.board.winner = action[1]
+                self.endTurn()
+        self.updateHandSizes()
+
+    """ Record the number of resources and development cards each player holds on the board, as the Game does """
+    def updateHandSizes(self):
+        self.board.setHandSizes([sum(player.resources) for player in self.players],
+                                [sum(player.developmentCards) for player in self.players])
+
+    """ Finish the turn in progress, if any, and advance to the next player's turn """
+    def endTurn(self):
+        if self.currentPlayer == 0:
+            return
+        self.longestRoadOwner = Game.Game.moveAwardPoints(self.players, self.longestRoadOwner,
+                                                          self.board.longestRoadOwner, LongestRoad.LongestRoad.points)
+        self.largestArmyOwner = Game.Game.moveAwardPoints(self.players, self.largestArmyOwner,
+                                                          self.board.largestArmyOwner,
+                                                          DevelopmentDeck.DevelopmentDeck.largestArmyPoints)
+        self.currentPlayer = 0
+        if self.playerToMove == self.numPlayers:
+            self.playerToMove = 1
+            self.board.turnNumber += 1
+        else:
+            self.playerToMove += 1
+
+    """ Start the next player's turn with a dice roll, paying out the resources produced by the roll """
+    def startTurn(self, diceRoll):
+        self.currentPlayer = self.playerToMove
+        if diceRoll != 7:
+            for payout in self.board.getProduction(diceRoll):
+                for _ in range(payout[2]):
+                    self.players[payout[0] - 1].addResource(payout[1])
+
+    def placeSettlement(self, player, vertex, initialPlacement):
+        location = self.topology.vertices[vertex]
+        self.board.addSettlement(location, player.color, player.playerNum, initialPlacement)
+        newPortType = self.board.getPortType(location)
+        if newPortType != "":
+            player.gainPortPower(newPortType)
+        player.updateResourcePoints(location)
+        player.score += 1
+
+    """ Play a development card as the Game class does, except that a knight's robber move is its own action """
+    def playDevelopmentCard(self, player, cardType, arguments):
+        player.removeDevelopmentCard(cardType)
+        match cardType:
+            case DevelopmentDeck.DevelopmentDeck.KNIGHT:
+                self.board.addKnight(player.playerNum)
+            case DevelopmentDeck.DevelopmentDeck.ROAD_BUILDING:
+                for edge in arguments:
+                    self.placeRoad(player, edge, True)
+            case DevelopmentDeck.DevelopmentDeck.YEAR_OF_PLENTY:
+                for resourceIndex in arguments:
+                    player.gainResource(resourceIndex)
+            case DevelopmentDeck.DevelopmentDeck.MONOPOLY:
+                player.takeAllResources(arguments[0], self.players)
+
+    def placeRoad(self, player, edge, initialPlacement):
+        location = self.topology.edgePoints[edge]
+        self.board.addRoad(location.p1, location.p2, player.color, player.playerNum, initialPlacement)
+
+    """
+    Append a keyframe holding the whole state to a bytearray. Keyframes are only written between turns,
+    so the number of resources the board holds for each player is the total of the player's resources.
+    """
+    def writeKeyframe(self, buffer):
+        ReplayCodec.writeVarint(buffer, self.board.turnNumber)
+        ReplayCodec.writeVarint(buffer, self.playerToMove)
+        ReplayCodec.writeVarint(buffer, self.board.robberHex)
+        ReplayCodec.writeSigned(buffer, self.board.winner)
+        ReplayCodec.writeVarint(buffer, self.board.longestRoadOwner)
+        ReplayCodec.writeVarint(buffer, self.board.largestArmyOwner)
+        for player in self.players:
+            ReplayCodec.writeVarint(buffer, player.score)
+            ReplayCodec.writeList(buffer, player.developmentCards)
+            ReplayCodec.writeVarint(buffer, self.board.knightsPlayed[player.playerNum - 1])
+            for i in range(5):
+                ReplayCodec.writeSigned(buffer, player.resources[i])
+                ReplayCodec.writeVarint(buffer, player.tradeRates[i])
+                ReplayCodec.writeVarint(buffer, player.resourcePoints[i])
+
+            """ Pieces are written in the order they were placed, so the board's lists are restored exactly """
+            playerIndex = player.playerNum - 1
+            ReplayCodec.writeList(buffer, [self.topology.findVertex(settlement.location)
+                                           for settlement in self.board.settlements[playerIndex]])
+            ReplayCodec.writeList(buffer, [self.topology.findVertex(city.location)
+                                           for city in self.board.cities[playerIndex]])
+            ReplayCodec.writeList(buffer, [self.topology.findEdge(road.location1, road.location2)
+                                           for road in self.board.roads[playerIndex]])
+
+    """ Restore the state from a keyframe starting at an offset in the data, and return the offset after it """
+    def readKeyframe(self, data, offset):
+        self.board.turnNumber, offset = ReplayCodec.readVarint(data, offset)
+        self.playerToMove, offset = ReplayCodec.readVarint(data, offset)
+        self.currentPlayer = 0
+        robberHex, offset = ReplayCodec.readVarint(data, offset)
+        self.board.winner, offset = ReplayCodec.readSigned(data, offset)
+        self.longestRoadOwner, offset = ReplayCodec.readVarint(data, offset)
+        self.largestArmyOwner, offset = ReplayCodec.readVarint(data, offset)
+        for player in self.players:
+            player.score, offset = ReplayCodec.readVarint(data, offset)
+            developmentCards, offset = ReplayCodec.readList(data, offset)
+            player.developmentCards[:] = developmentCards
+            self.board.knightsPlayed[player.playerNum - 1], offset = ReplayCodec.readVarint(data, offset)
+            for i in range(5):
+                player.resources[i], offset = ReplayCodec.readSigned(data, offset)
+                player.tradeRates[i], offset = ReplayCodec.readVarint(data, offset)
+                player.resourcePoints[i], offset = ReplayCodec.readVarint(data, offset)
+            settlements, offset = ReplayCodec.readList(data, offset)
+            cities, offset = ReplayCodec.readList(data, offset)
+            roads, offset = ReplayCodec.readList(data, offset)
+
+            """ Place each city as a settlement and upgrade it, so the limit on settlements is never reached """
+            for vertex in cities:
+                self.board.addSettlement(self.topology.vertices[vertex], player.color, player.playerNum, True)
+                self.board.addCity(self.topology.vertices[vertex], player.color, player.playerNum, True)
+            for vertex in settlements:
+                self.board.addSettlement(self.topology.vertices[vertex], player.color, player.playerNum, True)
+            for edge in roads:
+                self.placeRoad(player, edge, True)
+        self.updateHandSizes()
+
+        """
+        Rebuilding the roads may award longest road to a different player than the recorded holder, who
+        could have kept it through a tie, so give it back to the recorded holder
+        """
+        self.board.setLongestRoadOwner(self.longestRoadOwner)
+        self.board.setLargestArmyOwner(self.largestArmyOwner)
+        self.board.setRobberLocation(self.topology.hexCenters[robberHex])
+        return offset
@@ -0,0 +1,106 @@
+"""
+Reads a replay written by the GameRecorder class and reconstructs the state of the recorded game at
+any turn. The state is restored from the nearest keyframe at or before the turn, and only the actions
+recorded after that keyframe are applied, so no player is asked for a decision and the game is never
+simulated again from the beginning.
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+from catan import GameRecorder
+from catan import ReplayState
+from catan.ReplayCodec import ReplayCodec
+
+class Replayer:
+
+    """ Read the header and the keyframe index of a replay, given as bytes """
+    def __init__(self, replay):
+        self.replay = replay
+        if replay[:len(GameRecorder.GameRecorder.magic)] != GameRecorder.GameRecorder.magic:
+            raise ValueError("Data is not a Catan replay")
+        offset = len(GameRecorder.GameRecorder.magic)
+        version, offset = ReplayCodec.readVarint(replay, offset)
+        if version != GameRecorder.GameRecorder.version:
+            raise ValueError("Unsupported Catan replay version " + str(version))
+
+        self.seed, offset = ReplayCodec.readSigned(replay, offset)
+        self.numPlayers, offset = ReplayCodec.readVarint(replay, offset)
+        self.playerTypes = []
+        for _ in range(self.numPlayers):
+            playerType, offset = ReplayCodec.readString(replay, offset)
+            self.playerTypes.append(playerType)
+        self.hexTypes = []
+        for _ in range(19):
+            hexType, offset = ReplayCodec.readVarint(replay, offset)
+            self.hexTypes.append(ReplayCodec.hexTypes[hexType])
+        self.numbers = []
+        for _ in range(19):
+            number, offset = ReplayCodec.readVarint(replay, offset)
+            self.numbers.append(number)
+        self.portTypes = []
+        for _ in range(9):
+            portType, offset = ReplayCodec.readVarint(replay, offset)
+            self.portTypes.append(ReplayCodec.portTypes[portType])
+        self.keyframeInterval, offset = ReplayCodec.readVarint(replay, offset)
+
+        """ Offsets of the first and last byte of the actions """
+        actionsLength, offset = ReplayCodec.readVarint(replay, offset)
+        self.actionsStart = offset
+        self.actionsEnd = offset + actionsLength
+        offset = self.actionsEnd
+
+        """ Turn number, offset of the next action, and offset of the state of each keyframe """
+        self.keyframes = []
+        numKeyframes, offset = ReplayCodec.readVarint(replay, offset)
+        for _ in range(numKeyframes):
+            turnNumber, offset = ReplayCodec.readVarint(replay, offset)
+            actionOffset, offset = ReplayCodec.readVarint(replay, offset)
+            keyframeLength, offset = ReplayCodec.readVarint(replay, offset)
+            self.keyframes.append((turnNumber, self.actionsStart + actionOffset, offset))
+            offset += keyframeLength
+
+    """ Read a replay from a file """
+    @staticmethod
+    def load(path):
+        with open(path, "rb") as replayFile:
+            return Replayer(replayFile.read())
+
+    """ Return a state holding only the layout of the board, before any piece is placed """
+    def getInitialState(self, eventSink=None):
+        return ReplayState.ReplayState(self.numPlayers, self.hexTypes, self.numbers, self.portTypes, eventSink)
+
+    """ Return every action in the replay, in the order they were made """
+    def getActions(self):
+        actions = []
+        offset = self.actionsStart
+        while offset < self.actionsEnd:
+            action, offset = ReplayCodec.readAction(self.replay, offset)
+            actions.append(action)
+        return actions
+
+    """
+    Return the state of the game at the start of a turn, before the first player rolls the dice.
+    Returns the state at the end of the game if the game ended before the turn.
+    """
+    def seek(self, turnNumber, eventSink=None):
+        state = self.getInitialState(eventSink)
+        offset = self.actionsStart
+
+        """ Restore the last keyframe at or before the turn """
+        for keyframe in reversed(self.keyframes):
+            if keyframe[0] <= turnNumber:
+                state.readKeyframe(self.replay, keyframe[2])
+                offset = keyframe[1]
+                break
+
+        """ Apply the actions after the keyframe until the first roll of the turn """
+        while offset < self.actionsEnd:
+            action, nextOffset = ReplayCodec.readAction(self.replay, offset)
+            if action[0] == ReplayCodec.ROLL:
+                state.endTurn()
+                if state.turnNumber >= turnNumber and state.playerToMove == 1:
+                    break
+            state.applyAction(action)
+            offset = nextOffset
+        return state
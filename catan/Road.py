@@ -1,5 +1,7 @@
 """
-Structure to hold the locations, color, and player number of each road on the Catan board
+Structure to hold the locations, color, and player number of each road on the Catan board.
+Roads are immutable and interned, so every road a player builds between the same locations
+is the same object. The id of a road combines the ids of its locations, regardless of their order.
 
 Created on Sep 2, 2022
 
@@ -7,9 +9,27 @@ Created on Sep 2, 2022
 """
 
 class Road:
+    __slots__ = ("location1", "location2", "color", "playerNum", "id")
 
-    def __init__(self, location1, location2, color, playerNum):
-        self.location1 = location1
-        self.location2 = location2
-        self.color = color
-        self.playerNum = playerNum
+    """ Every Road created so far, keyed by its locations, color and player number """
+    internedRoads = {}
+
+    def __new__(cls, location1, location2, color, playerNum):
+        key = (location1.id, location2.id, color, playerNum)
+        road = Road.internedRoads.get(key)
+        if road is None:
+            road = object.__new__(cls)
+            object.__setattr__(road, "location1", location1)
+            object.__setattr__(road, "location2", location2)
+            object.__setattr__(road, "color", color)
+            object.__setattr__(road, "playerNum", playerNum)
+            object.__setattr__(road, "id", min(location1.id, location2.id) * 1048576
+                               + max(location1.id, location2.id))
+            Road.internedRoads[key] = road
+        return road
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Road objects are immutable")
+
+    def __reduce__(self):
+        return Road, (self.location1, self.location2, self.color, self.playerNum)
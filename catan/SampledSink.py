@@ -0,0 +1,40 @@
+"""
+An instance of the abstract EventSink class that forwards every event for 1 in every sampleRate games
+to another sink, and only the final "gameOver" event for the rest. Games are chosen by their seed,
+so the same games are sampled every time a batch is run.
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+from catan.EventSink import EventSink
+
+class SampledSink(EventSink):
+
+    def __init__(self, sink, sampleRate):
+        self.sink = sink
+        self.sampleRate = sampleRate
+        self.isSampled = True
+
+    def startGame(self, seed):
+        self.isSampled = seed % self.sampleRate == 0
+        self.sink.startGame(seed)
+
+    def endGame(self):
+        self.sink.endGame()
+
+    def close(self):
+        self.sink.close()
+
+    """ Skip creating events for games that are not sampled, other than the final result of the game """
+    def emit(self, kind, turnNumber, playerNum, payload):
+        if self.isSampled or kind == "gameOver":
+            self.sink.emit(kind, turnNumber, playerNum, payload)
+
+    def error(self, turnNumber, playerNum, *messageParts):
+        if self.isSampled:
+            self.sink.error(turnNumber, playerNum, *messageParts)
+
+    def handleEvent(self, event):
+        if self.isSampled or event.kind == "gameOver":
+            self.sink.handleEvent(event)
@@ -0,0 +1,57 @@
+"""
+Structure to hold a node of the search tree built by the MctsComp player: the action that leads to the
+node, the actions from the node that have not been tried yet, the nodes reached by the actions that
+have been tried, and the number of visits and total value of the simulated games through the node.
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+import math
+
+class SearchNode:
+    __slots__ = ("action", "parent", "untriedActions", "children", "visits", "totalValue")
+
+    def __init__(self, action, parent, untriedActions):
+        self.action = action
+        self.parent = parent
+        self.untriedActions = untriedActions
+        self.children = []
+        self.visits = 0
+        self.totalValue = 0.0
+
+    def addChild(self, action, untriedActions):
+        child = SearchNode(action, self, untriedActions)
+        self.children.append(child)
+        return child
+
+    """
+    Return the child with the highest upper confidence bound (UCT), which balances the average value
+    of the child against how rarely it has been visited, weighted by explorationWeight
+    """
+    def selectChild(self, explorationWeight):
+        logVisits = math.log(self.visits)
+        bestChild = None
+        maxBound = -1.0
+        for child in self.children:
+            bound = child.totalValue / child.visits + explorationWeight * math.sqrt(logVisits / child.visits)
+            if bound > maxBound:
+                bestChild = child
+                maxBound = bound
+        return bestChild
+
+    """ Return the child that has been visited the most, which is the action the search recommends """
+    def getMostVisitedChild(self):
+        bestChild = self.children[0]
+        for child in self.children:
+            if child.visits > bestChild.visits:
+                bestChild = child
+        return bestChild
+
+    """ Add the value of a simulated game to this node and every node above it """
+    def backpropagate(self, value):
+        node = self
+        while node is not None:
+            node.visits += 1
+            node.totalValue += value
+            node = node.parent
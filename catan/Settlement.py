@@ -1,5 +1,7 @@
 """
-Structure to hold the location, color, and player number of each settlement on the Catan board
+Structure to hold the location, color, and player number of each settlement on the Catan board.
+Settlements are immutable and interned, so every settlement a player builds at the same location
+is the same object. The id of a settlement is the id of its location.
 
 Created on Sep 2, 2022
 
@@ -7,8 +9,25 @@ Created on Sep 2, 2022
 """
 
 class Settlement:
+    __slots__ = ("location", "color", "playerNum", "id")
 
-    def __init__(self, location, color, playerNum):
-        self.location = location
-        self.color = color
-        self.playerNum = playerNum
+    """ Every Settlement created so far, keyed by its location id, color and player number """
+    internedSettlements = {}
+
+    def __new__(cls, location, color, playerNum):
+        key = (location.id, color, playerNum)
+        settlement = Settlement.internedSettlements.get(key)
+        if settlement is None:
+            settlement = object.__new__(cls)
+            object.__setattr__(settlement, "location", location)
+            object.__setattr__(settlement, "color", color)
+            object.__setattr__(settlement, "playerNum", playerNum)
+            object.__setattr__(settlement, "id", location.id)
+            Settlement.internedSettlements[key] = settlement
+        return settlement
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Settlement objects are immutable")
+
+    def __reduce__(self):
+        return Settlement, (self.location, self.color, self.playerNum)
@@ -0,0 +1,332 @@
+"""
+A copy of the state of a Settlers of Catan game used by the MctsComp player to play out hypothetical
+futures: a clone of the board, plus the resources and trade rates of every player. The resources of
+other players are hidden, so they are guessed from the number of resources each player holds and the
+resources each player produces. Moves are made in place on the clone, and the rest of the game is
+played out quickly with a simple policy, either choosing every move at random or following the
+strategy of the RandComp player (cities first, then settlements, then roads, at the best locations).
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+from catan import Game
+from catan.Player import Player
+
+class Simulation:
+    """ Index of the resource produced by each type of hexagon """
+    resourceIndexes = {"ore": 0, "wheat": 1, "sheep": 2, "brick": 3, "wood": 4, "desert": -1}
+
+    def __init__(self, board, hands, tradeRates, playerToMove, pointsToWin, randomGenerator, vertexValues):
+        self.board = board
+        self.topology = board.topology
+        self.hands = hands
+        self.tradeRates = tradeRates
+        self.playerToMove = playerToMove
+        self.pointsToWin = pointsToWin
+        self.randomGenerator = randomGenerator
+
+        """ Number of ways to roll the numbers next to each intersection, used to compare locations """
+        self.vertexValues = vertexValues
+
+    """
+    Create a simulation of a game from a player's point of view. The player's own resources and trade
+    rates are known, and the resources of every other player are guessed at random.
+    """
+    @staticmethod
+    def fromBoard(board, player, playerToMove, pointsToWin, randomGenerator, vertexValues):
+        hands = []
+        tradeRates = []
+        for i in range(board.numPlayers):
+            if i == player.playerNum - 1:
+                hands.append(list(player.resources))
+                tradeRates.append(list(player.tradeRates))
+            else:
+                hands.append(Simulation.guessHand(board, i + 1, randomGenerator))
+                tradeRates.append(Simulation.getTradeRates(board, i + 1))
+        return Simulation(board.clone(diceRandomGenerator=randomGenerator), hands, tradeRates, playerToMove,
+                          pointsToWin, randomGenerator, vertexValues)
+
+    """
+    Guess the resources held by a player, choosing each of the player's resources at random
+    in proportion to how often the player collects it
+    """
+    @staticmethod
+    def guessHand(board, playerNum, randomGenerator):
+        weights = [1, 1, 1, 1, 1]
+        tiles = board.tiles
+        hexYields = board.hexYields
+        for hexId in range(len(tiles)):
+            resourceIndex = Simulation.resourceIndexes[tiles[hexId].hexType]
+            if resourceIndex != -1:
+                weights[resourceIndex] += hexYields[hexId][playerNum - 1] * tiles[hexId].value
+        hand = [0, 0, 0, 0, 0]
+        for resourceIndex in randomGenerator.choices(range(5), weights, k=max(0, board.numResources[playerNum - 1])):
+            hand[resourceIndex] += 1
+        return hand
+
+    """ Return the trade rates a player has from the ports next to its settlements and cities """
+    @staticmethod
+    def getTradeRates(board, playerNum):
+        tradeRates = [4, 4, 4, 4, 4]
+        vertexOwners = board.vertexOwners
+        vertexPortTypes = board.vertexPortTypes
+        for vertex in range(len(vertexOwners)):
+            if vertexOwners[vertex] == playerNum and vertexPortTypes[vertex] != "":
+                Simulation.gainPort(tradeRates, vertexPortTypes[vertex])
+        return tradeRates
+
+    @staticmethod
+    def gainPort(tradeRates, portType):
+        if portType == "general":
+            for i in range(len(tradeRates)):
+                tradeRates[i] = min(tradeRates[i], 3)
+        else:
+            tradeRates[Simulation.resourceIndexes[portType]] = 2
+
+    """
+    Return the (resource given, resource received) trades with ports or the bank needed to pay a cost,
+    trading away the resources with the most left over first, or None if the cost cannot be paid
+    """
+    @staticmethod
+    def getTrades(hand, tradeRates, cost):
+        hand = list(hand)
+        trades = []
+        for i in range(len(cost)):
+            while hand[i] < cost[i]:
+                bestResource = -1
+                mostLeftOver = -1
+                for j in range(len(hand)):
+                    leftOver = hand[j] - cost[j] - tradeRates[j]
+                    if leftOver >= 0 and leftOver > mostLeftOver:
+                        bestResource = j
+                        mostLeftOver = leftOver
+                if bestResource == -1:
+                    return None
+                hand[bestResource] -= tradeRates[bestResource]
+                hand[i] += 1
+                trades.append((bestResource, i))
+        return trades
+
+    """
+    Return every build a player could make next, as ("city", intersection), ("settlement", intersection)
+    or ("road", edge), including builds that need trades with ports or the bank first
+    """
+    def getBuildActions(self, playerNum):
+        return self.listBuildActions(self.board, playerNum, self.hands[playerNum - 1], self.tradeRates[playerNum - 1])
+
+    @staticmethod
+    def listBuildActions(board, playerNum, hand, tradeRates):
+        actions = []
+        if len(board.cities[playerNum - 1]) < 4 and Simulation.getTrades(hand, tradeRates, Player.cityCost) is not None:
+            for vertex in sorted(board.cityFrontiers[playerNum - 1]):
+                actions.append(("city", vertex))
+        if (len(board.settlements[playerNum - 1]) < 5
+                and Simulation.getTrades(hand, tradeRates, Player.settlementCost) is not None):
+            for vertex in sorted(board.settlementFrontiers[playerNum - 1]):
+                actions.append(("settlement", vertex))
+        if len(board.roads[playerNum - 1]) < 15 and Simulation.getTrades(hand, tradeRates, Player.roadCost) is not None:
+            for edge in sorted(board.roadFrontiers[playerNum - 1]):
+                actions.append(("road", edge))
+        return actions
+
+    """ Make a build returned by getBuildActions, trading and paying for it from the player's resources """
+    def applyBuild(self, playerNum, action):
+        hand = self.hands[playerNum - 1]
+        match action[0]:
+            case "city":
+                cost = Player.cityCost
+            case "settlement":
+                cost = Player.settlementCost
+            case _:
+                cost = Player.roadCost
+        for trade in self.getTrades(hand, self.tradeRates[playerNum - 1], cost):
+            hand[trade[0]] -= self.tradeRates[playerNum - 1][trade[0]]
+            hand[trade[1]] += 1
+        for i in range(len(cost)):
+            hand[i] -= cost[i]
+
+        color = Game.Game.playerColors[playerNum - 1]
+        match action[0]:
+            case "city":
+                self.board.applyCity(self.topology.vertices[action[1]], color, playerNum)
+            case "settlement":
+                self.board.applySettlement(self.topology.vertices[action[1]], color, playerNum)
+                if self.board.vertexPortTypes[action[1]] != "":
+                    self.gainPort(self.tradeRates[playerNum - 1], self.board.vertexPortTypes[action[1]])
+            case _:
+                edge = self.topology.edgePoints[action[1]]
+                self.board.applyRoad(edge.p1, edge.p2, color, playerNum)
+
+    """ Move the robber to a hexagon and steal a random resource from a player """
+    def applyRobber(self, playerNum, hexId, playerToRob):
+        self.board.applyRobber(self.topology.hexCenters[hexId])
+        victimHand = self.hands[playerToRob - 1]
+        if sum(victimHand) > 0:
+            resourceIndex = self.randomGenerator.choices(range(5), victimHand)[0]
+            victimHand[resourceIndex] -= 1
+            self.hands[playerNum - 1][resourceIndex] += 1
+
+    """ Place an initial settlement, collecting resources from the hexagons next to a player's second one """
+    def applyInitialSettlement(self, playerNum, vertex):
+        isSecondSettlement = len(self.board.settlements[playerNum - 1]) > 0
+        self.board.applySettlement(self.topology.vertices[vertex], Game.Game.playerColors[playerNum - 1], playerNum)
+        if self.board.vertexPortTypes[vertex] != "":
+            self.gainPort(self.tradeRates[playerNum - 1], self.board.vertexPortTypes[vertex])
+        if isSecondSettlement:
+            for hexId in self.topology.vertexHexes[vertex]:
+                resourceIndex = self.resourceIndexes[self.board.tiles[hexId].hexType]
+                if resourceIndex != -1:
+                    self.hands[playerNum - 1][resourceIndex] += 1
+
+    def applyInitialRoad(self, playerNum, edge):
+        edgePoints = self.topology.edgePoints[edge]
+        self.board.applyRoad(edgePoints.p1, edgePoints.p2, Game.Game.playerColors[playerNum - 1], playerNum)
+
+    """
+    Place the rest of the initial settlements and roads, in the order used by the Game class, after the
+    specified number of settlements have been placed. Every player chooses the best open location.
+    """
+    def finishInitialPlacement(self, numPlaced):
+        placementOrder = list(range(1, self.board.numPlayers + 1)) + list(range(self.board.numPlayers, 0, -1))
+        for playerNum in placementOrder[numPlaced:]:
+            vertex = self.chooseBest([vertex for vertex in range(len(self.topology.vertices))
+                                      if vertex not in self.board.blockedVertices], self.vertexValues)
+            self.applyInitialSettlement(playerNum, vertex)
+            self.applyInitialRoad(playerNum, self.chooseInitialRoad(vertex))
+        self.playerToMove = 1
+
+    """ Return the edge from an initial settlement that leads toward the best open intersection """
+    def chooseInitialRoad(self, vertex):
+        edges = [edge for edge in self.topology.vertexEdges[vertex] if self.board.edgeOwners[edge] == 0]
+        roadValues = {}
+        for edge in edges:
+            otherVertex = self.board.getOtherVertex(edge, vertex)
+            roadValues[edge] = max([self.vertexValues[neighbor]
+                                    for neighbor in self.topology.vertexNeighbors[otherVertex]
+                                    if neighbor not in self.board.blockedVertices], default=0)
+        return self.chooseBest(edges, roadValues)
+
+    """ Return the choice with the highest value, adding a random factor to each value as RandComp does """
+    def chooseBest(self, choices, values):
+        bestChoice = choices[0]
+        maxValue = -100
+        for choice in choices:
+            value = values[choice] + self.randomGenerator.random() * 2
+            if value > maxValue:
+                bestChoice = choice
+                maxValue = value
+        return bestChoice
+
+    """ Return the value of a possible road, based on the best open intersection it leads to """
+    def getRoadValue(self, playerNum, edge):
+        roadValue = 0
+        for vertex in self.topology.edges[edge]:
+            if vertex not in self.board.roadVertices[playerNum - 1] and vertex not in self.board.blockedVertices:
+                roadValue = max(roadValue, self.vertexValues[vertex])
+        return roadValue
+
+    """ Choose the next build for a player using the rollout policy, or return None to stop building """
+    def chooseBuild(self, playerNum, policy):
+        actions = self.getBuildActions(playerNum)
+        if len(actions) == 0:
+            return None
+        if policy == "random":
+            return actions[self.randomGenerator.randrange(len(actions))]
+
+        """ Build cities first, then settlements, then roads, as RandComp does """
+        for actionType in ("city", "settlement", "road"):
+            choices = [action for action in actions if action[0] == actionType]
+            if len(choices) > 0:
+                break
+        values = {}
+        for action in choices:
+            if actionType == "road":
+                values[action] = self.getRoadValue(playerNum, action[1])
+            else:
+                values[action] = self.vertexValues[action[1]]
+        return self.chooseBest(choices, values)
+
+    """ Make builds for the player whose turn it is until the policy stops, then end the turn """
+    def finishTurn(self, policy):
+        playerNum = self.playerToMove
+        for _ in range(20):
+            action = self.chooseBuild(playerNum, policy)
+            if action is None:
+                break
+            self.applyBuild(playerNum, action)
+        self.endTurn()
+
+    """ End the turn of the player whose turn it is, and check whether the player won """
+    def endTurn(self):
+        playerNum = self.playerToMove
+        self.board.numResources[playerNum - 1] = sum(self.hands[playerNum - 1])
+        if self.board.playerScores[playerNum - 1] >= self.pointsToWin:
+            self.board.winner = playerNum
+        if playerNum == self.board.numPlayers:
+            self.playerToMove = 1
+            self.board.turnNumber += 1
+        else:
+            self.playerToMove += 1
+
+    """ Roll the dice for the player whose turn it is, and pay out resources or move the robber """
+    def rollDice(self, policy):
+        diceRoll = self.randomGenerator.randrange(6) + self.randomGenerator.randrange(6) + 2
+        if diceRoll != 7:
+            for payout in self.board.getProduction(diceRoll):
+                resourceIndex = self.resourceIndexes[payout[1]]
+                self.hands[payout[0] - 1][resourceIndex] += payout[2]
+            return
+
+        """ Players with more than 7 resources discard half of them at random """
+        for hand in self.hands:
+            total = sum(hand)
+            if total > 7:
+                for _ in range(total // 2):
+                    resourceIndex = self.randomGenerator.choices(range(5), hand)[0]
+                    hand[resourceIndex] -= 1
+
+        """ Block the hexagon that costs opponents the most (or a random one), and rob a player next to it """
+        playerNum = self.playerToMove
+        hexValues = {}
+        for hexId in range(len(self.board.tiles)):
+            if hexId != self.board.robberHex:
+                opponentYield = sum(self.board.hexYields[hexId]) - self.board.hexYields[hexId][playerNum - 1]
+                hexValues[hexId] = opponentYield * self.board.tiles[hexId].value
+                if self.board.hexYields[hexId][playerNum - 1] > 0:
+                    hexValues[hexId] -= 20
+        if policy == "random":
+            hexId = self.randomGenerator.choice(list(hexValues))
+        else:
+            hexId = self.chooseBest(list(hexValues), hexValues)
+        victims = [i + 1 for i in range(self.board.numPlayers)
+                   if i != playerNum - 1 and self.board.hexYields[hexId][i] > 0 and sum(self.hands[i]) > 0]
+        if len(victims) > 0:
+            self.applyRobber(playerNum, hexId, self.randomGenerator.choice(victims))
+        else:
+            self.board.applyRobber(self.topology.hexCenters[hexId])
+
+    """ Play whole turns with the rollout policy until the number of turns is reached or a player wins """
+    def rollout(self, numTurns, policy):
+        for _ in range(numTurns):
+            if self.board.winner != -1:
+                return
+            self.rollDice(policy)
+            self.finishTurn(policy)
+
+    """
+    Return the value of the simulated position for a player between 0 (another player won) and 1 (the
+    player won). Otherwise the value is the player's share of every player's points plus production.
+    """
+    def evaluate(self, playerNum):
+        if self.board.winner != -1:
+            return 1.0 if self.board.winner == playerNum else 0.0
+        strengths = list(self.board.playerScores)
+        for hexId in range(len(self.board.tiles)):
+            if hexId != self.board.robberHex:
+                for i in range(self.board.numPlayers):
+                    strengths[i] += 0.05 * self.board.hexYields[hexId][i] * self.board.tiles[hexId].value
+        total = sum(strengths)
+        if total == 0:
+            return 1.0 / self.board.numPlayers
+        return strengths[playerNum - 1] / total
@@ -0,0 +1,155 @@
+"""
+Draws the state of a Settlers of Catan board as an SVG image without a screen, so that snapshots of many
+games can be saved for reports. The picture is drawn in 2 layers: a static layer with the tiles, the
+numbers and the ports, which only depends on the layout of the board, and a layer with the roads,
+settlements, cities and the robber. The static layer of each layout is drawn once and cached, and the
+picture of each piece is cached too (pieces are interned), so drawing another state of the same board
+only costs joining the pieces together.
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+from catan import QueryCache
+from catan import Topology
+import math
+
+class SvgRenderer:
+    """ Fill color of each type of hexagon """
+    tileColors = {"wood": "#2e7d32", "brick": "#c1622d", "ore": "#8d8d99", "sheep": "#9ccc65",
+                  "wheat": "#f2c94c", "desert": "#e8d8a8"}
+
+    """ Distance of each port from the middle of its 2 intersections, away from the center, in hexagon radii """
+    portDistance = 0.6
+
+    """
+    radius is the distance in pixels from the center of each hexagon to its corners.
+    Static layers are cached for the most recent maxLayouts layouts.
+    """
+    def __init__(self, radius=40, maxLayouts=64):
+        self.topology = Topology.Topology.getShared()
+        self.radius = radius
+
+        """ Pixel size of one lattice step in each direction, so that each hexagon is regular """
+        self.xUnit = radius / 2.0
+        self.yUnit = radius * math.sqrt(3) / 2.0
+
+        """ The board spans 16 lattice steps across and 10 steps down, with room around it for the ports """
+        self.centerX = 11 * self.xUnit
+        self.centerY = 7 * self.yUnit
+        self.header = ('<svg xmlns="http://www.w3.org/2000/svg" width="%d" height="%d" viewBox="0 0 %d %d">\n'
+                       % (2 * self.centerX, 2 * self.centerY, 2 * self.centerX, 2 * self.centerY))
+        self.staticLayers = QueryCache.QueryCache(maxLayouts)
+        self.pieceFragments = {}
+
+    """ Return the pixel coordinates of a lattice location """
+    def toPixel(self, x, y):
+        return self.centerX + x * self.xUnit, self.centerY + y * self.yUnit
+
+    """ Return an SVG image of the current state of a board """
+    def render(self, board):
+        parts = [self.header, self.getStaticLayer(board)]
+        for playerRoads in board.roads:
+            for road in playerRoads:
+                parts.append(self.getPieceFragment(road, self.drawRoad))
+        for playerSettlements in board.settlements:
+            for settlement in playerSettlements:
+                parts.append(self.getPieceFragment(settlement, self.drawSettlement))
+        for playerCities in board.cities:
+            for city in playerCities:
+                parts.append(self.getPieceFragment(city, self.drawCity))
+        if board.robberLocation is not None:
+            parts.append(self.drawRobber(board.robberLocation))
+        parts.append("</svg>\n")
+        return "".join(parts)
+
+    """ Write an SVG image of the current state of a board to a file """
+    def save(self, board, path):
+        with open(path, "w") as svgFile:
+            svgFile.write(self.render(board))
+
+    """ Return the static layer of a board, drawing it only the first time its layout is seen """
+    def getStaticLayer(self, board):
+        """
+        Hexagons and ports are interned, so the same layout always has the same tiles and ports, even
+        when it was created again (as it is for each board reconstructed from a replay)
+        """
+        return self.staticLayers.lookup((board.tiles, board.ports), self.drawStaticLayer, board)
+
+    """ Return the picture of a piece, drawing it only the first time the piece is seen """
+    def getPieceFragment(self, piece, draw):
+        fragment = self.pieceFragments.get(piece)
+        if fragment is None:
+            fragment = draw(piece)
+            self.pieceFragments[piece] = fragment
+        return fragment
+
+    """ Draw the sea, the tiles with their numbers, and the ports of a board """
+    def drawStaticLayer(self, board):
+        parts = ['<rect width="100%" height="100%" fill="#4a90c2"/>\n']
+        for tile in board.tiles:
+            corners = []
+            for offset in self.topology.perimeterOffsets:
+                corners.append("%.1f,%.1f" % self.toPixel(tile.location.x + offset[0], tile.location.y + offset[1]))
+            parts.append('<polygon points="%s" fill="%s" stroke="#5b4a2f" stroke-width="2"/>\n'
+                         % (" ".join(corners), SvgRenderer.tileColors.get(tile.hexType, "#ffffff")))
+            if tile.hexType != "desert":
+                x, y = self.toPixel(tile.location.x, tile.location.y)
+                textColor = "#c62828" if tile.number in (6, 8) else "#000000"
+                parts.append('<circle cx="%.1f" cy="%.1f" r="%.1f" fill="#fdf6e3" stroke="#000000"/>\n'
+                             % (x, y, self.radius * 0.3))
+                parts.append('<text x="%.1f" y="%.1f" font-size="%.1f" text-anchor="middle" dominant-baseline="central"'
+                             ' fill="%s">%d</text>\n' % (x, y, self.radius * 0.3, textColor, tile.number))
+
+        for port in board.ports:
+            p1 = port.portLocations.p1
+            p2 = port.portLocations.p2
+
+            """ Place the port beyond the middle of its intersections, away from the center of the board """
+            midX = (p1.x + p2.x) / 2.0 * self.xUnit
+            midY = (p1.y + p2.y) / 2.0 * self.yUnit
+            scale = 1 + SvgRenderer.portDistance * self.radius / math.hypot(midX, midY)
+            x = self.centerX + midX * scale
+            y = self.centerY + midY * scale
+            for location in (p1, p2):
+                x2, y2 = self.toPixel(location.x, location.y)
+                parts.append('<line x1="%.1f" y1="%.1f" x2="%.1f" y2="%.1f" stroke="#5b4a2f" stroke-width="3"/>\n'
+                             % (x, y, x2, y2))
+            if port.portType == "general":
+                label = "3:1"
+                fill = "#ffffff"
+            else:
+                label = "2:1"
+                fill = SvgRenderer.tileColors.get(port.portType, "#ffffff")
+            parts.append('<circle cx="%.1f" cy="%.1f" r="%.1f" fill="%s" stroke="#000000"/>\n'
+                         % (x, y, self.radius * 0.35, fill))
+            parts.append('<text x="%.1f" y="%.1f" font-size="%.1f" text-anchor="middle" dominant-baseline="central">'
+                         '%s</text>\n' % (x, y, self.radius * 0.25, label))
+        return "".join(parts)
+
+    """ Draw a road as a thick line along its edge """
+    def drawRoad(self, road):
+        x1, y1 = self.toPixel(road.location1.x, road.location1.y)
+        x2, y2 = self.toPixel(road.location2.x, road.location2.y)
+        return ('<line x1="%.1f" y1="%.1f" x2="%.1f" y2="%.1f" stroke="#000000" stroke-width="%.1f"/>\n'
+                '<line x1="%.1f" y1="%.1f" x2="%.1f" y2="%.1f" stroke="%s" stroke-width="%.1f"/>\n'
+                % (x1, y1, x2, y2, self.radius * 0.2, x1, y1, x2, y2, road.color, self.radius * 0.14))
+
+    """ Draw a settlement as a small square at its intersection """
+    def drawSettlement(self, settlement):
+        size = self.radius * 0.3
+        x, y = self.toPixel(settlement.location.x, settlement.location.y)
+        return ('<rect x="%.1f" y="%.1f" width="%.1f" height="%.1f" fill="%s" stroke="#000000"/>\n'
+                % (x - size / 2, y - size / 2, size, size, settlement.color))
+
+    """ Draw a city as a larger circle at its intersection """
+    def drawCity(self, city):
+        x, y = self.toPixel(city.location.x, city.location.y)
+        return ('<circle cx="%.1f" cy="%.1f" r="%.1f" fill="%s" stroke="#000000" stroke-width="2"/>\n'
+                % (x, y, self.radius * 0.25, city.color))
+
+    """ Draw the robber beside the number of the hexagon it blocks """
+    def drawRobber(self, location):
+        x, y = self.toPixel(location.x - 1, location.y)
+        return ('<circle cx="%.1f" cy="%.1f" r="%.1f" fill="#333333" stroke="#000000"/>\n'
+                % (x, y, self.radius * 0.18))
@@ -0,0 +1,171 @@
+"""
+Headless description of the layout of the Settlers of Catan board using only integers.
+Each hexagon is identified by its axial coordinates (q, r), with the third cube coordinate
+s = -q - r implied. Hexagon centers and intersections are stored on an integer lattice where
+x is measured in half hexagon widths and y is measured in hexagon half-heights, so locations
+can be compared exactly without any floating point tolerance. Every hexagon, intersection
+and edge has a stable integer id, and pixel coordinates are only derived when drawing.
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+from catan import DoublePoint
+from catan import Point
+
+class Topology:
+    """ The layout shared by every Board in this process, created the first time it is requested """
+    sharedTopology = None
+
+    def __init__(self):
+        """
+        Axial coordinates of each hexagon on the Catan board, starting at the top and moving
+        counter-clockwise toward the center. The index in this list is the id of the hexagon.
+        """
+        self.hexCoordinates = [(0, -2), (-1, -1), (-2, 0), (-2, 1), (-2, 2), (-1, 2), (0, 2), (1, 1), (2, 0),
+                               (2, -1), (2, -2), (1, -2), (0, -1), (-1, 0), (-1, 1), (0, 1), (1, 0), (1, -1),
+                               (0, 0)]
+
+        """
+        Lattice offsets from the center of a hexagon to each of its corners, which are also the
+        offsets from an intersection to each of its neighboring intersections and hexagons
+        """
+        self.cornerOffsets = [(2, 0), (-2, 0), (1, 1), (-1, 1), (1, -1), (-1, -1)]
+
+        """ Corners of a hexagon listed in order around its edge, used to find each edge of the board """
+        self.perimeterOffsets = [(2, 0), (1, 1), (-1, 1), (-2, 0), (-1, -1), (1, -1)]
+
+        """ Lattice coordinates of the 2 intersections next to each port, in a fixed order """
+        self.portCoordinates = [((-1, 5), (1, 5)), ((-4, 4), (-5, 3)), ((-8, 0), (-7, 1)), ((-8, -2), (-7, -3)),
+                                ((-4, -4), (-2, -4)), ((4, -4), (2, -4)), ((8, -2), (7, -3)), ((8, 0), (7, 1)),
+                                ((4, 4), (5, 3))]
+
+        """ hexIds and vertexIds map the id of a Point to the id of the hexagon or intersection at that Point """
+        self.hexCenters = []
+        self.hexIds = {}
+        self.vertices = []
+        self.vertexIds = {}
+        self.edges = []
+        self.edgeIds = {}
+
+        """ Assign the lattice location of the center of each hexagon """
+        for i in range(len(self.hexCoordinates)):
+            center = self.axialToLattice(self.hexCoordinates[i])
+            self.hexCenters.append(Point.Point(center[0], center[1]))
+            self.hexIds[self.hexCenters[i].id] = i
+
+        """ Assign a stable id to each intersection, sorted by lattice location """
+        corners = set()
+        for center in self.hexCenters:
+            for offset in self.cornerOffsets:
+                corners.add((center.x + offset[0], center.y + offset[1]))
+        for corner in sorted(corners):
+            self.vertices.append(Point.Point(corner[0], corner[1]))
+            self.vertexIds[self.vertices[-1].id] = len(self.vertices) - 1
+
+        """ Assign a stable id to each edge, sorted by the ids of the 2 intersections it connects """
+        edgeVertices = set()
+        for center in self.hexCenters:
+            for i in range(len(self.perimeterOffsets)):
+                offset1 = self.perimeterOffsets[i]
+                offset2 = self.perimeterOffsets[(i + 1) % len(self.perimeterOffsets)]
+                vertex1 = self.vertexIds[Point.Point.getId(center.x + offset1[0], center.y + offset1[1])]
+                vertex2 = self.vertexIds[Point.Point.getId(center.x + offset2[0], center.y + offset2[1])]
+                edgeVertices.add((min(vertex1, vertex2), max(vertex1, vertex2)))
+        for edge in sorted(edgeVertices):
+            self.edgeIds[edge] = len(self.edges)
+            self.edges.append(edge)
+
+        """
+        Precompute the adjacency tables of the board graph, indexed by intersection or hexagon id,
+        so that every adjacency query made during a game is a constant-time list lookup
+        """
+        self.vertexNeighbors = [self.getAdjacentVertices(vertex) for vertex in self.vertices]
+        self.vertexNeighborPoints = [[self.vertices[neighbor] for neighbor in neighbors]
+                                     for neighbors in self.vertexNeighbors]
+        self.vertexHexes = [self.getAdjacentHexes(vertex) for vertex in self.vertices]
+        self.hexVertices = [self.getAdjacentVertices(center) for center in self.hexCenters]
+        self.hexVertexPoints = [[self.vertices[vertex] for vertex in vertices] for vertices in self.hexVertices]
+        self.edgePoints = [DoublePoint.DoublePoint(self.vertices[edge[0]], self.vertices[edge[1]])
+                           for edge in self.edges]
+        self.vertexEdges = [[] for _ in self.vertices]
+        for i in range(len(self.edges)):
+            self.vertexEdges[self.edges[i][0]].append(i)
+            self.vertexEdges[self.edges[i][1]].append(i)
+
+        """
+        Bit masks of the board graph used by the BitBoard class: the neighbors of each intersection,
+        each intersection together with its neighbors, the edges of each intersection, and the 2
+        intersections of each edge
+        """
+        self.neighborMasks = [self.getMask(neighbors) for neighbors in self.vertexNeighbors]
+        self.closedNeighborMasks = [self.neighborMasks[i] | (1 << i) for i in range(len(self.vertices))]
+        self.vertexEdgeMasks = [self.getMask(edges) for edges in self.vertexEdges]
+        self.edgeVertexMasks = [self.getMask(edge) for edge in self.edges]
+
+        """ Index of the port next to each intersection, or -1 if the intersection is not next to a port """
+        self.vertexPorts = [-1] * len(self.vertices)
+        for i in range(len(self.portCoordinates)):
+            for corner in self.portCoordinates[i]:
+                self.vertexPorts[self.vertexIds[Point.Point.getId(corner[0], corner[1])]] = i
+
+    """ Return the layout shared by every Board in this process """
+    @staticmethod
+    def getShared():
+        if Topology.sharedTopology is None:
+            Topology.sharedTopology = Topology()
+        return Topology.sharedTopology
+
+    """ Return an integer with the bit set for each id in a list """
+    @staticmethod
+    def getMask(ids):
+        mask = 0
+        for i in ids:
+            mask |= 1 << i
+        return mask
+
+    """ Convert the axial coordinates of a hexagon to the lattice location of its center """
+    @staticmethod
+    def axialToLattice(axial):
+        return 3 * axial[0], axial[0] + 2 * axial[1]
+
+    """ Return the id of the hexagon centered at the specified location, or -1 if not found """
+    def findHex(self, point):
+        return self.hexIds.get(point.id, -1)
+
+    """ Return the id of the intersection at the specified location, or -1 if not found """
+    def findVertex(self, point):
+        return self.vertexIds.get(point.id, -1)
+
+    """ Return the id of the edge connecting the specified locations, or -1 if they are not connected """
+    def findEdge(self, point1, point2):
+        vertex1 = self.findVertex(point1)
+        vertex2 = self.findVertex(point2)
+        return self.edgeIds.get((min(vertex1, vertex2), max(vertex1, vertex2)), -1)
+
+    """
+    Return the ids of every intersection one edge away from the specified location. When the location
+    is the center of a hexagon, this returns the intersections at the corners of that hexagon.
+    Used to build the adjacency tables; queries during a game should use the tables instead.
+    """
+    def getAdjacentVertices(self, point):
+        adjacentVertices = []
+        for offset in self.cornerOffsets:
+            vertex = self.vertexIds.get(Point.Point.getId(point.x + offset[0], point.y + offset[1]), -1)
+            if vertex != -1:
+                adjacentVertices.append(vertex)
+        return adjacentVertices
+
+    """ Return the ids of every hexagon that has a corner at the specified location """
+    def getAdjacentHexes(self, point):
+        adjacentHexes = []
+        for offset in self.cornerOffsets:
+            hexId = self.hexIds.get(Point.Point.getId(point.x - offset[0], point.y - offset[1]), -1)
+            if hexId != -1:
+                adjacentHexes.append(hexId)
+        return adjacentHexes
+
+    """ Convert a lattice location to pixel coordinates on a board drawn with the specified dimensions """
+    @staticmethod
+    def toPixel(point, centerX, centerY, smallWidth, height):
+        return centerX + point.x * smallWidth, centerY + point.y * height
@@ -0,0 +1,237 @@
+"""
+Plays a round-robin tournament between registered player types, to compare AI variants with as few
+games as possible. Every pair of player types is compared with games on the same seeds played twice,
+with the seats of the two types swapped the second time, across a pool of worker processes. The Elo
+rating of each player type is updated after every game, and a comparison stops as soon as a sequential
+probability ratio test decides which of the two types is stronger with the configured confidence.
+Run from the root of the project, for example:
+python -m catan.Tournament --players RandComp,MctsComp --workers 8
+
+Created on Oct 17, 2026
+
+@author: Andrew Hubbard
+"""
+from catan import BatchRunner
+from argparse import ArgumentParser
+from itertools import combinations
+from math import log
+from multiprocessing import Pool
+from time import perf_counter
+import os
+
+class Tournament:
+    """ Rating of a player type before its first game, and the largest change of a rating after one game """
+    initialRating = 1500.0
+    kFactor = 16.0
+
+    """
+    numPlayers is the number of seats of each game, shared alternately by the two player types of a
+    comparison. The test of each comparison decides between the first player type being eloMargin Elo
+    stronger than the second (H1) and eloMargin Elo weaker (H0), with a false positive rate of alpha
+    and a false negative rate of beta. A comparison that is still undecided after maxGames games is
+    stopped as undecided. Each round plays batchSize seeds (2 games per seed) of every undecided
+    comparison, across numWorkers worker processes (1 plays every game in this process).
+    pointsToWin, maxTurns, boardPoolPath and useDevelopmentCards are passed to each game, as by the BatchRunner.
+    """
+    def __init__(self, numPlayers=4, pointsToWin=10, numWorkers=os.cpu_count(), maxTurns=1000, boardPoolPath=None,
+                 useDevelopmentCards=True, eloMargin=30.0, alpha=0.05, beta=0.05, maxGames=2000, batchSize=16):
+        self.numPlayers = numPlayers
+        self.pointsToWin = pointsToWin
+        self.numWorkers = numWorkers
+        self.maxTurns = maxTurns
+        self.boardPoolPath = boardPoolPath
+        self.useDevelopmentCards = useDevelopmentCards
+        self.eloMargin = eloMargin
+        self.lowerBound = log(beta / (1 - alpha))
+        self.upperBound = log((1 - beta) / alpha)
+        self.maxGames = maxGames
+        self.batchSize = batchSize
+
+        """ The registered player types, and the rating and number of games played of each one """
+        self.playerTypes = []
+        self.ratings = []
+        self.gamesPlayed = []
+
+        """
+        The results of each comparison, keyed by the indexes of its two player types: the wins, draws
+        (games without a winner) and losses of the first type, and the decision of the test, which is
+        1 if the first type is stronger, -1 if the second type is stronger, 0 if the comparison is
+        undecided after maxGames games, or None while it is still being played
+        """
+        self.results = {}
+        self.decisions = {}
+
+    """ Add a Player subclass to the tournament, reporting an error if a type with the same name was added """
+    def register(self, playerType):
+        if playerType.__name__ in [registered.__name__ for registered in self.playerTypes]:
+            raise ValueError("Player type " + playerType.__name__ + " is already registered")
+        self.playerTypes.append(playerType)
+        self.ratings.append(Tournament.initialRating)
+        self.gamesPlayed.append(0)
+
+    """
+    Return the player type of each seat of a game of a comparison: the first type takes the odd seats and
+    the second type the even seats, or the other way around if swapped is True
+    """
+    def getSeating(self, comparison, swapped):
+        first, second = comparison
+        if swapped:
+            first, second = second, first
+        return [self.playerTypes[first] if seat % 2 == 0 else self.playerTypes[second]
+                for seat in range(self.numPlayers)]
+
+    """
+    Return the log-likelihood ratio of H1 (the first player type is elo1 Elo stronger) over H0 (it is
+    elo0 Elo stronger), given its wins, draws and losses, using the normal approximation of the
+    generalized sequential probability ratio test. Until the first type has both won and lost a game,
+    the variance of its score is estimated as if it had also won and lost one more game.
+    """
+    @staticmethod
+    def getLogLikelihoodRatio(wins, draws, losses, elo0, elo1):
+        numGames = wins + draws + losses
+        if numGames == 0:
+            return 0.0
+        score = (wins + draws / 2) / numGames
+        if wins == 0 or losses == 0:
+            varianceWins, varianceLosses, varianceGames = wins + 1, losses + 1, numGames + 2
+        else:
+            varianceWins, varianceLosses, varianceGames = wins, losses, numGames
+        varianceScore = (varianceWins + draws / 2) / varianceGames
+        variance = (varianceWins * (1 - varianceScore) ** 2 + draws * (0.5 - varianceScore) ** 2
+                    + varianceLosses * varianceScore ** 2) / varianceGames
+        score0 = Tournament.getExpectedScore(elo0)
+        score1 = Tournament.getExpectedScore(elo1)
+        return (score1 - score0) * (2 * score - score0 - score1) * numGames / (2 * variance)
+
+    """ Return the expected score (1 for a win, 0.5 for a draw) of a player type rated eloDifference higher """
+    @staticmethod
+    def getExpectedScore(eloDifference):
+        return 1 / (1 + 10 ** (-eloDifference / 400))
+
+    """ Return the log-likelihood ratio of the test of a comparison, given the results of its games so far """
+    def getComparisonRatio(self, comparison):
+        wins, draws, losses = self.results[comparison]
+        return Tournament.getLogLikelihoodRatio(wins, draws, losses, -self.eloMargin, self.eloMargin)
+
+    """
+    Count the result of a game of a comparison (the winning seat, or -1 for no winner), update the ratings
+    of its player types, and decide the comparison if the test has reached one of its bounds
+    """
+    def addResult(self, comparison, swapped, winner):
+        if winner == -1:
+            score = 0.5
+        else:
+            score = 1.0 if ((winner - 1) % 2 == 0) != swapped else 0.0
+        first, second = comparison
+        counts = self.results[comparison]
+        counts[0 if score == 1.0 else 1 if score == 0.5 else 2] += 1
+        self.gamesPlayed[first] += 1
+        self.gamesPlayed[second] += 1
+
+        change = Tournament.kFactor * (score - Tournament.getExpectedScore(self.ratings[first] - self.ratings[second]))
+        self.ratings[first] += change
+        self.ratings[second] -= change
+
+        ratio = self.getComparisonRatio(comparison)
+        if ratio >= self.upperBound:
+            self.decisions[comparison] = 1
+        elif ratio <= self.lowerBound:
+            self.decisions[comparison] = -1
+        elif sum(counts) >= self.maxGames:
+            self.decisions[comparison] = 0
+
+    """
+    Play rounds of games of every undecided comparison until every comparison is decided, with the seeds of
+    each comparison counting up from firstSeed. The results of each round are counted in the order of their
+    seeds, and the results that follow the decision of a comparison are ignored, so the ratings and decisions
+    do not depend on the number of workers or the size of a round. Returns the total number of games played.
+    """
+    def run(self, firstSeed=0):
+        for comparison in combinations(range(len(self.playerTypes)), 2):
+            self.results[comparison] = [0, 0, 0]
+            self.decisions[comparison] = None
+        numGames = 0
+        nextSeed = firstSeed
+        pool = None
+        if self.numWorkers > 1:
+            pool = Pool(self.numWorkers, BatchRunner.BatchRunner.initWorker, (None, 1, True, self.boardPoolPath))
+        else:
+            BatchRunner.BatchRunner.initWorker(None, 1, False, self.boardPoolPath)
+        try:
+            while True:
+                undecided = [comparison for comparison in self.results if self.decisions[comparison] is None]
+                if len(undecided) == 0:
+                    break
+                schedule = [(comparison, swapped, seed) for comparison in undecided
+                            for seed in range(nextSeed, nextSeed + self.batchSize) for swapped in (False, True)]
+                allSettings = [(seed, self.getSeating(comparison, swapped), self.pointsToWin, self.maxTurns, None,
+                                self.useDevelopmentCards) for comparison, swapped, seed in schedule]
+                if pool is None:
+                    gameResults = [BatchRunner.BatchRunner.playGame(gameSettings) for gameSettings in allSettings]
+                else:
+                    chunkSize = max(1, len(allSettings) // (self.numWorkers * 4))
+                    gameResults = pool.map(BatchRunner.BatchRunner.playGame, allSettings, chunkSize)
+                numGames += len(gameResults)
+                for (comparison, swapped, seed), gameResult in zip(schedule, gameResults):
+                    if self.decisions[comparison] is None:
+                        self.addResult(comparison, swapped, gameResult.winner)
+                nextSeed += self.batchSize
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+        return numGames
+
+    """ Return the index of each player type, ordered from the highest rating to the lowest """
+    def getStandings(self):
+        return sorted(range(len(self.playerTypes)), key=lambda i: self.ratings[i], reverse=True)
+
+def main():
+    parser = ArgumentParser(description="Play a tournament between Settlers of Catan player types")
+    parser.add_argument("--players", default="RandComp,MctsComp", help="comma-separated player types to compare")
+    parser.add_argument("--seats", type=int, default=4, help="number of players in each game")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="number of worker processes")
+    parser.add_argument("--points", type=int, default=10, help="points needed to win a game")
+    parser.add_argument("--max-turns", type=int, default=1000, help="turn limit for games without a winner")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game of each comparison")
+    parser.add_argument("--elo-margin", type=float, default=30.0,
+                        help="Elo difference that each comparison decides the sign of")
+    parser.add_argument("--alpha", type=float, default=0.05, help="false positive rate of each comparison")
+    parser.add_argument("--beta", type=float, default=0.05, help="false negative rate of each comparison")
+    parser.add_argument("--max-games", type=int, default=2000, help="games after which a comparison is undecided")
+    parser.add_argument("--batch", type=int, default=16, help="seeds of each comparison played per round")
+    parser.add_argument("--board-pool", help="board pool file to draw the layout of every game from (shuffled if not "
+                                             "specified), written by catan.BoardGenerator")
+    parser.add_argument("--no-development-cards", action="store_true", help="play without development cards")
+    args = parser.parse_args()
+
+    tournament = Tournament(args.seats, args.points, args.workers, args.max_turns, args.board_pool,
+                            not args.no_development_cards, args.elo_margin, args.alpha, args.beta, args.max_games,
+                            args.batch)
+    for name in args.players.split(","):
+        tournament.register(BatchRunner.BatchRunner.getPlayerType(name))
+    startTime = perf_counter()
+    numGames = tournament.run(args.seed)
+    elapsed = perf_counter() - startTime
+
+    """ Print each comparison (wins, draws and losses of the first type), then the ratings and throughput """
+    for comparison, (wins, draws, losses) in tournament.results.items():
+        firstName = tournament.playerTypes[comparison[0]].__name__
+        secondName = tournament.playerTypes[comparison[1]].__name__
+        match tournament.decisions[comparison]:
+            case 1:
+                decision = firstName + " is stronger"
+            case -1:
+                decision = secondName + " is stronger"
+            case _:
+                decision = "undecided"
+        print(firstName, "vs", secondName + ":", wins, "wins,", draws, "draws,", losses, "losses, LLR %.2f," %
+              tournament.getComparisonRatio(comparison), decision)
+    for i in tournament.getStandings():
+        print(tournament.playerTypes[i].__name__, "rated %.0f after" % tournament.ratings[i],
+              tournament.gamesPlayed[i], "games")
+    print("Played", numGames, "games in %.2f seconds (%.1f games/second), of at most" % (elapsed, numGames / elapsed),
+          len(tournament.results) * args.max_games, "without early stopping")
+
+if __name__ == "__main__":
+    main()